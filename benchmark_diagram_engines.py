@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Benchmark the diagrams-library engine against direct DOT emission.
+
+Renders the example specifications from test_diagram_generation.py with
+both engines, checks that the PNGs are pixel-identical, and reports the
+best render time of each engine. Requires Graphviz (the dot executable).
+
+Usage:
+    python benchmark_diagram_engines.py [--repeat 5]
+"""
+
+import argparse
+import asyncio
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+sys.path.append('.')
+
+from PIL import Image, ImageChops
+
+from src.config.settings import settings
+from src.tools.diagram_generator import DiagramGenerator
+from test_diagram_generation import (
+    test_data_processing_pipeline,
+    test_kubernetes_microservices,
+    test_multi_cloud_architecture,
+)
+
+
+def time_engine(generator: DiagramGenerator, engine: str, spec, output_dir: Path, repeat: int):
+    """
+    Time one rendering engine on one specification.
+
+    Args:
+        generator: Generator providing icon mappings and styling
+        engine: Engine name ("diagrams" or "dot")
+        spec: Diagram specification
+        output_dir: Directory for rendered images
+        repeat: Number of timed runs
+
+    Returns:
+        Tuple of (best seconds, path of the rendered PNG)
+    """
+    output_path = output_dir / engine
+
+    best = float("inf")
+    with patch.object(settings, "diagram_engine", engine):
+        for _ in range(repeat):
+            start = time.perf_counter()
+            generator._generate_diagram_sync(spec, str(output_path))
+            best = min(best, time.perf_counter() - start)
+
+    return best, output_path.with_suffix(".png")
+
+
+def images_identical(first: Path, second: Path) -> bool:
+    """
+    Compare two PNGs pixel by pixel.
+
+    Args:
+        first: First image
+        second: Second image
+
+    Returns:
+        True if both images have the same size and pixels
+    """
+    with Image.open(first) as a, Image.open(second) as b:
+        if a.size != b.size:
+            return False
+        return ImageChops.difference(a.convert("RGBA"), b.convert("RGBA")).getbbox() is None
+
+
+async def load_specs():
+    """Build the example specifications of test_diagram_generation.py."""
+    return [
+        ("Multi-Cloud Architecture", await test_multi_cloud_architecture()),
+        ("Data Processing Pipeline", await test_data_processing_pipeline()),
+        ("Kubernetes Microservices", await test_kubernetes_microservices()),
+    ]
+
+
+def main() -> int:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per engine")
+    args = parser.parse_args()
+
+    if shutil.which("dot") is None:
+        print("❌ Graphviz 'dot' executable not found - install Graphviz to run this benchmark")
+        return 2
+
+    specs = asyncio.run(load_specs())
+    print()
+
+    all_identical = True
+    with tempfile.TemporaryDirectory() as tmp:
+        generator = DiagramGenerator(Path(tmp), {}, use_process_pool=False, use_cache=False)
+
+        for name, spec in specs:
+            spec_dir = Path(tmp) / spec.title.lower().replace(" ", "_")
+            spec_dir.mkdir()
+
+            diagrams_time, diagrams_png = time_engine(generator, "diagrams", spec, spec_dir, args.repeat)
+            dot_time, dot_png = time_engine(generator, "dot", spec, spec_dir, args.repeat)
+
+            identical = images_identical(diagrams_png, dot_png)
+            all_identical = all_identical and identical
+
+            print(f"📊 {name}: {len(spec.components)} components, {len(spec.connections)} connections")
+            print(f"   diagrams library: {diagrams_time * 1000:8.1f} ms")
+            print(f"   direct DOT:       {dot_time * 1000:8.1f} ms")
+            print(f"   Speedup: {diagrams_time / dot_time:.2f}x")
+            print(f"   {'✅' if identical else '❌'} Images identical: {identical}")
+
+    return 0 if all_identical else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
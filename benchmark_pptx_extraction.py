@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Benchmark the raw-XML PowerPoint extractor against the python-pptx path.
+
+Builds a synthetic deck (or uses the decks passed on the command line),
+checks that both engines produce identical ExtractedContent, and reports
+timings and peak Python memory for each engine.
+
+Usage:
+    python benchmark_pptx_extraction.py [--slides 150] [--repeat 5] [deck.pptx ...]
+"""
+
+import argparse
+import sys
+import time
+import tracemalloc
+from io import BytesIO
+from pathlib import Path
+
+sys.path.append('.')
+
+from pptx import Presentation
+from pptx.util import Inches
+
+from src.tools.document_processor import _iter_powerpoint_content_python_pptx
+from src.tools.pptx_xml_extractor import iter_pptx_xml_content
+
+
+def build_synthetic_deck(slide_count: int) -> bytes:
+    """
+    Build a deck mixing layouts, text boxes, line breaks, tables and groups.
+
+    Args:
+        slide_count: Number of slides to generate
+
+    Returns:
+        Raw .pptx bytes
+    """
+    prs = Presentation()
+
+    for i in range(1, slide_count + 1):
+        layout = prs.slide_layouts[i % 7]
+        slide = prs.slides.add_slide(layout)
+
+        if slide.shapes.title is not None:
+            slide.shapes.title.text = f"Section {i}: Cloud Data Platform"
+
+        for placeholder in slide.placeholders:
+            if placeholder.placeholder_format.idx != 0 and placeholder.has_text_frame:
+                placeholder.text_frame.text = "\n".join(
+                    f"Point {j} for slide {i}: migrate workloads to managed services"
+                    for j in range(6)
+                )
+
+        textbox = slide.shapes.add_textbox(Inches(1), Inches(5), Inches(6), Inches(1))
+        paragraph = textbox.text_frame.paragraphs[0]
+        paragraph.add_run().text = f"Footer note {i}"
+        paragraph.add_line_break()
+        paragraph.add_run().text = "Confidential"
+
+        if i % 5 == 0:
+            table = slide.shapes.add_table(3, 3, Inches(1), Inches(1), Inches(4), Inches(2)).table
+            table.cell(0, 0).text = "Table text is ignored by both engines"
+
+        if i % 7 == 0:
+            group = slide.shapes.add_group_shape()
+            group.shapes.add_textbox(Inches(1), Inches(1), Inches(2), Inches(1)).text = "Grouped"
+
+    buffer = BytesIO()
+    prs.save(buffer)
+    return buffer.getvalue()
+
+
+def time_engine(engine, data: bytes, repeat: int):
+    """
+    Time one extraction engine.
+
+    Args:
+        engine: Generator function taking (file_source, filename)
+        data: Raw .pptx bytes
+        repeat: Number of timed runs
+
+    Returns:
+        Tuple of (best seconds, peak traced bytes, extracted items)
+    """
+    items = list(engine(BytesIO(data), "benchmark.pptx"))
+
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        list(engine(BytesIO(data), "benchmark.pptx"))
+        best = min(best, time.perf_counter() - start)
+
+    tracemalloc.start()
+    list(engine(BytesIO(data), "benchmark.pptx"))
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return best, peak, items
+
+
+def main() -> int:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("decks", nargs="*", type=Path, help="Existing decks to benchmark")
+    parser.add_argument("--slides", type=int, default=150, help="Slides in the synthetic deck")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per engine")
+    args = parser.parse_args()
+
+    decks = [(deck.name, deck.read_bytes()) for deck in args.decks]
+    if not decks:
+        decks = [(f"synthetic ({args.slides} slides)", build_synthetic_deck(args.slides))]
+
+    all_identical = True
+    for name, data in decks:
+        pptx_time, pptx_peak, pptx_items = time_engine(
+            _iter_powerpoint_content_python_pptx, data, args.repeat
+        )
+        xml_time, xml_peak, xml_items = time_engine(iter_pptx_xml_content, data, args.repeat)
+
+        identical = pptx_items == xml_items
+        all_identical = all_identical and identical
+
+        print(f"📊 {name}: {len(pptx_items)} slides extracted")
+        print(f"   python-pptx: {pptx_time * 1000:8.1f} ms  peak {pptx_peak / 1024 / 1024:6.1f} MB")
+        print(f"   raw XML:     {xml_time * 1000:8.1f} ms  peak {xml_peak / 1024 / 1024:6.1f} MB")
+        print(f"   Speedup: {pptx_time / xml_time:.1f}x")
+        print(f"   {'✅' if identical else '❌'} Output identical: {identical}")
+
+    return 0 if all_identical else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+Benchmark multi-pass against single-pass presentation assembly.
+
+The multi-pass flow is the former build sequence: validate the template,
+create and save the deck, reload it to set core properties, and reload it
+again to insert diagram slides. The single-pass flow is
+PresentationBuilder.build_presentation, which keeps one Presentation in
+memory and saves it once; it is measured with and without the
+process-wide template cache. Each run reports wall time and the package
+bytes parsed from disk and written.
+
+Usage:
+    python benchmark_presentation_build.py [--template path/to/template.pptx] [--slides 12] [--repeat 5]
+"""
+
+import argparse
+import asyncio
+import sys
+import tempfile
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+sys.path.append('.')
+
+import pptx
+from PIL import Image
+from pptx.presentation import Presentation as PresentationObject
+
+from src.config.settings import settings
+from src.models.data_models import (
+    ContentGenerationResult,
+    DiagramComponent,
+    DiagramSpec,
+    GeneratedDiagram,
+    GeneratedSlide,
+    PresentationSpec,
+    ProjectDescription,
+)
+from src.tools.presentation_builder import PresentationBuilder
+
+
+class IOCounter:
+    """Count presentation parses and saves with the bytes they touch."""
+
+    def __init__(self) -> None:
+        self.parsed_bytes = 0
+        self.written_bytes = 0
+
+    def __enter__(self) -> "IOCounter":
+        open_presentation = pptx.Presentation
+        save_presentation = PresentationObject.save
+
+        def counting_open(pptx_file=None):
+            if pptx_file is not None and not hasattr(pptx_file, "read"):
+                self.parsed_bytes += Path(pptx_file).stat().st_size
+            return open_presentation(pptx_file)
+
+        def counting_save(presentation, file):
+            save_presentation(presentation, file)
+            if not hasattr(file, "write"):
+                self.written_bytes += Path(file).stat().st_size
+
+        self._patches = [
+            patch("pptx.Presentation", counting_open),
+            patch("src.tools.template_manager.Presentation", counting_open),
+            patch.object(PresentationObject, "save", counting_save),
+        ]
+        for active in self._patches:
+            active.start()
+        return self
+
+    def __exit__(self, *args) -> None:
+        for active in self._patches:
+            active.stop()
+
+
+def build_inputs(tmp: Path, slide_count: int):
+    """
+    Create the project, slides and diagrams used by both flows.
+
+    Args:
+        tmp: Scratch directory
+        slide_count: Number of content slides
+
+    Returns:
+        Tuple of (project, generation result, diagrams)
+    """
+    project = ProjectDescription(
+        description="Modernize the data platform with a cloud-native lakehouse and streaming ingestion",
+        client_name="Benchmark Client",
+        key_technologies=["AWS", "Python", "Kafka"]
+    )
+    slides = [
+        GeneratedSlide(
+            title=f"Slide {index + 1}",
+            content=[f"Point {point + 1} of slide {index + 1}" for point in range(5)],
+            layout_type="title" if index == 0 else "bullet",
+            notes=f"Speaker notes for slide {index + 1}"
+        )
+        for index in range(slide_count)
+    ]
+
+    diagrams = []
+    for index in range(2):
+        image_path = tmp / f"diagram_{index}.png"
+        Image.new("RGB", (1600, 1000), "white").save(image_path)
+        spec = DiagramSpec(
+            diagram_type="microservices",
+            title=f"Architecture {index + 1}",
+            components=[
+                DiagramComponent(name="API", component_type="api", icon_provider="aws", icon_name="APIGateway"),
+                DiagramComponent(name="Service", component_type="service", icon_provider="aws", icon_name="Lambda"),
+            ]
+        )
+        diagrams.append(GeneratedDiagram(
+            spec=spec, image_path=image_path, file_size_kb=image_path.stat().st_size // 1024,
+            generation_time_ms=0, slide_target=2,
+            position={"left": 0.5, "top": 1.5, "width": 9.0, "height": 5.5}
+        ))
+
+    return project, ContentGenerationResult(slides=slides, confidence_score=0.9), diagrams
+
+
+async def multi_pass(builder: PresentationBuilder, template: Path, output: Path, project, result, diagrams) -> None:
+    """Run the former validate / create / reload / reload build sequence."""
+    manager = builder.template_manager
+    manager.validate_template(template)
+    spec = PresentationSpec(project=project, slides=result.slides, template_path=template, output_path=output)
+    manager.create_presentation_from_spec(spec)
+
+    presentation = pptx.Presentation(str(output))
+    builder._set_presentation_properties(presentation, project, result)
+    presentation.save(str(output))
+
+    await builder.insert_diagrams_into_presentation(output, diagrams)
+
+
+async def single_pass(builder: PresentationBuilder, template: Path, output: Path, project, result, diagrams) -> None:
+    """Run the single-pass build."""
+    await builder.build_presentation(project, result, output.name, template_path=template, diagrams=diagrams)
+
+
+async def measure(flow, template: Path, tmp: Path, inputs, repeat: int, template_cache: bool):
+    """
+    Time a build flow.
+
+    Returns:
+        Tuple of (best seconds, parsed bytes per build, written bytes per build)
+    """
+    best = float("inf")
+    counter = IOCounter()
+    cache_setting = patch.object(settings, "template_cache_enabled", template_cache)
+    with cache_setting, patch.object(settings, "output_dir", tmp):
+        # Untimed warm-up build (lazy imports, OS file cache, template cache)
+        await flow(PresentationBuilder(template), template, tmp / "deck.pptx", *inputs)
+
+    with counter, cache_setting, patch.object(settings, "output_dir", tmp):
+        for _ in range(repeat):
+            builder = PresentationBuilder(template)
+            start = time.perf_counter()
+            await flow(builder, template, tmp / "deck.pptx", *inputs)
+            best = min(best, time.perf_counter() - start)
+
+    return best, counter.parsed_bytes // repeat, counter.written_bytes // repeat
+
+
+async def run(args) -> int:
+    """Run the benchmark."""
+    with tempfile.TemporaryDirectory() as tmp_name:
+        tmp = Path(tmp_name)
+        template = Path(args.template) if args.template else tmp / "default_template.pptx"
+        if not args.template:
+            pptx.Presentation().save(str(template))
+
+        inputs = build_inputs(tmp, args.slides)
+
+        print(f"📊 {args.slides} slides + {len(inputs[2])} diagrams, template {template.name}")
+        results = {}
+        flows = (
+            ("multi-pass", multi_pass, False),
+            ("single-pass", single_pass, False),
+            ("single-pass + template cache", single_pass, True),
+        )
+        for name, flow, template_cache in flows:
+            seconds, parsed, written = await measure(flow, template, tmp, inputs, args.repeat, template_cache)
+            results[name] = seconds
+            print(
+                f"   {name:30s} {seconds * 1000:8.1f} ms   "
+                f"parsed {parsed / 1024:8.1f} KB   written {written / 1024:8.1f} KB"
+            )
+
+        for name in ("single-pass", "single-pass + template cache"):
+            print(f"   Speedup of {name}: {results['multi-pass'] / results[name]:.2f}x")
+    return 0
+
+
+def main() -> int:
+    """Parse arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--template", help="Template to build from (default: python-pptx default template)")
+    parser.add_argument("--slides", type=int, default=12, help="Number of content slides")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed builds per flow")
+    return asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Measure the startup cost of importing the diagram generator.
+
+Each measurement runs in a fresh interpreter so nothing is cached in
+sys.modules. "lazy" times the plain module import; "eager" additionally
+resolves every provider class of the lazy registry, which is what the
+module used to do at import time.
+
+Usage:
+    python measure_diagram_import_time.py [--repeat 5]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+LAZY_SNIPPET = """
+import time
+start = time.perf_counter()
+import src.tools.diagram_generator
+print(time.perf_counter() - start)
+"""
+
+EAGER_SNIPPET = """
+import time
+start = time.perf_counter()
+import src.tools.diagram_generator as module
+for name in module._LAZY_CLASSES:
+    getattr(module, name)
+print(time.perf_counter() - start)
+"""
+
+
+def time_snippet(snippet: str) -> float:
+    """
+    Run a timing snippet in a fresh interpreter.
+
+    Args:
+        snippet: Python source printing the elapsed seconds as its last line
+
+    Returns:
+        Elapsed seconds reported by the snippet
+    """
+    env = {**os.environ, "OPENAI_API_KEY": os.environ.get("OPENAI_API_KEY", "sk-measure")}
+    result = subprocess.run(
+        [sys.executable, "-c", snippet],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+        env=env
+    )
+    return float(result.stdout.strip().splitlines()[-1])
+
+
+def main() -> int:
+    """Run the measurement."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=5, help="Fresh interpreters per variant")
+    args = parser.parse_args()
+
+    # Import settings and other shared dependencies once to warm the OS file cache
+    time_snippet(LAZY_SNIPPET)
+
+    lazy = [time_snippet(LAZY_SNIPPET) for _ in range(args.repeat)]
+    eager = [time_snippet(EAGER_SNIPPET) for _ in range(args.repeat)]
+
+    lazy_ms = statistics.median(lazy) * 1000
+    eager_ms = statistics.median(eager) * 1000
+
+    print(f"📊 Import time of src.tools.diagram_generator (median of {args.repeat} runs)")
+    print(f"   lazy registry:           {lazy_ms:8.1f} ms")
+    print(f"   all classes resolved:    {eager_ms:8.1f} ms")
+    print(f"   Startup savings:         {eager_ms - lazy_ms:8.1f} ms")
+    print("   Tip: python -X importtime -c 'import src.tools.diagram_generator' for a per-module breakdown")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -20,6 +20,7 @@ from ..models.data_models import (
     ProjectAnalysisResult,
     ProjectDescription,
 )
+from ..tools.llm_cache import build_llm_chain
 
 logger = logging.getLogger(__name__)
 
@@ -52,8 +53,10 @@ class ContentGenerationChain:
             template=self._get_generation_template()
         )
         
-        # Create chain using RunnableSequence (modern LangChain pattern)
-        self.chain = self.generation_prompt | self.llm
+        # Create chain using RunnableSequence (modern LangChain pattern), cached if enabled
+        self.chain = build_llm_chain(
+            self.generation_prompt, self.llm, "content_generation", validate=self._is_parseable
+        )
 
     def _get_generation_template(self) -> str:
         """
@@ -319,6 +322,20 @@ JSON OUTPUT:
             logger.error(f"Failed to parse generation JSON: {e}")
             return {"slides": [], "presentation_metadata": {"error": str(e)}}
 
+    def _is_parseable(self, result_text: str) -> bool:
+        """
+        Check whether an LLM response parses into at least one slide.
+
+        Used by the LLM cache so unusable responses are retried, not replayed.
+
+        Args:
+            result_text: Raw text result from LLM
+
+        Returns:
+            True if the response is valid generation JSON with slides
+        """
+        return bool(self._parse_generation_result(result_text)["slides"])
+
     def _calculate_confidence_score(
         self,
         slides: List[GeneratedSlide],
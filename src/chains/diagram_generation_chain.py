@@ -6,10 +6,11 @@ and document analysis results, then creates actual diagrams using the
 diagram generator tool.
 """
 
+import asyncio
 import json
 import logging
 import time
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
 
 from langchain.prompts import PromptTemplate
 from langchain_openai import ChatOpenAI
@@ -25,8 +26,10 @@ from ..models.data_models import (
     ProjectAnalysisResult,
     ProjectDescription,
 )
-from ..tools.diagram_generator import DiagramGenerator
+from ..tools.diagram_generator import DiagramGenerator, get_render_pool_stats
 from ..tools.diagram_styler import DiagramStyler
+from ..tools.llm_cache import build_llm_chain
+from ..tools.render_workers import RenderTimeoutError
 
 logger = logging.getLogger(__name__)
 
@@ -60,8 +63,10 @@ class DiagramGenerationChain:
             template=self._get_diagram_template()
         )
         
-        # Create chain using modern LangChain pattern
-        self.chain = self.diagram_prompt | self.llm
+        # Create chain using modern LangChain pattern, cached if enabled
+        self.chain = build_llm_chain(
+            self.diagram_prompt, self.llm, "diagram_generation", validate=self._is_parseable
+        )
         
         # Initialize diagram tools
         self.diagram_generator = DiagramGenerator(
@@ -250,21 +255,7 @@ OUTPUT JSON ONLY:
             spec_data = self._parse_diagram_specifications(result_content)
             
             # Generate actual diagrams
-            generated_diagrams = []
-            for diagram_spec_data in spec_data.get("diagrams", []):
-                try:
-                    # Create diagram specification
-                    diagram_spec = self._create_diagram_spec(diagram_spec_data)
-                    
-                    # Generate the actual diagram image
-                    generated_diagram = await self.diagram_generator.generate_diagram(diagram_spec)
-                    generated_diagrams.append(generated_diagram)
-                    
-                    logger.info(f"Successfully generated diagram: {diagram_spec.title}")
-                    
-                except Exception as e:
-                    logger.error(f"Failed to generate diagram: {e}")
-                    continue
+            generated_diagrams, timed_out = await self._render_diagrams(spec_data.get("diagrams", []))
             
             # Calculate total processing time
             total_time = int(time.time() * 1000 - start_time)
@@ -285,6 +276,9 @@ OUTPUT JSON ONLY:
                     "complexity_level": analysis_metadata.get("complexity_level", "medium"),
                     "technical_confidence": analysis_metadata.get("technical_confidence", 0.5),
                     "recommended_slides": analysis_metadata.get("recommended_slides", []),
+                    "cached_diagrams": sum(1 for diagram in generated_diagrams if diagram.cached),
+                    "timed_out_diagrams": timed_out,
+                    "render_timeout_s": settings.diagram_generation_timeout,
                     "source": "ai_generated",
                     "model": settings.openai_model
                 }
@@ -310,6 +304,48 @@ OUTPUT JSON ONLY:
                 metadata={"error": error_msg}
             )
 
+    async def _render_diagrams(
+        self,
+        diagram_data: List[Dict[str, Any]]
+    ) -> Tuple[List[GeneratedDiagram], List[str]]:
+        """
+        Render all diagram specifications concurrently.
+
+        Args:
+            diagram_data: Parsed diagram specification dictionaries
+
+        Returns:
+            Tuple of (successfully generated diagrams in specification order,
+            titles of diagrams whose rendering timed out)
+        """
+        diagram_specs = []
+        for diagram_spec_data in diagram_data:
+            try:
+                diagram_specs.append(self._create_diagram_spec(diagram_spec_data))
+            except Exception as e:
+                logger.error(f"Failed to create diagram specification: {e}")
+
+        # PATTERN: Render all diagrams at once; the render pool bounds parallelism
+        # and a failing diagram does not affect the others
+        outcomes = await asyncio.gather(
+            *(self.diagram_generator.generate_diagram(spec) for spec in diagram_specs),
+            return_exceptions=True
+        )
+
+        generated_diagrams = []
+        timed_out = []
+        for diagram_spec, outcome in zip(diagram_specs, outcomes):
+            if isinstance(outcome, RenderTimeoutError):
+                timed_out.append(diagram_spec.title)
+                continue
+            if isinstance(outcome, Exception):
+                logger.error(f"Failed to generate diagram {diagram_spec.title}: {outcome}")
+                continue
+            generated_diagrams.append(outcome)
+            logger.info(f"Successfully generated diagram: {diagram_spec.title}")
+
+        return generated_diagrams, timed_out
+
     def _summarize_project_analysis(self, analysis: ProjectAnalysisResult) -> str:
         """
         Create a summary of project analysis for the prompt.
@@ -405,6 +441,20 @@ OUTPUT JSON ONLY:
             logger.error(f"Failed to parse diagram specification JSON: {e}")
             return {"diagrams": [], "analysis_metadata": {"error": str(e)}}
 
+    def _is_parseable(self, result_text: str) -> bool:
+        """
+        Check whether an LLM response parses into diagram specifications.
+
+        Used by the LLM cache so unparseable responses are retried, not replayed.
+
+        Args:
+            result_text: Raw text result from LLM
+
+        Returns:
+            True if the response is valid diagram specification JSON
+        """
+        return "error" not in self._parse_diagram_specifications(result_text)["analysis_metadata"]
+
     def _validate_diagram_spec(self, diagram: Dict[str, Any]) -> bool:
         """
         Validate diagram specification structure.
@@ -543,7 +593,7 @@ OUTPUT JSON ONLY:
         """Clean up diagram generation resources."""
         try:
             # Clean up old diagram files
-            await self.diagram_generator.cleanup_old_diagrams(max_age_hours=24)
+            await self.diagram_generator.cleanup_old_diagrams()
             logger.info("Diagram generation resources cleaned up")
         except Exception as e:
             logger.error(f"Error cleaning up diagram resources: {e}")
@@ -561,7 +611,9 @@ OUTPUT JSON ONLY:
             "max_components": settings.max_diagram_components,
             "output_directory": str(settings.diagram_output_dir),
             "generation_enabled": settings.enable_diagram_generation,
-            "cache_enabled": settings.diagram_cache_enabled
+            "cache_enabled": settings.diagram_cache_enabled,
+            "render_cache": self.diagram_generator.get_cache_stats(),
+            "render_workers": get_render_pool_stats()
         }
 
 
@@ -5,9 +5,10 @@ This module analyzes extracted content from uploaded documents to identify
 key themes, technologies, and approaches relevant to the project requirements.
 """
 
+import asyncio
 import json
 import logging
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Tuple
 
 from langchain.prompts import PromptTemplate
 from langchain_openai import ChatOpenAI
@@ -15,9 +16,26 @@ from pydantic import ValidationError
 
 from ..config.settings import settings
 from ..models.data_models import DocumentAnalysisResult, ExtractedContent
+from ..tools.content_deduplicator import ContentDeduplicator
+from ..tools.content_normalizer import ContentNormalizer
+from ..tools.llm_cache import build_llm_chain
+from ..tools.relevance_ranker import RelevanceRanker
+from ..tools.token_utils import estimate_tokens
 
 logger = logging.getLogger(__name__)
 
+# Analysis lists merged across map-reduce chunks
+ANALYSIS_LIST_FIELDS = [
+    "technologies",
+    "approaches",
+    "case_studies",
+    "key_themes",
+    "business_benefits",
+    "challenges_addressed",
+    "implementation_patterns",
+    "client_examples",
+]
+
 
 class DocumentAnalysisChain:
     """
@@ -41,8 +59,22 @@ class DocumentAnalysisChain:
             template=self._get_analysis_template()
         )
         
-        # Create chain using RunnableSequence (modern LangChain pattern)
-        self.chain = self.analysis_prompt | self.llm
+        # Create chain using RunnableSequence (modern LangChain pattern), cached if enabled
+        self.chain = build_llm_chain(
+            self.analysis_prompt, self.llm, "document_analysis", validate=self._is_parseable
+        )
+
+        self.reduce_prompt = PromptTemplate(
+            input_variables=["partial_results", "project_description"],
+            template=self._get_reduce_template()
+        )
+        self.reduce_chain = build_llm_chain(
+            self.reduce_prompt, self.llm, "document_analysis", validate=self._is_parseable
+        )
+
+        self.normalizer = ContentNormalizer() if settings.boilerplate_stripping_enabled else None
+        self.deduplicator = ContentDeduplicator() if settings.slide_dedup_enabled else None
+        self.ranker = RelevanceRanker() if settings.relevance_ranking_enabled else None
 
     def _get_analysis_template(self) -> str:
         """
@@ -84,13 +116,37 @@ ANALYSIS GUIDELINES:
 
 Be thorough but focus on quality over quantity. Only include items that are clearly relevant to the project requirements.
 
+JSON OUTPUT:
+"""
+
+    def _get_reduce_template(self) -> str:
+        """
+        Get the prompt template for consolidating chunked analysis results.
+
+        Returns:
+            Formatted prompt template string
+        """
+        return """
+You are an expert business analyst consolidating partial analyses of a large set of documents for a PowerPoint presentation proposal.
+
+PROJECT DESCRIPTION:
+{project_description}
+
+MERGED PARTIAL RESULTS (items ordered by how many document chunks mentioned them):
+{partial_results}
+
+Consolidate these results into a single analysis with the same JSON structure:
+merge synonyms and near-duplicate items, drop items that are not relevant to
+the project description, and keep the most frequently mentioned items first.
+
 JSON OUTPUT:
 """
 
     async def analyze_documents(
         self,
         documents: List[ExtractedContent],
-        project_description: str
+        project_description: str,
+        key_technologies: Optional[List[str]] = None
     ) -> DocumentAnalysisResult:
         """
         Analyze uploaded documents for relevant content.
@@ -98,6 +154,7 @@ JSON OUTPUT:
         Args:
             documents: List of extracted content from uploaded documents
             project_description: Description of the project requirements
+            key_technologies: Key technologies of the project, used to rank slide relevance
 
         Returns:
             DocumentAnalysisResult with structured analysis
@@ -109,33 +166,64 @@ JSON OUTPUT:
             logger.warning("No documents provided for analysis")
             return DocumentAnalysisResult(
                 analysis="No documents provided for analysis",
-                source_documents=0
+                source_documents=0,
+                degraded=True
             )
 
+        preprocessing_stats = {}
+
         try:
-            # Format documents for analysis
-            doc_text = self._format_documents_for_analysis(documents)
-            
-            # Run analysis chain
-            logger.info(f"Analyzing {len(documents)} documents...")
-            result = await self.chain.ainvoke({
-                "documents": doc_text,
-                "project_description": project_description
-            })
-            
-            # Parse and validate the JSON result
-            # With RunnableSequence, result is the direct content
-            result_content = result.content if hasattr(result, 'content') else str(result)
-            analysis_data = self._parse_analysis_result(result_content)
-            
+            analyzed_documents = documents
+
+            # Strip repeated footers/notices so they are not sent to the LLM
+            if self.normalizer is not None:
+                analyzed_documents, preprocessing_stats["boilerplate"] = self.normalizer.normalize(
+                    analyzed_documents
+                )
+
+            # Collapse slides copied between forked decks
+            if self.deduplicator is not None:
+                analyzed_documents, preprocessing_stats["deduplication"] = self.deduplicator.deduplicate(
+                    analyzed_documents
+                )
+
+            # Keep only the slides most relevant to the project within the token budget
+            if self.ranker is not None:
+                analyzed_documents, preprocessing_stats["relevance"] = self.ranker.select(
+                    analyzed_documents, project_description, key_technologies
+                )
+
+            # Format documents once; each section is budgeted independently
+            sections = [self._format_document(doc) for doc in analyzed_documents]
+            total_tokens = sum(estimate_tokens(section) for section in sections)
+            token_budget = settings.analysis_chunk_token_budget
+
+            if settings.analysis_map_reduce_enabled and total_tokens > token_budget:
+                chunks = self._chunk_sections(sections, token_budget)
+                analysis_data, preprocessing_stats["map_reduce"] = await self._map_reduce_analysis(
+                    chunks, project_description
+                )
+            else:
+                # Run analysis chain
+                logger.info(f"Analyzing {len(analyzed_documents)} documents...")
+                analysis_data = await self._analyze_text(
+                    "\n".join(sections), project_description
+                )
+
             # Create structured result
+            # A placeholder parse or a merge missing failed chunks must not be reused
+            degraded = analysis_data.get("parse_failed", False) or bool(
+                preprocessing_stats.get("map_reduce", {}).get("failed_chunks")
+            )
             analysis_result = DocumentAnalysisResult(
                 analysis=f"Analyzed {len(documents)} documents for project: {project_description[:100]}...",
                 source_documents=len(documents),
                 technologies=analysis_data.get("technologies", []),
                 approaches=analysis_data.get("approaches", []),
                 case_studies=analysis_data.get("case_studies", []),
-                key_themes=analysis_data.get("key_themes", [])
+                key_themes=analysis_data.get("key_themes", []),
+                preprocessing_stats=preprocessing_stats,
+                degraded=degraded
             )
             
             # Add additional fields from analysis
@@ -157,9 +245,207 @@ JSON OUTPUT:
             logger.error(f"Document analysis failed: {e}")
             return DocumentAnalysisResult(
                 analysis=f"Analysis failed: {str(e)}",
-                source_documents=len(documents)
+                source_documents=len(documents),
+                preprocessing_stats=preprocessing_stats,
+                degraded=True
             )
 
+    async def _analyze_text(self, doc_text: str, project_description: str) -> Dict[str, Any]:
+        """
+        Run the analysis chain on formatted document text.
+
+        Args:
+            doc_text: Formatted document text
+            project_description: Description of the project requirements
+
+        Returns:
+            Parsed analysis data dictionary
+        """
+        result = await self.chain.ainvoke({
+            "documents": doc_text,
+            "project_description": project_description
+        })
+
+        # Parse and validate the JSON result
+        # With RunnableSequence, result is the direct content
+        result_content = result.content if hasattr(result, 'content') else str(result)
+        return self._parse_analysis_result(result_content)
+
+    def _chunk_sections(self, sections: List[str], token_budget: int) -> List[List[str]]:
+        """
+        Group formatted document sections into chunks under a token budget.
+
+        Sections are never split, so a single section larger than the budget
+        becomes a chunk of its own.
+
+        Args:
+            sections: Formatted document sections in original order
+            token_budget: Maximum estimated tokens per chunk
+
+        Returns:
+            List of chunks, each a list of sections
+        """
+        chunks: List[List[str]] = []
+        current: List[str] = []
+        current_tokens = 0
+
+        for section in sections:
+            section_tokens = estimate_tokens(section)
+            if current and current_tokens + section_tokens > token_budget:
+                chunks.append(current)
+                current, current_tokens = [], 0
+            current.append(section)
+            current_tokens += section_tokens
+
+        if current:
+            chunks.append(current)
+
+        return chunks
+
+    async def _map_reduce_analysis(
+        self,
+        chunks: List[List[str]],
+        project_description: str
+    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """
+        Analyze document chunks concurrently and merge the partial results.
+
+        Args:
+            chunks: Chunks of formatted document sections
+            project_description: Description of the project requirements
+
+        Returns:
+            Tuple of (merged analysis data, map-reduce statistics)
+
+        Raises:
+            ValueError: If every chunk analysis fails
+        """
+        # CRITICAL: Bound concurrent LLM calls to stay within API rate limits
+        semaphore = asyncio.Semaphore(settings.analysis_max_concurrent_calls)
+
+        async def analyze_chunk(index: int, chunk: List[str]) -> Dict[str, Any]:
+            async with semaphore:
+                logger.info(f"Analyzing chunk {index + 1}/{len(chunks)} ({len(chunk)} documents)...")
+                return await self._analyze_text("\n".join(chunk), project_description)
+
+        chunk_tokens = [sum(estimate_tokens(section) for section in chunk) for chunk in chunks]
+        logger.info(
+            f"Map-reduce analysis: {len(chunks)} chunks, largest ~{max(chunk_tokens)} tokens"
+        )
+
+        outcomes = await asyncio.gather(
+            *(analyze_chunk(index, chunk) for index, chunk in enumerate(chunks)),
+            return_exceptions=True
+        )
+
+        partial_results = []
+        partial_data = []
+        failed_chunks = 0
+        for index, (chunk, outcome) in enumerate(zip(chunks, outcomes)):
+            if isinstance(outcome, Exception) or outcome.get("parse_failed"):
+                reason = outcome if isinstance(outcome, Exception) else "unparseable response"
+                logger.warning(f"Chunk {index + 1} analysis failed: {reason}")
+                failed_chunks += 1
+                continue
+
+            partial_data.append(outcome)
+            partial_results.append(DocumentAnalysisResult(
+                analysis=f"Chunk {index + 1} of {len(chunks)}",
+                source_documents=len(chunk),
+                technologies=outcome.get("technologies", []),
+                approaches=outcome.get("approaches", []),
+                case_studies=outcome.get("case_studies", []),
+                key_themes=outcome.get("key_themes", [])
+            ))
+
+        if not partial_results:
+            raise ValueError(f"All {len(chunks)} chunk analyses failed")
+
+        analysis_data = self._merge_partial_results(partial_results, partial_data)
+
+        reduced = False
+        if settings.analysis_reduce_enabled and len(partial_results) > 1:
+            analysis_data, reduced = await self._reduce_analysis(analysis_data, project_description)
+
+        stats = {
+            "chunks": len(chunks),
+            "failed_chunks": failed_chunks,
+            "token_budget": settings.analysis_chunk_token_budget,
+            "total_tokens": sum(chunk_tokens),
+            "largest_chunk_tokens": max(chunk_tokens),
+            "reduce_call": reduced,
+        }
+        return analysis_data, stats
+
+    def _merge_partial_results(
+        self,
+        partial_results: List[DocumentAnalysisResult],
+        partial_data: List[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """
+        Merge chunk analysis results into a single analysis data dictionary.
+
+        Args:
+            partial_results: Structured result of each successful chunk
+            partial_data: Raw parsed analysis data of each successful chunk
+
+        Returns:
+            Merged analysis data, most frequently mentioned items first
+        """
+        summary = self.summarize_analysis_results(partial_results)
+
+        analysis_data = {
+            "technologies": list(summary["technology_frequency"]),
+            "approaches": list(summary["approach_frequency"]),
+            "case_studies": summary["unique_case_studies"],
+            "key_themes": list(summary["theme_frequency"]),
+        }
+
+        # Fields outside DocumentAnalysisResult are only present in the raw data
+        for field in ANALYSIS_LIST_FIELDS:
+            if field in analysis_data:
+                continue
+            values = [
+                item for data in partial_data
+                if isinstance(data.get(field), list)
+                for item in data[field]
+            ]
+            if values:
+                analysis_data[field] = list(self._count_frequency(values))
+
+        return analysis_data
+
+    async def _reduce_analysis(
+        self,
+        analysis_data: Dict[str, Any],
+        project_description: str
+    ) -> Tuple[Dict[str, Any], bool]:
+        """
+        Consolidate merged chunk results with a final LLM call.
+
+        Args:
+            analysis_data: Merged analysis data
+            project_description: Description of the project requirements
+
+        Returns:
+            Tuple of (consolidated analysis data, whether the reduce call succeeded)
+        """
+        try:
+            result = await self.reduce_chain.ainvoke({
+                "partial_results": json.dumps(analysis_data, indent=2),
+                "project_description": project_description
+            })
+            result_content = result.content if hasattr(result, 'content') else str(result)
+            reduced_data = self._parse_analysis_result(result_content)
+            if reduced_data.get("parse_failed"):
+                raise ValueError("Unparseable reduce response")
+            return reduced_data, True
+
+        except Exception as e:
+            # GOTCHA: The merged result is already usable, so a failed reduce is not fatal
+            logger.warning(f"Reduce call failed, using merged chunk results: {e}")
+            return analysis_data, False
+
     def _format_documents_for_analysis(self, documents: List[ExtractedContent]) -> str:
         """
         Format documents for LLM analysis.
@@ -170,22 +456,36 @@ JSON OUTPUT:
         Returns:
             Formatted document text for analysis
         """
-        formatted_docs = []
-        
-        for doc in documents:
-            doc_section = f"""
+        return "\n".join(self._format_document(doc) for doc in documents)
+
+    def _format_document(self, doc: ExtractedContent) -> str:
+        """
+        Format a single extracted content item for LLM analysis.
+
+        Args:
+            doc: Extracted content item
+
+        Returns:
+            Formatted document section
+        """
+        doc_section = f"""
 --- Document: {doc.source_file} ---
 Type: {doc.file_type.upper()}
 Slide/Page: {doc.slide_number}
 Title: {doc.title}
 Layout: {doc.layout_type}
+"""
+        if doc.duplicates:
+            locations = ", ".join(
+                f"{ref.source_file} ({ref.slide_number})" for ref in doc.duplicates
+            )
+            doc_section += f"Also appears in: {locations}\n"
 
+        doc_section += f"""
 Content:
 {doc.content}
 """
-            formatted_docs.append(doc_section)
-
-        return "\n".join(formatted_docs)
+        return doc_section
 
     def _parse_analysis_result(self, result_text: str) -> Dict[str, Any]:
         """
@@ -195,7 +495,8 @@ Content:
             result_text: Raw text result from LLM
 
         Returns:
-            Parsed analysis data dictionary
+            Parsed analysis data dictionary, or a fallback structure with
+            "parse_failed" set if the JSON is invalid
 
         Raises:
             ValueError: If JSON parsing fails
@@ -223,14 +524,29 @@ Content:
 
         except json.JSONDecodeError as e:
             logger.error(f"Failed to parse analysis JSON: {e}")
-            # Return minimal valid structure
+            # Return minimal valid structure, flagged so callers can tell it apart
             return {
                 "technologies": [],
                 "approaches": [],
                 "case_studies": [],
-                "key_themes": [f"Analysis parsing failed: {str(e)}"]
+                "key_themes": [f"Analysis parsing failed: {str(e)}"],
+                "parse_failed": True
             }
 
+    def _is_parseable(self, result_text: str) -> bool:
+        """
+        Check whether an LLM response parses into analysis data.
+
+        Used by the LLM cache so unparseable responses are retried, not replayed.
+
+        Args:
+            result_text: Raw text result from LLM
+
+        Returns:
+            True if the response is valid analysis JSON
+        """
+        return not self._parse_analysis_result(result_text).get("parse_failed")
+
     async def analyze_single_document(
         self,
         document: ExtractedContent,
@@ -343,7 +659,8 @@ Content:
 # Convenience function for simple document analysis
 async def analyze_documents_simple(
     documents: List[ExtractedContent],
-    project_description: str
+    project_description: str,
+    key_technologies: Optional[List[str]] = None
 ) -> DocumentAnalysisResult:
     """
     Simple function to analyze documents without creating a chain instance.
@@ -351,9 +668,10 @@ async def analyze_documents_simple(
     Args:
         documents: List of extracted content
         project_description: Project requirements
+        key_technologies: Key technologies of the project
 
     Returns:
         Document analysis result
     """
     chain = DocumentAnalysisChain()
-    return await chain.analyze_documents(documents, project_description)
\ No newline at end of file
+    return await chain.analyze_documents(documents, project_description, key_technologies)
\ No newline at end of file
@@ -5,7 +5,11 @@ This module coordinates the complete workflow from document processing
 through analysis to final presentation generation.
 """
 
+import asyncio
 import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from io import BytesIO
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
@@ -19,26 +23,51 @@ from ..models.data_models import (
     ProjectAnalysisResult,
     ProjectDescription,
 )
-from ..tools.document_processor import DocumentProcessor
+from ..tools.checkpoint_store import CheckpointStore, make_run_key
+from ..tools.document_processor import DocumentProcessor, hash_file_source
+from ..tools.llm_cache import get_llm_cache_stats
 from ..tools.presentation_builder import PresentationBuilder
+from ..tools.template_manager import get_template_cache_stats
 from .content_generation_chain import ContentGenerationChain
 from .diagram_generation_chain import DiagramGenerationChain
 from .document_analysis_chain import DocumentAnalysisChain
+from .pipeline import Pipeline, Stage
 from .project_analysis_chain import ProjectAnalysisChain
 
 logger = logging.getLogger(__name__)
 
+# PATTERN: Process-wide writer for deferred deck saves. Its threads are joined
+# at interpreter exit, so a save outlives the request's event loop (Streamlit
+# runs each generation in its own asyncio.run)
+_persist_executor: Optional[ThreadPoolExecutor] = None
+_persist_executor_lock = threading.Lock()
+
+
+def _get_persist_executor() -> ThreadPoolExecutor:
+    """
+    Get the process-wide executor that writes generated decks to disk.
+
+    Returns:
+        Shared single-thread ThreadPoolExecutor
+    """
+    global _persist_executor
+
+    with _persist_executor_lock:
+        if _persist_executor is None:
+            _persist_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="deck-writer")
+        return _persist_executor
+
 
 class PowerPointOrchestrationChain:
     """
     Main orchestration chain for PowerPoint generation workflow.
     
-    Coordinates the complete process:
+    Coordinates the complete process as a stage graph (see _build_pipeline):
     1. Document Analysis → Extract and analyze uploaded documents
-    2. Project Analysis → Analyze project requirements
+    2. Project Analysis → Analyze project requirements (concurrently with 1)
     3. Diagram Generation → Generate architecture diagrams
-    4. Content Generation → Generate slide specifications
-    5. Presentation Building → Create final PowerPoint file with diagrams
+    4. Content Generation → Generate slide specifications (concurrently with 3)
+    5. Presentation Building → Create final PowerPoint deck with diagrams in memory
     """
 
     def __init__(self) -> None:
@@ -49,12 +78,16 @@ class PowerPointOrchestrationChain:
         self.diagram_generation_chain = DiagramGenerationChain()
         self.content_generation_chain = ContentGenerationChain()
         self.presentation_builder = PresentationBuilder()
+        self.checkpoint_store = CheckpointStore() if settings.checkpoint_enabled else None
         
         self.current_status = ProcessingStatus(
             status="initialized",
             message="Orchestration chain ready"
         )
 
+        # Pipeline of the generation currently running, if any
+        self._pipeline: Optional[Pipeline] = None
+
     async def generate_presentation(
         self,
         project: ProjectDescription,
@@ -74,7 +107,9 @@ class PowerPointOrchestrationChain:
             progress_callback: Optional callback for progress updates
 
         Returns:
-            Dictionary with generation results and presentation path
+            Dictionary with generation results, the in-memory presentation
+            buffer and, if persisted, the presentation path and the Future
+            of its deferred save
 
         Raises:
             ValueError: If generation fails at any stage
@@ -82,99 +117,58 @@ class PowerPointOrchestrationChain:
         try:
             logger.info(f"Starting presentation generation for {project.client_name}")
             
-            # Step 1: Document Processing and Analysis
-            self._update_status("processing_documents", 0.1, "Processing uploaded documents...")
-            if progress_callback:
-                progress_callback(self.current_status)
-            
-            extracted_content = await self._process_documents(uploaded_files)
-            
-            self._update_status("analyzing_documents", 0.2, "Analyzing document content...")
-            if progress_callback:
-                progress_callback(self.current_status)
-            
-            document_analysis = await self.document_analysis_chain.analyze_documents(
-                extracted_content, project.description
-            )
-            
-            # Step 2: Project Analysis
-            self._update_status("analyzing_project", 0.3, "Analyzing project requirements...")
-            if progress_callback:
-                progress_callback(self.current_status)
-            
-            project_analysis = await self.project_analysis_chain.analyze_project(project)
-            
-            # Step 3: Diagram Generation
-            self._update_status("generating_diagrams", 0.5, "Generating architecture diagrams...")
-            if progress_callback:
-                progress_callback(self.current_status)
-            
-            diagram_generation_result = DiagramGenerationResult(diagrams=[], success_count=0)
-            if settings.enable_diagram_generation:
-                try:
-                    diagram_generation_result = await self.diagram_generation_chain.generate_diagram_specs(
-                        project=project,
-                        project_analysis=project_analysis,
-                        document_analysis=document_analysis
-                    )
-                    logger.info(f"Generated {diagram_generation_result.success_count} diagrams")
-                except Exception as e:
-                    logger.warning(f"Diagram generation failed: {e}")
-            else:
-                logger.info("Diagram generation is disabled")
-            
-            # Step 4: Content Generation
-            self._update_status("generating_content", 0.7, "Generating slide content...")
-            if progress_callback:
-                progress_callback(self.current_status)
-            
-            generation_result = await self.content_generation_chain.generate_content(
-                project=project,
-                project_analysis=project_analysis,
-                document_analysis=document_analysis,
-                target_slide_count=target_slide_count
-            )
-            
-            # Step 5: Presentation Building
-            self._update_status("building_presentation", 0.85, "Creating PowerPoint presentation...")
-            if progress_callback:
-                progress_callback(self.current_status)
-            
-            presentation_path = await self.presentation_builder.build_presentation(
-                project=project,
-                generation_result=generation_result,
-                template_path=template_path
-            )
-            
-            # Step 6: Insert Diagrams
-            diagram_insertion_results = {}
-            if diagram_generation_result.diagrams:
-                self._update_status("inserting_diagrams", 0.95, "Inserting diagrams into presentation...")
-                if progress_callback:
-                    progress_callback(self.current_status)
-                
-                try:
-                    diagram_insertion_results = await self.presentation_builder.insert_diagrams_into_presentation(
-                        presentation_path=presentation_path,
-                        diagrams=diagram_generation_result.diagrams
-                    )
-                    logger.info(
-                        f"Inserted {diagram_insertion_results.get('successful_insertions', 0)} diagrams "
-                        f"into presentation"
-                    )
-                except Exception as e:
-                    logger.error(f"Failed to insert diagrams: {e}")
-                    diagram_insertion_results = {"error": str(e)}
+            # Completed stages of a failed run with identical inputs are restored
+            checkpoint = None
+            file_hashes = None
+            if self.checkpoint_store is not None:
+                # Each upload is hashed once; extraction reuses the digests as cache keys
+                file_hashes = await self._hash_uploaded_files(uploaded_files)
+                run_key = self._get_run_key(project, file_hashes, target_slide_count, template_path)
+                checkpoint = self.checkpoint_store.for_run(run_key)
+
+            # Steps 1-6 run as a stage graph; independent stages overlap
+            self._pipeline = self._build_pipeline(progress_callback, checkpoint)
+            try:
+                values = await self._pipeline.run({
+                    "project": project,
+                    "uploaded_files": uploaded_files,
+                    "file_hashes": file_hashes,
+                    "target_slide_count": target_slide_count,
+                    "template_path": template_path,
+                })
+                stage_results = self._pipeline.stage_results
+            finally:
+                self._pipeline = None
+
+            extracted_content = values["extracted_content"]
+            document_analysis = values["document_analysis"]
+            project_analysis = values["project_analysis"]
+            diagram_generation_result = values["diagram_generation_result"]
+            generation_result = values["generation_result"]
+            presentation_buffer = values["presentation_buffer"]
+            diagram_insertion_results = values["diagram_insertion_results"]
+            presentation_filename = presentation_buffer.name
+
+            # PATTERN: The deck is served from memory; writing it to disk is
+            # optional and deferred so it never delays the response
+            presentation_path = None
+            presentation_save = None
+            if settings.persist_presentations:
+                presentation_path = settings.output_dir / presentation_filename
+                presentation_save = self._persist_presentation(presentation_buffer, presentation_path)
             
             # Final step: Complete
-            self._update_status("completed", 1.0, f"Presentation created successfully: {presentation_path.name}")
+            self._update_status("completed", 1.0, f"Presentation created successfully: {presentation_filename}")
             if progress_callback:
                 progress_callback(self.current_status)
             
             # Compile comprehensive results
             results = {
                 "success": True,
+                "presentation_buffer": presentation_buffer,
+                "presentation_filename": presentation_filename,
                 "presentation_path": presentation_path,
+                "presentation_save": presentation_save,
                 "project_analysis": project_analysis,
                 "document_analysis": document_analysis,
                 "diagram_generation_result": diagram_generation_result,
@@ -185,13 +179,17 @@ class PowerPointOrchestrationChain:
                 "diagram_count": len(diagram_generation_result.diagrams),
                 "confidence_score": generation_result.confidence_score,
                 "processing_status": self.current_status,
+                "stage_timings": stage_results,
+                "llm_cache": get_llm_cache_stats(),
+                "template_cache": get_template_cache_stats(),
                 "summary": self._generate_summary(
                     project, project_analysis, document_analysis, generation_result, 
-                    presentation_path, diagram_generation_result
+                    presentation_filename, presentation_buffer.getbuffer().nbytes,
+                    diagram_generation_result
                 )
             }
             
-            logger.info(f"Successfully generated presentation: {presentation_path}")
+            logger.info(f"Successfully generated presentation: {presentation_filename}")
             return results
 
         except Exception as e:
@@ -208,15 +206,269 @@ class PowerPointOrchestrationChain:
                 "processing_status": self.current_status
             }
 
+    def _persist_presentation(self, presentation_buffer: BytesIO, output_path: Path) -> Future:
+        """
+        Write a generated deck to disk in the background.
+
+        Args:
+            presentation_buffer: Built presentation
+            output_path: File the deck is written to
+
+        Returns:
+            Future resolving to the saved path once the write completed
+        """
+        # GOTCHA: Save a snapshot - the caller owns the returned buffer and may
+        # read or resize it while the write is still running
+        snapshot = BytesIO(presentation_buffer.getvalue())
+        snapshot.name = presentation_buffer.name
+
+        future = _get_persist_executor().submit(
+            self.presentation_builder.save_presentation_buffer, snapshot, output_path
+        )
+
+        def log_failure(done: Future) -> None:
+            if done.exception() is not None:
+                logger.error(f"Failed to persist presentation {output_path}: {done.exception()}")
+
+        future.add_done_callback(log_failure)
+        return future
+
+    async def _hash_uploaded_files(self, uploaded_files: List[Tuple[Any, str, str]]) -> List[str]:
+        """
+        Compute the content hash of every uploaded file.
+
+        Args:
+            uploaded_files: List of (file_source, filename, file_type) tuples
+
+        Returns:
+            SHA-256 hex digests in upload order
+        """
+        # Hash in a thread so large uploads do not block the event loop
+        return await asyncio.to_thread(
+            lambda: [hash_file_source(file_source) for file_source, _, _ in uploaded_files]
+        )
+
+    def _get_run_key(
+        self,
+        project: ProjectDescription,
+        file_hashes: List[str],
+        target_slide_count: int,
+        template_path: Optional[Path]
+    ) -> str:
+        """
+        Compute the checkpoint key of a generation run.
+
+        Args:
+            project: Project description and requirements
+            file_hashes: Content hashes of the uploaded files, in upload order
+            target_slide_count: Number of slides to generate
+            template_path: Optional custom template path
+
+        Returns:
+            Run key hashed from the project, file contents and settings
+        """
+        return make_run_key(
+            project,
+            file_hashes,
+            target_slide_count=target_slide_count,
+            template_path=str(template_path) if template_path else None
+        )
+
+    def _build_pipeline(
+        self,
+        progress_callback: Optional[callable] = None,
+        checkpoint: Optional[Any] = None
+    ) -> Pipeline:
+        """
+        Build the stage graph of the presentation workflow.
+
+        Stages start as soon as their inputs exist, so document processing
+        and analysis overlap with project analysis, and diagram generation
+        overlaps with content generation. Weights mirror the share of the
+        progress bar each step used to cover. The four LLM stages are
+        checkpointed; document processing reruns on resume but is served
+        from the extraction cache.
+
+        Args:
+            progress_callback: Optional callback for progress updates
+            checkpoint: Optional RunCheckpoint to restore and save stage results
+
+        Returns:
+            Pipeline ready to run with project, uploaded_files, file_hashes,
+            target_slide_count and template_path as initial values
+        """
+        timeout = settings.pipeline_stage_timeout
+
+        stages = [
+            Stage(
+                "processing_documents", self._stage_process_documents,
+                inputs=["uploaded_files", "file_hashes"], outputs=["extracted_content"],
+                weight=0.1, message="Processing uploaded documents...", timeout=timeout
+            ),
+            Stage(
+                "analyzing_documents", self._stage_analyze_documents,
+                inputs=["extracted_content", "project"], outputs=["document_analysis"],
+                weight=0.1, message="Analyzing document content...", timeout=timeout,
+                checkpoint_model=DocumentAnalysisResult,
+                checkpoint_valid=lambda result: not result.degraded
+            ),
+            Stage(
+                "analyzing_project", self._stage_analyze_project,
+                inputs=["project"], outputs=["project_analysis"],
+                weight=0.2, message="Analyzing project requirements...", timeout=timeout,
+                checkpoint_model=ProjectAnalysisResult,
+                checkpoint_valid=lambda result: not result.degraded
+            ),
+            Stage(
+                "generating_diagrams", self._stage_generate_diagrams,
+                inputs=["project", "project_analysis", "document_analysis"],
+                outputs=["diagram_generation_result"],
+                weight=0.2, message="Generating architecture diagrams...", timeout=timeout,
+                # GOTCHA: Diagrams are optional, so a failure must not fail the presentation
+                optional=True, enabled=settings.enable_diagram_generation,
+                fallback={"diagram_generation_result": DiagramGenerationResult(diagrams=[], success_count=0)},
+                checkpoint_model=DiagramGenerationResult,
+                checkpoint_valid=lambda result: "error" not in result.metadata and all(
+                    diagram.image_path.exists() for diagram in result.diagrams
+                )
+            ),
+            Stage(
+                "generating_content", self._stage_generate_content,
+                inputs=["project", "project_analysis", "document_analysis", "target_slide_count"],
+                outputs=["generation_result"],
+                weight=0.15, message="Generating slide content...", timeout=timeout,
+                checkpoint_model=ContentGenerationResult,
+                checkpoint_valid=lambda result: "error" not in result.generation_metadata and all(
+                    slide.diagram.image_path.exists() for slide in result.slides if slide.diagram
+                )
+            ),
+            # PATTERN: Slides, properties and diagram slides are assembled in
+            # one in-memory pass and the deck is saved once
+            Stage(
+                "building_presentation", self._stage_build_presentation,
+                inputs=["project", "generation_result", "template_path", "diagram_generation_result"],
+                outputs=["presentation_buffer", "diagram_insertion_results"],
+                weight=0.25, message="Creating PowerPoint presentation with diagrams...", timeout=timeout
+            ),
+        ]
+
+        def report(active_stages: Dict[str, str], progress: float) -> None:
+            if not active_stages:
+                return
+            self._update_status("+".join(active_stages), progress, " | ".join(active_stages.values()))
+            if progress_callback:
+                progress_callback(self.current_status)
+
+        return Pipeline(stages, progress_callback=report, checkpoint=checkpoint)
+
+    async def _stage_process_documents(
+        self,
+        uploaded_files: List[Tuple[Any, str, str]],
+        file_hashes: Optional[List[str]]
+    ) -> List[ExtractedContent]:
+        """Pipeline stage: extract content from the uploaded documents."""
+        return await self._process_documents(
+            uploaded_files, progress_callback=self._pipeline_progress, file_hashes=file_hashes
+        )
+
+    async def _stage_analyze_documents(
+        self,
+        extracted_content: List[ExtractedContent],
+        project: ProjectDescription
+    ) -> DocumentAnalysisResult:
+        """Pipeline stage: analyze the extracted document content."""
+        return await self.document_analysis_chain.analyze_documents(
+            extracted_content, project.description, project.key_technologies
+        )
+
+    async def _stage_analyze_project(self, project: ProjectDescription) -> ProjectAnalysisResult:
+        """Pipeline stage: analyze the project requirements."""
+        return await self.project_analysis_chain.analyze_project(project)
+
+    async def _stage_generate_diagrams(
+        self,
+        project: ProjectDescription,
+        project_analysis: ProjectAnalysisResult,
+        document_analysis: DocumentAnalysisResult
+    ) -> DiagramGenerationResult:
+        """Pipeline stage: generate architecture diagrams."""
+        diagram_generation_result = await self.diagram_generation_chain.generate_diagram_specs(
+            project=project,
+            project_analysis=project_analysis,
+            document_analysis=document_analysis
+        )
+        logger.info(f"Generated {diagram_generation_result.success_count} diagrams")
+        return diagram_generation_result
+
+    async def _stage_generate_content(
+        self,
+        project: ProjectDescription,
+        project_analysis: ProjectAnalysisResult,
+        document_analysis: DocumentAnalysisResult,
+        target_slide_count: int
+    ) -> ContentGenerationResult:
+        """Pipeline stage: generate slide content."""
+        return await self.content_generation_chain.generate_content(
+            project=project,
+            project_analysis=project_analysis,
+            document_analysis=document_analysis,
+            target_slide_count=target_slide_count
+        )
+
+    async def _stage_build_presentation(
+        self,
+        project: ProjectDescription,
+        generation_result: ContentGenerationResult,
+        template_path: Optional[Path],
+        diagram_generation_result: DiagramGenerationResult
+    ) -> Tuple[BytesIO, Dict[str, Any]]:
+        """Pipeline stage: build the PowerPoint deck in memory including its diagram slides."""
+        diagrams = diagram_generation_result.diagrams
+        presentation_buffer = await self.presentation_builder.build_presentation_buffer(
+            project=project,
+            generation_result=generation_result,
+            template_path=template_path,
+            diagrams=diagrams
+        )
+
+        if not diagrams:
+            return presentation_buffer, {}
+
+        diagram_insertion_results = self.presentation_builder.diagram_insertion_results
+        logger.info(
+            f"Inserted {diagram_insertion_results.get('successful_insertions', 0)} diagrams "
+            f"into presentation"
+        )
+        return presentation_buffer, diagram_insertion_results
+
+    def _pipeline_progress(self, status: ProcessingStatus) -> None:
+        """
+        Forward a per-item status update to the running pipeline stage.
+
+        Args:
+            status: Status reported by a stage helper
+        """
+        if self._pipeline is not None:
+            self._pipeline.set_message(status.status, status.message)
+
     async def _process_documents(
         self,
-        uploaded_files: List[Tuple[Any, str, str]]
+        uploaded_files: List[Tuple[Any, str, str]],
+        progress_callback: Optional[callable] = None,
+        file_hashes: Optional[List[str]] = None
     ) -> List[ExtractedContent]:
         """
         Process uploaded documents and extract content.
 
+        Documents are streamed concurrently slide by slide, so progress is
+        reported as items are decoded and settings.extraction_item_budget
+        stops long documents early.
+
         Args:
             uploaded_files: List of (file_source, filename, file_type) tuples
+            progress_callback: Optional callback for per-item progress updates
+            file_hashes: Optional content hashes of the uploaded files, in upload
+                order, reused as extraction cache keys
 
         Returns:
             List of extracted content from all documents
@@ -225,24 +477,51 @@ class PowerPointOrchestrationChain:
             logger.warning("No documents provided for processing")
             return []
 
+        extracted_count = 0
+
+        async def consume_document(
+            file_source: Any, filename: str, file_type: str, file_hash: Optional[str]
+        ) -> List[ExtractedContent]:
+            nonlocal extracted_count
+            content = []
+
+            async for item in self.document_processor.aiter_document(
+                file_source, filename, file_type,
+                max_items=settings.extraction_item_budget, file_hash=file_hash
+            ):
+                content.append(item)
+                extracted_count += 1
+
+                if progress_callback:
+                    self._update_status(
+                        "processing_documents", self.current_status.progress,
+                        f"Processing uploaded documents... {extracted_count} items extracted"
+                    )
+                    progress_callback(self.current_status)
+
+            return content
+
+        # One extraction task per document; results come back in input order
+        hashes = file_hashes or [None] * len(uploaded_files)
+        results = await asyncio.gather(
+            *(
+                consume_document(file_source, filename, file_type, file_hash)
+                for (file_source, filename, file_type), file_hash in zip(uploaded_files, hashes)
+            ),
+            return_exceptions=True
+        )
+
         all_content = []
-        
-        for file_source, filename, file_type in uploaded_files:
-            try:
-                logger.debug(f"Processing document: {filename}")
-                
-                content = await self.document_processor.process_document(
-                    file_source, filename, file_type
-                )
-                
-                all_content.extend(content)
-                logger.info(f"Extracted {len(content)} items from {filename}")
-                
-            except Exception as e:
-                logger.error(f"Failed to process {filename}: {e}")
+
+        for (_, filename, _), content in zip(uploaded_files, results):
+            if isinstance(content, BaseException):
+                logger.error(f"Failed to process {filename}: {content}")
                 # Continue with other documents
                 continue
 
+            all_content.extend(content)
+            logger.info(f"Extracted {len(content)} items from {filename}")
+
         logger.info(f"Total extracted content: {len(all_content)} items from {len(uploaded_files)} documents")
         return all_content
 
@@ -278,7 +557,8 @@ class PowerPointOrchestrationChain:
         project_analysis: ProjectAnalysisResult,
         document_analysis: DocumentAnalysisResult,
         generation_result: ContentGenerationResult,
-        presentation_path: Path,
+        presentation_filename: str,
+        presentation_size_bytes: int,
         diagram_generation_result: DiagramGenerationResult
     ) -> Dict[str, Any]:
         """
@@ -289,7 +569,9 @@ class PowerPointOrchestrationChain:
             project_analysis: Project analysis results
             document_analysis: Document analysis results
             generation_result: Content generation results
-            presentation_path: Path to created presentation
+            presentation_filename: Filename of the created presentation
+            presentation_size_bytes: Size of the created presentation
+            diagram_generation_result: Diagram generation results
 
         Returns:
             Summary dictionary
@@ -300,6 +582,19 @@ class PowerPointOrchestrationChain:
             "documents_analyzed": document_analysis.source_documents,
             "technologies_identified": len(document_analysis.technologies),
             "approaches_identified": len(document_analysis.approaches),
+            "boilerplate_tokens_saved": document_analysis.preprocessing_stats.get(
+                "boilerplate", {}
+            ).get("tokens_saved", 0),
+            "duplicate_slides_merged": document_analysis.preprocessing_stats.get(
+                "deduplication", {}
+            ).get("duplicates_merged", 0),
+            "slides_selected_by_relevance": document_analysis.preprocessing_stats.get(
+                "relevance", {}
+            ).get("items_selected", document_analysis.source_documents),
+            "analysis_chunks": document_analysis.preprocessing_stats.get(
+                "map_reduce", {}
+            ).get("chunks", 1),
+            "llm_cache_hit_rate": (get_llm_cache_stats() or {}).get("hit_rate", 0.0),
             "project_requirements": len(project_analysis.requirements),
             "target_audience": project_analysis.target_audience,
             "slides_generated": len(generation_result.slides),
@@ -308,8 +603,8 @@ class PowerPointOrchestrationChain:
             "diagram_types": [diagram.spec.diagram_type for diagram in diagram_generation_result.diagrams],
             "confidence_score": generation_result.confidence_score,
             "diagram_confidence_score": diagram_generation_result.confidence_score,
-            "presentation_file": presentation_path.name,
-            "file_size_mb": round(presentation_path.stat().st_size / (1024 * 1024), 2) if presentation_path.exists() else 0,
+            "presentation_file": presentation_filename,
+            "file_size_mb": round(presentation_size_bytes / (1024 * 1024), 2),
             "key_technologies": document_analysis.technologies[:5],
             "key_approaches": document_analysis.approaches[:3],
             "slide_titles": [slide.title for slide in generation_result.slides],
@@ -0,0 +1,375 @@
+"""
+Stage-graph executor for the presentation pipeline.
+
+Each stage declares the named values it consumes and produces. The
+executor starts every stage whose inputs are available, so independent
+stages run concurrently, and reports progress from the weights of the
+completed stages. Stages can have their own timeout, and optional stages
+fall back to default outputs instead of failing the whole pipeline. Stages
+with a checkpoint model are restored from a run checkpoint when one exists,
+so a rerun resumes from the first incomplete stage.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Type
+
+from pydantic import BaseModel
+
+logger = logging.getLogger(__name__)
+
+
+class PipelineError(Exception):
+    """Raised for invalid stage graphs and required stage timeouts."""
+
+
+class Stage:
+    """
+    A single pipeline stage.
+
+    The stage function is called with its inputs as keyword arguments. It
+    returns the value of its single output, or a tuple with one value per
+    output when it declares several.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        func: Callable[..., Awaitable[Any]],
+        inputs: Sequence[str] = (),
+        outputs: Sequence[str] = (),
+        weight: float = 1.0,
+        message: str = "",
+        timeout: Optional[float] = None,
+        optional: bool = False,
+        enabled: bool = True,
+        fallback: Optional[Dict[str, Any]] = None,
+        checkpoint_model: Optional[Type[BaseModel]] = None,
+        checkpoint_valid: Optional[Callable[[Any], bool]] = None
+    ) -> None:
+        """
+        Initialize the stage.
+
+        Args:
+            name: Unique stage name, also used as the reported status
+            func: Async function implementing the stage
+            inputs: Names of the values the stage consumes
+            outputs: Names of the values the stage produces
+            weight: Share of overall progress completed by this stage
+            message: Status message reported while the stage runs
+            timeout: Maximum run time in seconds (None = no limit)
+            optional: Whether failures and timeouts fall back instead of failing the pipeline
+            enabled: Whether the stage runs at all; disabled stages produce the fallback
+            fallback: Output values used when an optional or disabled stage does not complete
+            checkpoint_model: Pydantic model of the single output; enables checkpointing
+            checkpoint_valid: Optional check that an output is worth saving and,
+                when restored, still usable
+        """
+        self.name = name
+        self.func = func
+        self.inputs = list(inputs)
+        self.outputs = list(outputs)
+        self.weight = weight
+        self.message = message
+        self.timeout = timeout
+        self.optional = optional
+        self.enabled = enabled
+        self.fallback = fallback or {}
+        self.checkpoint_model = checkpoint_model
+        self.checkpoint_valid = checkpoint_valid
+
+
+class Pipeline:
+    """
+    Executes a graph of stages, running ready stages concurrently.
+
+    Per-stage status and timings are recorded in stage_results:
+    status is one of completed, restored, skipped, failed or timed_out, and
+    start/end are offsets in seconds from the start of the run.
+    """
+
+    def __init__(
+        self,
+        stages: List[Stage],
+        progress_callback: Optional[Callable[[Dict[str, str], float], None]] = None,
+        checkpoint: Optional[Any] = None
+    ) -> None:
+        """
+        Initialize the pipeline.
+
+        Args:
+            stages: Stages in preferred start order
+            progress_callback: Called with (running stage -> message, progress 0-1)
+                whenever a stage starts, finishes or updates its message
+            checkpoint: Optional run checkpoint with load(stage, model, is_valid)
+                and save(stage, result) methods (see tools.checkpoint_store)
+        """
+        self.stages = stages
+        self.progress_callback = progress_callback
+        self.checkpoint = checkpoint
+        self.total_weight = sum(stage.weight for stage in stages) or 1.0
+
+        self.active: Dict[str, str] = {}
+        self.completed_weight = 0.0
+        self.stage_results: Dict[str, Dict[str, Any]] = {}
+        self._started = time.perf_counter()
+
+    @property
+    def progress(self) -> float:
+        """Fraction of the total stage weight that has completed."""
+        return min(1.0, self.completed_weight / self.total_weight)
+
+    def validate(self, initial_values: Sequence[str]) -> None:
+        """
+        Check that stage names and outputs are unique and every input can be produced.
+
+        Args:
+            initial_values: Names of the values provided to run()
+
+        Raises:
+            PipelineError: If the graph is invalid or contains a cycle
+        """
+        producers: Dict[str, str] = {name: "<input>" for name in initial_values}
+        names = set()
+
+        for stage in self.stages:
+            if stage.name in names:
+                raise PipelineError(f"Duplicate stage name: {stage.name}")
+            names.add(stage.name)
+
+            for output in stage.outputs:
+                if output in producers:
+                    raise PipelineError(
+                        f"Value {output} produced by both {producers[output]} and {stage.name}"
+                    )
+                producers[output] = stage.name
+
+            if stage.checkpoint_model is not None and len(stage.outputs) != 1:
+                raise PipelineError(f"Checkpointed stage {stage.name} must have exactly one output")
+
+            if stage.optional or not stage.enabled:
+                missing_fallback = [name for name in stage.outputs if name not in stage.fallback]
+                if missing_fallback:
+                    raise PipelineError(
+                        f"Stage {stage.name} needs fallback values for: {missing_fallback}"
+                    )
+
+        for stage in self.stages:
+            missing = [name for name in stage.inputs if name not in producers]
+            if missing:
+                raise PipelineError(f"Stage {stage.name} has unsatisfiable inputs: {missing}")
+
+        # Kahn's algorithm over value availability detects cycles
+        available = set(initial_values)
+        remaining = list(self.stages)
+        while remaining:
+            ready = [stage for stage in remaining if all(name in available for name in stage.inputs)]
+            if not ready:
+                raise PipelineError(
+                    f"Stage graph has a cycle between: {[stage.name for stage in remaining]}"
+                )
+            for stage in ready:
+                available.update(stage.outputs)
+                remaining.remove(stage)
+
+    async def run(self, initial_values: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Run all stages.
+
+        Args:
+            initial_values: Values available before any stage runs
+
+        Returns:
+            All initial and produced values by name
+
+        Raises:
+            PipelineError: If the graph is invalid or a required stage times out
+            Exception: The error of the first required stage that fails
+        """
+        self.validate(list(initial_values))
+
+        values = dict(initial_values)
+        pending = list(self.stages)
+        running: Dict[asyncio.Task, Stage] = {}
+        self._started = time.perf_counter()
+
+        try:
+            while pending or running:
+                ready = [s for s in pending if all(name in values for name in s.inputs)]
+                for stage in ready:
+                    pending.remove(stage)
+                    if not stage.enabled:
+                        self._record(stage, "skipped", self._elapsed())
+                        values.update(stage.fallback)
+                        self.completed_weight += stage.weight
+                        logger.info(f"Stage {stage.name} is disabled, skipping")
+                        continue
+
+                    restored = self._restore(stage)
+                    if restored is not None:
+                        self._record(stage, "restored", self._elapsed())
+                        values[stage.outputs[0]] = restored
+                        self.completed_weight += stage.weight
+                        self._report()
+                        continue
+
+                    kwargs = {name: values[name] for name in stage.inputs}
+                    running[asyncio.create_task(self._run_stage(stage, kwargs))] = stage
+                    self.active[stage.name] = stage.message
+                    self.stage_results[stage.name] = {"status": "running", "start": self._elapsed()}
+                    self._report()
+
+                if not running:
+                    if not ready:
+                        blocked = [stage.name for stage in pending]
+                        raise PipelineError(f"Stages blocked on missing values: {blocked}")
+                    # Skipped stages may have unblocked further stages
+                    continue
+
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    stage = running.pop(task)
+                    self.active.pop(stage.name, None)
+                    values.update(self._collect(stage, task))
+                    self.completed_weight += stage.weight
+                    self._report()
+
+        except BaseException:
+            # CRITICAL: Do not leave sibling stages running (and billing) after a failure
+            for task in running:
+                task.cancel()
+            await asyncio.gather(*running, return_exceptions=True)
+            raise
+
+        return values
+
+    def set_message(self, stage_name: str, message: str) -> None:
+        """
+        Update the status message of a running stage.
+
+        Args:
+            stage_name: Name of the running stage
+            message: New status message
+        """
+        if stage_name in self.active:
+            self.active[stage_name] = message
+            self._report()
+
+    async def _run_stage(self, stage: Stage, kwargs: Dict[str, Any]) -> Any:
+        """
+        Run a stage function with its timeout.
+
+        Args:
+            stage: Stage to run
+            kwargs: Stage inputs
+
+        Returns:
+            Stage function result
+        """
+        if stage.timeout is None:
+            return await stage.func(**kwargs)
+        return await asyncio.wait_for(stage.func(**kwargs), timeout=stage.timeout)
+
+    def _restore(self, stage: Stage) -> Optional[Any]:
+        """
+        Restore the output of a checkpointed stage.
+
+        Args:
+            stage: Stage about to run
+
+        Returns:
+            Restored output, or None if the stage has to run
+        """
+        if self.checkpoint is None or stage.checkpoint_model is None:
+            return None
+
+        restored = self.checkpoint.load(stage.name, stage.checkpoint_model, stage.checkpoint_valid)
+        if restored is not None:
+            logger.info(f"Restored stage {stage.name} from checkpoint")
+        return restored
+
+    def _is_checkpointable(self, stage: Stage, result: Any) -> bool:
+        """
+        Check whether a completed stage result should be checkpointed.
+
+        Args:
+            stage: Completed stage
+            result: Its output
+
+        Returns:
+            True if checkpointing is enabled for the stage and the result is valid
+        """
+        if self.checkpoint is None or stage.checkpoint_model is None:
+            return False
+        # GOTCHA: Chains return degraded fallback results instead of raising;
+        # those must not be restored on the next attempt
+        return stage.checkpoint_valid is None or stage.checkpoint_valid(result)
+
+    def _collect(self, stage: Stage, task: asyncio.Task) -> Dict[str, Any]:
+        """
+        Turn a finished stage task into output values.
+
+        Args:
+            stage: Finished stage
+            task: Its completed task
+
+        Returns:
+            Output values of the stage (or its fallback)
+
+        Raises:
+            PipelineError: If a required stage timed out
+            Exception: The error of a failed required stage
+        """
+        end = self._elapsed()
+        error = task.exception()
+
+        if error is None:
+            self._record(stage, "completed", end)
+            result = task.result()
+            if self._is_checkpointable(stage, result):
+                self.checkpoint.save(stage.name, result)
+            if len(stage.outputs) == 1:
+                return {stage.outputs[0]: result}
+            return dict(zip(stage.outputs, result or ()))
+
+        timed_out = isinstance(error, asyncio.TimeoutError)
+        self._record(stage, "timed_out" if timed_out else "failed", end, str(error) or type(error).__name__)
+
+        if stage.optional:
+            logger.warning(f"Optional stage {stage.name} did not complete: {error!r}")
+            return dict(stage.fallback)
+
+        if timed_out:
+            raise PipelineError(f"Stage {stage.name} timed out after {stage.timeout}s") from error
+        raise error
+
+    def _record(self, stage: Stage, status: str, end: float, error: Optional[str] = None) -> None:
+        """
+        Record the outcome and timing of a stage.
+
+        Args:
+            stage: Stage that finished
+            status: Outcome status
+            end: End offset in seconds
+            error: Optional error description
+        """
+        result = self.stage_results.setdefault(stage.name, {"start": end})
+        result.update({
+            "status": status,
+            "end": end,
+            "duration": round(end - result["start"], 3),
+        })
+        if error:
+            result["error"] = error
+
+        logger.info(f"Stage {stage.name} {status} in {result['duration']:.2f}s")
+
+    def _elapsed(self) -> float:
+        """Seconds since the start of the run, rounded to milliseconds."""
+        return round(time.perf_counter() - self._started, 3)
+
+    def _report(self) -> None:
+        """Notify the progress callback of the running stages and progress."""
+        if self.progress_callback:
+            self.progress_callback(dict(self.active), self.progress)
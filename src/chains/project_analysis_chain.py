@@ -14,6 +14,7 @@ from langchain_openai import ChatOpenAI
 
 from ..config.settings import settings
 from ..models.data_models import ProjectAnalysisResult, ProjectDescription
+from ..tools.llm_cache import build_llm_chain
 
 logger = logging.getLogger(__name__)
 
@@ -39,8 +40,10 @@ class ProjectAnalysisChain:
             template=self._get_analysis_template()
         )
         
-        # Create chain using RunnableSequence (modern LangChain pattern)
-        self.chain = self.analysis_prompt | self.llm
+        # Create chain using RunnableSequence (modern LangChain pattern), cached if enabled
+        self.chain = build_llm_chain(
+            self.analysis_prompt, self.llm, "project_analysis", validate=self._is_parseable
+        )
 
     def _get_analysis_template(self) -> str:
         """
@@ -135,7 +138,8 @@ JSON OUTPUT:
                 technical_challenges=analysis_data.get("technical_challenges", []),
                 success_criteria=analysis_data.get("success_criteria", []),
                 presentation_focus=analysis_data.get("presentation_focus", []),
-                value_propositions=analysis_data.get("value_propositions", [])
+                value_propositions=analysis_data.get("value_propositions", []),
+                degraded=analysis_data.get("parse_failed", False)
             )
 
             logger.info(f"Project analysis completed: {len(analysis_result.requirements)} requirements, "
@@ -151,7 +155,8 @@ JSON OUTPUT:
                 technologies=[],
                 solution_approaches=[],
                 target_audience="Business stakeholders",
-                key_objectives=[]
+                key_objectives=[],
+                degraded=True
             )
 
     def _parse_analysis_result(self, result_text: str) -> Dict[str, Any]:
@@ -162,7 +167,8 @@ JSON OUTPUT:
             result_text: Raw text result from LLM
 
         Returns:
-            Parsed analysis data dictionary
+            Parsed analysis data dictionary, or a fallback structure with
+            "parse_failed" set if the JSON is invalid
 
         Raises:
             ValueError: If JSON parsing fails
@@ -203,9 +209,24 @@ JSON OUTPUT:
                 "technologies": [],
                 "solution_approaches": [],
                 "target_audience": "Business stakeholders",
-                "key_objectives": []
+                "key_objectives": [],
+                "parse_failed": True
             }
 
+    def _is_parseable(self, result_text: str) -> bool:
+        """
+        Check whether an LLM response parses into analysis data.
+
+        Used by the LLM cache so unparseable responses are retried, not replayed.
+
+        Args:
+            result_text: Raw text result from LLM
+
+        Returns:
+            True if the response is valid analysis JSON
+        """
+        return not self._parse_analysis_result(result_text).get("parse_failed")
+
     async def match_with_document_analysis(
         self,
         project_analysis: ProjectAnalysisResult,
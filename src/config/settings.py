@@ -33,6 +33,12 @@ class Settings(BaseSettings):
         default="Keyrus Commercial - Template.pptx",
         description="Default PowerPoint template filename"
     )
+    template_cache_enabled: bool = Field(
+        default=True, description="Parse each template once per process and clone it for every build"
+    )
+    template_cache_max_entries: int = Field(
+        default=8, ge=1, le=64, description="Maximum number of parsed templates kept in memory"
+    )
 
     # Data Directories
     previous_decks_dir: Path = Field(
@@ -43,10 +49,14 @@ class Settings(BaseSettings):
         default=Path("./data/generated"),
         description="Directory for generated presentations"
     )
+    persist_presentations: bool = Field(
+        default=True,
+        description="Also write generated decks to output_dir in the background; when false they are only returned in memory"
+    )
 
     # File Upload Settings
     max_file_size_mb: int = Field(
-        default=10, ge=1, le=100, description="Maximum file size in MB"
+        default=50, ge=1, le=2048, description="Maximum file size in MB"
     )
     max_files: int = Field(
         default=5, ge=1, le=10, description="Maximum number of files to upload"
@@ -54,6 +64,44 @@ class Settings(BaseSettings):
     allowed_extensions: str = Field(
         default="pptx,pdf", description="Comma-separated list of allowed file extensions"
     )
+    upload_spool_dir: Path = Field(
+        default=Path("./data/uploads"), description="Directory for uploads spooled to disk"
+    )
+    upload_spool_threshold_mb: int = Field(
+        default=8, ge=0, le=1024,
+        description="Uploads larger than this are spooled to disk instead of processed in memory"
+    )
+
+    # Document Extraction Settings
+    extraction_workers: int = Field(
+        default=4, ge=0, le=16,
+        description="Worker processes for parallel document extraction (0 = extract in-process)"
+    )
+    extraction_cache_enabled: bool = Field(
+        default=True, description="Cache extracted document content on disk by file hash"
+    )
+    extraction_cache_dir: Path = Field(
+        default=Path("./data/cache/extraction"),
+        description="Directory for the extracted content cache"
+    )
+    extraction_cache_max_mb: int = Field(
+        default=256, ge=1, le=10240, description="Maximum extraction cache size in MB"
+    )
+    extraction_item_budget: Optional[int] = Field(
+        default=None, ge=1,
+        description="Maximum slides/pages streamed per document (unset = no limit)"
+    )
+    pdf_parallel_page_threshold: int = Field(
+        default=40, ge=1,
+        description="PDFs with at least this many pages are extracted in parallel page shards"
+    )
+    pdf_shard_pages: int = Field(
+        default=20, ge=1, le=1000, description="Pages per shard for parallel PDF extraction"
+    )
+    pptx_extraction_engine: str = Field(
+        default="xml",
+        description="PowerPoint text extraction engine (xml = raw zip/XML reader, python-pptx)"
+    )
 
     # Logging Configuration
     log_level: str = Field(
@@ -81,7 +129,62 @@ class Settings(BaseSettings):
     min_slides: int = Field(
         default=3, ge=1, le=10, description="Minimum number of slides to generate"
     )
-    
+    pipeline_stage_timeout: int = Field(
+        default=600, ge=30, le=3600, description="Maximum seconds each pipeline stage may run"
+    )
+    checkpoint_enabled: bool = Field(
+        default=True, description="Checkpoint pipeline stage results so failed runs can resume"
+    )
+    checkpoint_dir: Path = Field(
+        default=Path("./data/cache/checkpoints"), description="Directory for pipeline checkpoints"
+    )
+    checkpoint_max_mb: int = Field(
+        default=128, ge=1, le=10240, description="Maximum pipeline checkpoint store size in MB"
+    )
+
+    # Document Analysis Settings
+    boilerplate_stripping_enabled: bool = Field(
+        default=True, description="Strip lines repeated across slides before document analysis"
+    )
+    boilerplate_line_fraction: float = Field(
+        default=0.6, gt=0.0, le=1.0,
+        description="Fraction of a file's slides a line must appear on to count as boilerplate"
+    )
+    boilerplate_min_slides: int = Field(
+        default=3, ge=2, description="Minimum slides in a file before boilerplate is detected"
+    )
+    slide_dedup_enabled: bool = Field(
+        default=True, description="Merge near-duplicate slides across uploads before analysis"
+    )
+    slide_dedup_similarity: float = Field(
+        # GOTCHA: Below 0.85 the LSH bands get too narrow to prune and dedup turns quadratic
+        default=0.9, ge=0.85, le=1.0,
+        description="SimHash similarity (1 - Hamming distance / 64) at which slides are merged"
+    )
+    relevance_ranking_enabled: bool = Field(
+        default=True, description="Send only the slides most relevant to the project to the LLM"
+    )
+    relevance_token_budget: int = Field(
+        default=32000, ge=500, le=1000000,
+        description="Maximum estimated tokens of slides kept after relevance ranking"
+    )
+    relevance_top_k: Optional[int] = Field(
+        default=None, ge=1, description="Maximum number of slides kept after relevance ranking"
+    )
+    analysis_map_reduce_enabled: bool = Field(
+        default=True, description="Split document analysis into concurrent chunk calls when over budget"
+    )
+    analysis_chunk_token_budget: int = Field(
+        default=8000, ge=500, le=100000,
+        description="Maximum estimated document tokens per analysis call"
+    )
+    analysis_max_concurrent_calls: int = Field(
+        default=4, ge=1, le=32, description="Maximum concurrent chunk analysis calls"
+    )
+    analysis_reduce_enabled: bool = Field(
+        default=False, description="Consolidate merged chunk results with a final LLM reduce call"
+    )
+
     # LangChain Settings
     langchain_verbose: bool = Field(
         default=False, description="Enable verbose logging for LangChain"
@@ -89,6 +192,32 @@ class Settings(BaseSettings):
     langchain_debug: bool = Field(
         default=False, description="Enable debug mode for LangChain"
     )
+
+    # LLM Response Cache Settings
+    llm_cache_enabled: bool = Field(
+        default=True, description="Cache LLM responses on disk by model, temperature and prompt"
+    )
+    llm_cache_dir: Path = Field(
+        default=Path("./data/cache/llm"), description="Directory for the LLM response cache"
+    )
+    llm_cache_max_mb: int = Field(
+        default=64, ge=1, le=10240, description="Maximum LLM response cache size in MB"
+    )
+    llm_cache_ttl_hours: float = Field(
+        default=168.0, ge=0.0, description="LLM response cache entry lifetime in hours (0 = no expiry)"
+    )
+    llm_cache_document_analysis: bool = Field(
+        default=True, description="Cache document analysis responses"
+    )
+    llm_cache_project_analysis: bool = Field(
+        default=True, description="Cache project analysis responses"
+    )
+    llm_cache_content_generation: bool = Field(
+        default=True, description="Cache slide content generation responses"
+    )
+    llm_cache_diagram_generation: bool = Field(
+        default=True, description="Cache diagram specification responses"
+    )
     
     # Diagram Generation Settings
     diagram_output_dir: Path = Field(
@@ -107,11 +236,27 @@ class Settings(BaseSettings):
     diagram_generation_timeout: int = Field(
         default=30, ge=10, le=120, description="Diagram generation timeout in seconds"
     )
+    diagram_render_workers: int = Field(
+        default=2, ge=0, le=16,
+        description="Worker processes for parallel diagram rendering (0 = render in a thread)"
+    )
+    diagram_engine: str = Field(
+        default="diagrams",
+        description="Diagram rendering engine (diagrams = diagrams library, dot = direct DOT emission)"
+    )
+    diagram_worker_max_renders: int = Field(
+        default=50, ge=1, le=1000,
+        description="Renders after which a diagram worker process is replaced"
+    )
     enable_diagram_generation: bool = Field(
         default=True, description="Enable/disable diagram generation feature"
     )
     diagram_cache_enabled: bool = Field(
-        default=True, description="Enable diagram caching for similar projects"
+        default=True, description="Reuse rendered images of identical diagram specifications"
+    )
+    diagram_cache_max_mb: int = Field(
+        default=256, ge=16, le=4096,
+        description="Maximum size of the diagram output directory before LRU eviction"
     )
     keyrus_primary_color: str = Field(
         default="#0066CC", description="Keyrus primary brand color"
@@ -131,7 +276,11 @@ class Settings(BaseSettings):
         case_sensitive = False
         extra = "ignore"
 
-    @validator("template_dir", "previous_decks_dir", "output_dir", "diagram_output_dir")
+    @validator(
+        "template_dir", "previous_decks_dir", "output_dir", "diagram_output_dir",
+        "extraction_cache_dir", "upload_spool_dir", "llm_cache_dir",
+        "checkpoint_dir"
+    )
     def validate_directories(cls, v: Path) -> Path:
         """Validate that directories exist or can be created."""
         if not v.exists():
@@ -169,6 +318,24 @@ class Settings(BaseSettings):
             raise ValueError(f"Invalid log level: {v}. Must be one of {valid_levels}")
         return v_upper
 
+    @validator("pptx_extraction_engine")
+    def validate_pptx_extraction_engine(cls, v: str) -> str:
+        """Validate PowerPoint extraction engine."""
+        valid_engines = {"xml", "python-pptx"}
+        v_lower = v.lower()
+        if v_lower not in valid_engines:
+            raise ValueError(f"Invalid PowerPoint extraction engine: {v}. Must be one of {valid_engines}")
+        return v_lower
+
+    @validator("diagram_engine")
+    def validate_diagram_engine(cls, v: str) -> str:
+        """Validate diagram rendering engine."""
+        valid_engines = {"diagrams", "dot"}
+        v_lower = v.lower()
+        if v_lower not in valid_engines:
+            raise ValueError(f"Invalid diagram engine: {v}. Must be one of {valid_engines}")
+        return v_lower
+
     @validator("allowed_extensions")
     def validate_extensions(cls, v: str) -> str:
         """Validate file extensions."""
@@ -39,6 +39,13 @@ class PowerPointSource(BaseModel):
     last_modified: datetime = Field(default_factory=datetime.now)
 
 
+class SourceReference(BaseModel):
+    """Location of a slide or page in an uploaded document."""
+
+    source_file: str = Field(..., description="Source file name")
+    slide_number: int = Field(..., ge=1, description="Slide or page number in the source file")
+
+
 class ExtractedContent(BaseModel):
     """Content extracted from PowerPoint slides or PDF pages."""
 
@@ -52,6 +59,10 @@ class ExtractedContent(BaseModel):
     file_type: str = Field(
         default="pptx", description="Source file type (pptx or pdf)"
     )
+    duplicates: List[SourceReference] = Field(
+        default_factory=list,
+        description="Near-duplicate slides/pages merged into this item"
+    )
 
 
 class GeneratedSlide(BaseModel):
@@ -96,6 +107,14 @@ class DocumentAnalysisResult(BaseModel):
     key_themes: List[str] = Field(
         default_factory=list, description="Key themes identified"
     )
+    preprocessing_stats: Dict[str, Any] = Field(
+        default_factory=dict,
+        description="Statistics from content preprocessing stages run before analysis"
+    )
+    degraded: bool = Field(
+        default=False,
+        description="True if the analysis fell back to a placeholder or partial result"
+    )
 
 
 class ProjectAnalysisResult(BaseModel):
@@ -132,6 +151,10 @@ class ProjectAnalysisResult(BaseModel):
     value_propositions: List[str] = Field(
         default_factory=list, description="Key value propositions"
     )
+    degraded: bool = Field(
+        default=False,
+        description="True if the analysis fell back to a placeholder result"
+    )
 
 
 class ContentGenerationResult(BaseModel):
@@ -221,6 +244,7 @@ class GeneratedDiagram(BaseModel):
     generation_time_ms: int = Field(..., ge=0, description="Time taken to generate")
     slide_target: int = Field(..., ge=1, description="Target slide number for insertion")
     position: Dict[str, float] = Field(..., description="Slide position: left, top, width, height")
+    cached: bool = Field(default=False, description="Whether the image was reused from the render cache")
 
 
 class DiagramGenerationResult(BaseModel):
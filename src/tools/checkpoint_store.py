@@ -0,0 +1,177 @@
+"""
+Pipeline stage checkpoints for resuming failed generations.
+
+When presentation building or diagram insertion fails, a retry with the
+same inputs should not repeat every LLM stage. This module persists the
+result models of completed stages under a run key hashed from the project,
+the uploaded file contents and the application settings, so a rerun can
+restore them and resume from the first incomplete stage.
+"""
+
+import hashlib
+import json
+import logging
+from pathlib import Path
+from typing import Any, Callable, List, Optional, Type
+
+from pydantic import BaseModel, ValidationError
+
+from ..config.settings import settings
+from ..models.data_models import ProjectDescription
+from .disk_cache import DiskCache
+
+logger = logging.getLogger(__name__)
+
+# Bump whenever checkpointed models change incompatibly
+CHECKPOINT_FORMAT_VERSION = 1
+
+# Settings that never influence generated content
+_SETTINGS_EXCLUDED_FROM_KEY = {"openai_api_key", "log_level", "log_file"}
+
+
+def make_run_key(
+    project: ProjectDescription,
+    file_hashes: List[str],
+    **options: Any
+) -> str:
+    """
+    Build the checkpoint key of a generation run.
+
+    Args:
+        project: Project description and requirements
+        file_hashes: Content hashes of the uploaded files, in upload order
+        **options: Further run options (e.g. target slide count, template path)
+
+    Returns:
+        Hex digest identifying the run inputs
+    """
+    settings_snapshot = settings.model_dump(exclude=_SETTINGS_EXCLUDED_FROM_KEY)
+    payload = json.dumps(
+        [
+            CHECKPOINT_FORMAT_VERSION,
+            project.model_dump(mode="json"),
+            file_hashes,
+            options,
+            settings_snapshot,
+        ],
+        sort_keys=True,
+        default=str
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class RunCheckpoint:
+    """Checkpoints of a single generation run."""
+
+    def __init__(self, store: DiskCache, run_key: str) -> None:
+        """
+        Initialize the run checkpoint.
+
+        Args:
+            store: Disk cache holding checkpoint entries
+            run_key: Key of the run from make_run_key
+        """
+        self.store = store
+        self.run_key = run_key
+
+    def _entry_key(self, stage_name: str) -> str:
+        """
+        Get the cache key of a stage checkpoint.
+
+        Args:
+            stage_name: Pipeline stage name
+
+        Returns:
+            Filename-safe cache key
+        """
+        return f"{self.run_key}-{stage_name}"
+
+    def load(
+        self,
+        stage_name: str,
+        model_cls: Type[BaseModel],
+        is_valid: Optional[Callable[[Any], bool]] = None
+    ) -> Optional[BaseModel]:
+        """
+        Restore a stage result.
+
+        Args:
+            stage_name: Pipeline stage name
+            model_cls: Pydantic model class of the stage result
+            is_valid: Optional check that the restored result is still usable
+
+        Returns:
+            Restored result, or None if missing, unreadable or no longer valid
+        """
+        data = self.store.get(self._entry_key(stage_name))
+        if data is None:
+            return None
+
+        try:
+            result = model_cls.model_validate_json(data)
+        except ValidationError as e:
+            logger.warning(f"Discarding unreadable checkpoint for {stage_name}: {e}")
+            self.store.delete(self._entry_key(stage_name))
+            return None
+
+        if is_valid is not None and not is_valid(result):
+            logger.info(f"Checkpoint for {stage_name} is no longer valid, rerunning stage")
+            return None
+
+        return result
+
+    def save(self, stage_name: str, result: BaseModel) -> None:
+        """
+        Persist a stage result.
+
+        Args:
+            stage_name: Pipeline stage name
+            result: Pydantic result of the stage
+        """
+        try:
+            self.store.set(self._entry_key(stage_name), result.model_dump_json().encode("utf-8"))
+        except OSError as e:
+            # GOTCHA: Checkpoints are an optimization; failing to write one must not fail the run
+            logger.warning(f"Failed to write checkpoint for {stage_name}: {e}")
+
+
+class CheckpointStore:
+    """
+    Size-bounded store of pipeline stage checkpoints.
+
+    Old runs are evicted least-recently-used first through DiskCache.
+    """
+
+    def __init__(
+        self,
+        checkpoint_dir: Optional[Path] = None,
+        max_size_bytes: Optional[int] = None
+    ) -> None:
+        """
+        Initialize the checkpoint store.
+
+        Args:
+            checkpoint_dir: Directory holding checkpoints (defaults to settings.checkpoint_dir)
+            max_size_bytes: Maximum total size of all checkpoints
+                (defaults to settings.checkpoint_max_mb)
+        """
+        if max_size_bytes is None:
+            max_size_bytes = settings.checkpoint_max_mb * 1024 * 1024
+
+        self.store = DiskCache(
+            checkpoint_dir or settings.checkpoint_dir,
+            max_size_bytes=max_size_bytes,
+            suffix=".json"
+        )
+
+    def for_run(self, run_key: str) -> RunCheckpoint:
+        """
+        Get the checkpoints of a run.
+
+        Args:
+            run_key: Key of the run from make_run_key
+
+        Returns:
+            RunCheckpoint bound to the run
+        """
+        return RunCheckpoint(self.store, run_key)
@@ -0,0 +1,238 @@
+"""
+Near-duplicate slide detection across uploaded documents.
+
+Reference decks are frequently forks of one another, so the same slide can
+arrive several times with minor edits. This module fingerprints each slide
+with a 64-bit SimHash over word shingles and merges slides whose fingerprints
+are within a Hamming distance derived from the configured similarity.
+Candidate pairs come from banded fingerprint buckets, so the pass runs in
+roughly linear time over the slide count for every similarity the
+slide_dedup_similarity setting accepts. Looser similarities passed in
+directly make the bands too narrow to prune anything; those fall back to a
+plain pairwise scan.
+"""
+
+import hashlib
+import logging
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from ..config.settings import settings
+from ..models.data_models import ExtractedContent, SourceReference
+from .token_utils import chars_to_tokens
+
+logger = logging.getLogger(__name__)
+
+FINGERPRINT_BITS = 64
+
+# Words per shingle used as SimHash features
+SHINGLE_SIZE = 3
+
+# Narrowest band that still prunes: random fingerprints collide on a band of
+# this width 1/64 of the time. Narrower bands (similarity below 0.85, the
+# lower bound of settings.slide_dedup_similarity) make nearly every pair a
+# candidate, so the pairwise scan is cheaper.
+MIN_BAND_BITS = 6
+
+_WORD_PATTERN = re.compile(r"\w+")
+
+
+def _feature_hashes(text: str) -> np.ndarray:
+    """
+    Hash the word shingles of a text into 64-bit features.
+
+    Args:
+        text: Slide text
+
+    Returns:
+        Array of uint64 feature hashes (empty if the text has no words)
+    """
+    words = _WORD_PATTERN.findall(text.lower())
+
+    if len(words) >= SHINGLE_SIZE:
+        shingles = [" ".join(words[i:i + SHINGLE_SIZE]) for i in range(len(words) - SHINGLE_SIZE + 1)]
+    elif words:
+        shingles = [" ".join(words)]
+    else:
+        shingles = []
+
+    # PATTERN: blake2b is stable across processes, unlike the built-in hash()
+    return np.array(
+        [
+            int.from_bytes(hashlib.blake2b(shingle.encode(), digest_size=8).digest(), "little")
+            for shingle in shingles
+        ],
+        dtype="<u8"
+    )
+
+
+def simhash(text: str) -> Optional[int]:
+    """
+    Compute the 64-bit SimHash fingerprint of a text.
+
+    Args:
+        text: Slide text
+
+    Returns:
+        Fingerprint, or None if the text has no words
+    """
+    hashes = _feature_hashes(text)
+    if hashes.size == 0:
+        return None
+
+    # One row of 64 bits per feature; each column votes on one fingerprint bit
+    bits = np.unpackbits(hashes.view(np.uint8).reshape(-1, 8), axis=1, bitorder="little")
+    fingerprint_bits = (bits.sum(axis=0) * 2 > hashes.size).astype(np.uint8)
+
+    return int.from_bytes(np.packbits(fingerprint_bits, bitorder="little").tobytes(), "little")
+
+
+class ContentDeduplicator:
+    """
+    Merges near-duplicate slides/pages across all uploaded documents.
+
+    The first occurrence of each slide is kept; every merged slide is
+    recorded in the kept item's duplicates list.
+    """
+
+    def __init__(self, similarity: Optional[float] = None) -> None:
+        """
+        Initialize the deduplicator.
+
+        Args:
+            similarity: Minimum fingerprint similarity (1 - Hamming distance / 64) to merge
+                slides (defaults to settings.slide_dedup_similarity); below 0.85
+                every slide is compared with every kept slide
+        """
+        self.similarity = settings.slide_dedup_similarity if similarity is None else similarity
+        self.max_distance = int((1.0 - self.similarity) * FINGERPRINT_BITS)
+
+        # GOTCHA: With max_distance + 1 bands, any pair within max_distance bits
+        # must agree exactly on at least one band (pigeonhole principle)
+        band_count = self.max_distance + 1
+        band_width, remainder = divmod(FINGERPRINT_BITS, band_count)
+        self.bands = []
+        if band_width < MIN_BAND_BITS:
+            # No bands: _find_match compares against every kept fingerprint
+            logger.warning(
+                f"Similarity {self.similarity} allows {self.max_distance} differing bits, "
+                f"using a quadratic pairwise scan"
+            )
+            band_count = 0
+        offset = 0
+        for band in range(band_count):
+            width = band_width + (1 if band < remainder else 0)
+            self.bands.append((offset, (1 << width) - 1))
+            offset += width
+
+    def deduplicate(
+        self,
+        documents: List[ExtractedContent]
+    ) -> Tuple[List[ExtractedContent], Dict[str, Any]]:
+        """
+        Collapse near-duplicate slides/pages.
+
+        Args:
+            documents: Extracted content from all uploaded files
+
+        Returns:
+            Tuple of (unique content in first-occurrence order, statistics)
+        """
+        kept: List[ExtractedContent] = []
+        kept_fingerprints: List[Optional[int]] = []
+        merged_refs: List[List[SourceReference]] = []
+        buckets: List[Dict[int, List[int]]] = [{} for _ in self.bands]
+        chars_saved = 0
+
+        for doc in documents:
+            fingerprint = simhash(f"{doc.title}\n{doc.content}")
+            match = None if fingerprint is None else self._find_match(
+                fingerprint, kept_fingerprints, buckets
+            )
+
+            if match is None:
+                kept_index = len(kept)
+                kept.append(doc)
+                kept_fingerprints.append(fingerprint)
+                merged_refs.append(list(doc.duplicates))
+
+                if fingerprint is not None:
+                    for band, (offset, mask) in enumerate(self.bands):
+                        buckets[band].setdefault((fingerprint >> offset) & mask, []).append(kept_index)
+                continue
+
+            merged_refs[match].append(
+                SourceReference(source_file=doc.source_file, slide_number=doc.slide_number)
+            )
+            merged_refs[match].extend(doc.duplicates)
+            chars_saved += len(doc.title) + len(doc.content)
+
+        deduplicated = [
+            doc.model_copy(update={"duplicates": refs}) if len(refs) != len(doc.duplicates) else doc
+            for doc, refs in zip(kept, merged_refs)
+        ]
+
+        stats = {
+            "items_before": len(documents),
+            "items_after": len(deduplicated),
+            "duplicates_merged": len(documents) - len(deduplicated),
+            "similarity": self.similarity,
+            "candidate_search": "banded" if self.bands else "pairwise",
+            "chars_saved": chars_saved,
+            "tokens_saved": chars_to_tokens(chars_saved),
+        }
+
+        logger.info(
+            f"Deduplicated {stats['items_before']} items to {stats['items_after']} "
+            f"(~{stats['tokens_saved']} tokens saved)"
+        )
+        return deduplicated, stats
+
+    def _find_match(
+        self,
+        fingerprint: int,
+        kept_fingerprints: List[Optional[int]],
+        buckets: List[Dict[int, List[int]]]
+    ) -> Optional[int]:
+        """
+        Find a kept item whose fingerprint is within the allowed Hamming distance.
+
+        Args:
+            fingerprint: Fingerprint of the candidate item
+            kept_fingerprints: Fingerprints of kept items
+            buckets: Per-band buckets of kept item indices
+
+        Returns:
+            Index of the matching kept item, or None
+        """
+        if not self.bands:
+            for kept_index, kept_fingerprint in enumerate(kept_fingerprints):
+                if kept_fingerprint is not None and (
+                    (fingerprint ^ kept_fingerprint).bit_count() <= self.max_distance
+                ):
+                    return kept_index
+            return None
+
+        for band, (offset, mask) in enumerate(self.bands):
+            for kept_index in buckets[band].get((fingerprint >> offset) & mask, ()):
+                if (fingerprint ^ kept_fingerprints[kept_index]).bit_count() <= self.max_distance:
+                    return kept_index
+        return None
+
+
+# Convenience function for one-off deduplication
+def deduplicate_content(
+    documents: List[ExtractedContent]
+) -> Tuple[List[ExtractedContent], Dict[str, Any]]:
+    """
+    Collapse near-duplicate slides using default settings.
+
+    Args:
+        documents: Extracted content from all uploaded files
+
+    Returns:
+        Tuple of (unique content, statistics)
+    """
+    return ContentDeduplicator().deduplicate(documents)
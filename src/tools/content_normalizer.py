@@ -0,0 +1,185 @@
+"""
+Boilerplate stripping for extracted document content.
+
+Corporate decks repeat footers, confidentiality notices, slide numbers and
+logo captions on every slide. This module removes lines that recur across
+most slides of the same source file and collapses whitespace, so that only
+slide-specific text reaches the LLM prompt.
+"""
+
+import logging
+import re
+from collections import Counter
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from ..config.settings import settings
+from ..models.data_models import ExtractedContent
+from .token_utils import chars_to_tokens
+
+logger = logging.getLogger(__name__)
+
+# Soft line breaks from PowerPoint arrive as vertical tabs
+_LINE_SPLIT_PATTERN = re.compile(r"[\n\v\r]")
+_WHITESPACE_PATTERN = re.compile(r"[ \t\f\u00a0]+")
+_DIGITS_PATTERN = re.compile(r"\d+")
+
+
+class ContentNormalizer:
+    """
+    Removes repeated boilerplate lines and redundant whitespace from extracted content.
+
+    Lines are compared with digits masked, so "Page 3 of 40" and
+    "Page 4 of 40" count as the same recurring line.
+    """
+
+    def __init__(
+        self,
+        line_fraction: Optional[float] = None,
+        min_slides: Optional[int] = None
+    ) -> None:
+        """
+        Initialize the content normalizer.
+
+        Args:
+            line_fraction: Fraction of a file's slides a line must appear on to be removed
+                (defaults to settings.boilerplate_line_fraction)
+            min_slides: Minimum slides in a file before boilerplate is detected
+                (defaults to settings.boilerplate_min_slides)
+        """
+        self.line_fraction = (
+            settings.boilerplate_line_fraction if line_fraction is None else line_fraction
+        )
+        self.min_slides = settings.boilerplate_min_slides if min_slides is None else min_slides
+
+    def normalize(
+        self,
+        documents: List[ExtractedContent]
+    ) -> Tuple[List[ExtractedContent], Dict[str, Any]]:
+        """
+        Strip boilerplate and collapse whitespace in extracted content.
+
+        Args:
+            documents: Extracted content from one or more source files
+
+        Returns:
+            Tuple of (normalized content in the original order, statistics with
+            per-file and total characters/tokens saved)
+        """
+        # Split every item into cleaned lines once
+        item_lines = [self._split_lines(doc.content) for doc in documents]
+
+        boilerplate_by_file = {}
+        items_by_file: Dict[str, List[int]] = {}
+        for index, doc in enumerate(documents):
+            items_by_file.setdefault(doc.source_file, []).append(index)
+
+        for source_file, indices in items_by_file.items():
+            boilerplate_by_file[source_file] = self._find_boilerplate(
+                [item_lines[index] for index in indices]
+            )
+
+        normalized = []
+        file_stats: Dict[str, Dict[str, int]] = {}
+
+        for doc, lines in zip(documents, item_lines):
+            boilerplate = boilerplate_by_file[doc.source_file]
+            kept_lines = [line for line in lines if self._line_key(line) not in boilerplate]
+            content = "\n".join(kept_lines)
+
+            stats = file_stats.setdefault(doc.source_file, {
+                "items": 0,
+                "boilerplate_lines": len(boilerplate),
+                "lines_removed": 0,
+                "chars_before": 0,
+                "chars_after": 0,
+            })
+            stats["items"] += 1
+            stats["lines_removed"] += len(lines) - len(kept_lines)
+            stats["chars_before"] += len(doc.content)
+            stats["chars_after"] += len(content)
+
+            normalized.append(doc.model_copy(update={"content": content}))
+
+        for source_file, stats in file_stats.items():
+            stats["chars_saved"] = stats["chars_before"] - stats["chars_after"]
+            stats["tokens_saved"] = chars_to_tokens(stats["chars_saved"])
+            logger.info(
+                f"Normalized {source_file}: removed {stats['lines_removed']} boilerplate lines, "
+                f"saved {stats['chars_saved']} chars (~{stats['tokens_saved']} tokens)"
+            )
+
+        chars_before = sum(stats["chars_before"] for stats in file_stats.values())
+        chars_saved = sum(stats["chars_saved"] for stats in file_stats.values())
+
+        return normalized, {
+            "files": file_stats,
+            "chars_before": chars_before,
+            "chars_saved": chars_saved,
+            "tokens_saved": chars_to_tokens(chars_saved),
+        }
+
+    def _split_lines(self, content: str) -> List[str]:
+        """
+        Split content into non-empty lines with collapsed whitespace.
+
+        Args:
+            content: Raw slide/page text
+
+        Returns:
+            Cleaned lines
+        """
+        lines = []
+        for raw_line in _LINE_SPLIT_PATTERN.split(content):
+            line = _WHITESPACE_PATTERN.sub(" ", raw_line).strip()
+            if line:
+                lines.append(line)
+        return lines
+
+    def _line_key(self, line: str) -> str:
+        """
+        Get the comparison key for a line.
+
+        Args:
+            line: Cleaned line
+
+        Returns:
+            Lower-cased line with digit runs masked
+        """
+        return _DIGITS_PATTERN.sub("#", line.lower())
+
+    def _find_boilerplate(self, slides: List[List[str]]) -> Set[str]:
+        """
+        Find lines that recur across a high fraction of one file's slides.
+
+        Args:
+            slides: Cleaned lines of every slide in the file
+
+        Returns:
+            Set of line keys to remove
+        """
+        if len(slides) < self.min_slides:
+            return set()
+
+        # Count each line once per slide
+        slide_counts = Counter()
+        for lines in slides:
+            slide_counts.update({self._line_key(line) for line in lines})
+
+        min_count = max(2, self.line_fraction * len(slides))
+        return {key for key, count in slide_counts.items() if count >= min_count}
+
+
+# Convenience function for one-off normalization
+def strip_boilerplate(
+    documents: List[ExtractedContent]
+) -> Tuple[List[ExtractedContent], Dict[str, Any]]:
+    """
+    Strip repeated boilerplate from extracted content using default settings.
+
+    Args:
+        documents: Extracted content from one or more source files
+
+    Returns:
+        Tuple of (normalized content, statistics)
+    """
+    return ContentNormalizer().normalize(documents)
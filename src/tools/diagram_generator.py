@@ -6,277 +6,337 @@ from specifications using the Python diagrams library with proper async support.
 """
 
 import asyncio
-import gc
+import hashlib
+import importlib
+import importlib.util
+import json
 import logging
+import shutil
+import tempfile
 import time
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 # Initialize logger first
 logger = logging.getLogger(__name__)
 
-try:
-    from diagrams import Cluster, Diagram
-    from diagrams.aws.analytics import EMR, Glue, Kinesis, Redshift
-    from diagrams.aws.compute import EC2, ECS, Lambda
-    from diagrams.aws.database import Dynamodb, RDS
-    from diagrams.aws.integration import SQS, SNS
-    from diagrams.aws.network import APIGateway, ElasticLoadBalancing
-    from diagrams.aws.storage import S3
-    from diagrams.azure.analytics import DataFactories, EventHubs, SynapseAnalytics
-    from diagrams.azure.compute import FunctionApps, ContainerInstances
-    from diagrams.azure.database import CosmosDb, SQLDatabases
-    from diagrams.azure.integration import ServiceBus
-    from diagrams.azure.network import LoadBalancers, ApplicationGateway
-    from diagrams.azure.storage import BlobStorage
-    from diagrams.gcp.analytics import Bigquery, Dataflow, Pubsub
-    from diagrams.gcp.compute import Functions, KubernetesEngine, ComputeEngine  
-    from diagrams.gcp.database import SQL, Firestore
-    from diagrams.gcp.network import LoadBalancing
-    from diagrams.gcp.storage import Storage
-    from diagrams.k8s.compute import Pod
-    from diagrams.k8s.network import Service
-    from diagrams.onprem.database import PostgreSQL, MySQL
-    from diagrams.onprem.inmemory import Redis
-    from diagrams.onprem.queue import RabbitMQ
-    
-    DIAGRAMS_AVAILABLE = True
-    
-except ImportError as e:
-    # Create dummy classes as fallbacks
-    logger.warning(f"Diagrams library not fully available: {e}")
-    DIAGRAMS_AVAILABLE = False
-    
-    # Create placeholder classes
-    class DummyDiagramComponent:
-        def __init__(self, name):
-            self.name = name
-    
-    # AWS placeholders
-    EMR = Glue = Kinesis = Redshift = DummyDiagramComponent
-    EC2 = ECS = Lambda = DummyDiagramComponent
-    Dynamodb = RDS = DummyDiagramComponent
-    SQS = SNS = DummyDiagramComponent
-    APIGateway = ElasticLoadBalancing = DummyDiagramComponent
-    S3 = DummyDiagramComponent
-    
-    # Azure placeholders
-    DataFactories = EventHubs = SynapseAnalytics = DummyDiagramComponent
-    FunctionApps = ContainerInstances = DummyDiagramComponent
-    CosmosDb = SQLDatabases = DummyDiagramComponent
-    ServiceBus = DummyDiagramComponent
-    LoadBalancers = ApplicationGateway = DummyDiagramComponent
-    BlobStorage = DummyDiagramComponent
-    
-    # GCP placeholders
-    Bigquery = Dataflow = Pubsub = DummyDiagramComponent
-    Functions = KubernetesEngine = ComputeEngine = DummyDiagramComponent
-    SQL = Firestore = DummyDiagramComponent
-    LoadBalancing = DummyDiagramComponent
-    Storage = DummyDiagramComponent
-    
-    # Kubernetes placeholders
-    Pod = Service = DummyDiagramComponent
-    
-    # OnPrem placeholders
-    PostgreSQL = MySQL = DummyDiagramComponent
-    Redis = DummyDiagramComponent
-    RabbitMQ = DummyDiagramComponent
-    
-    # Diagram placeholders
-    class DummyDiagram:
-        def __init__(self, *args, **kwargs):
-            pass
-        def __enter__(self):
-            return self
-        def __exit__(self, *args):
-            pass
-    
-    class DummyCluster:
-        def __init__(self, *args, **kwargs):
-            pass
-        def __enter__(self):
-            return self
-        def __exit__(self, *args):
-            pass
-    
-    Diagram = DummyDiagram
-    Cluster = DummyCluster
+# PATTERN: Provider classes are imported on first use, not at module import.
+# Importing ~40 classes from five provider packages costs noticeable startup
+# time even when diagram generation is disabled.
+_LAZY_CLASSES: Dict[str, str] = {
+    # Diagram context managers
+    "Diagram": "diagrams", "Cluster": "diagrams",
+    # AWS
+    "EMR": "diagrams.aws.analytics", "Glue": "diagrams.aws.analytics",
+    "Kinesis": "diagrams.aws.analytics", "Redshift": "diagrams.aws.analytics",
+    "EC2": "diagrams.aws.compute", "ECS": "diagrams.aws.compute", "Lambda": "diagrams.aws.compute",
+    "Dynamodb": "diagrams.aws.database", "RDS": "diagrams.aws.database",
+    "SQS": "diagrams.aws.integration", "SNS": "diagrams.aws.integration",
+    "APIGateway": "diagrams.aws.network", "ElasticLoadBalancing": "diagrams.aws.network",
+    "S3": "diagrams.aws.storage",
+    # Azure
+    "DataFactories": "diagrams.azure.analytics", "EventHubs": "diagrams.azure.analytics",
+    "SynapseAnalytics": "diagrams.azure.analytics",
+    "FunctionApps": "diagrams.azure.compute", "ContainerInstances": "diagrams.azure.compute",
+    "CosmosDb": "diagrams.azure.database", "SQLDatabases": "diagrams.azure.database",
+    "ServiceBus": "diagrams.azure.integration",
+    "LoadBalancers": "diagrams.azure.network", "ApplicationGateway": "diagrams.azure.network",
+    "BlobStorage": "diagrams.azure.storage",
+    # GCP
+    "Bigquery": "diagrams.gcp.analytics", "Dataflow": "diagrams.gcp.analytics",
+    "Pubsub": "diagrams.gcp.analytics",
+    "Functions": "diagrams.gcp.compute", "KubernetesEngine": "diagrams.gcp.compute",
+    "ComputeEngine": "diagrams.gcp.compute",
+    "SQL": "diagrams.gcp.database", "Firestore": "diagrams.gcp.database",
+    "LoadBalancing": "diagrams.gcp.network",
+    "Storage": "diagrams.gcp.storage",
+    # Kubernetes
+    "Pod": "diagrams.k8s.compute", "Service": "diagrams.k8s.network",
+    # OnPrem
+    "PostgreSQL": "diagrams.onprem.database", "MySQL": "diagrams.onprem.database",
+    "Redis": "diagrams.onprem.inmemory",
+    "RabbitMQ": "diagrams.onprem.queue",
+}
+
+# Cheap availability probe: locate the packages without importing them
+DIAGRAMS_AVAILABLE = all(
+    importlib.util.find_spec(package) is not None for package in ("diagrams", "graphviz")
+)
+if not DIAGRAMS_AVAILABLE:
+    logger.warning("Diagrams library not available, diagram generation will fail")
+
+
+# Placeholder classes used when the diagrams library is missing
+class DummyDiagramComponent:
+    def __init__(self, name):
+        self.name = name
+
+
+class DummyDiagram:
+    def __init__(self, *args, **kwargs):
+        pass
+    def __enter__(self):
+        return self
+    def __exit__(self, *args):
+        pass
+
+
+class DummyCluster:
+    def __init__(self, *args, **kwargs):
+        pass
+    def __enter__(self):
+        return self
+    def __exit__(self, *args):
+        pass
+
+
+_PLACEHOLDERS = {"Diagram": DummyDiagram, "Cluster": DummyCluster}
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Resolve a diagrams class on first access (PEP 562).
+
+    Keeps module attributes such as Diagram or Lambda available to callers
+    and to unittest.mock.patch without importing every provider up front.
+
+    Args:
+        name: Attribute name
+
+    Returns:
+        The diagrams class, or a placeholder if the library is unavailable
+
+    Raises:
+        AttributeError: If the name is not a known diagrams class
+    """
+    module_path = _LAZY_CLASSES.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    if DIAGRAMS_AVAILABLE:
+        resolved = getattr(importlib.import_module(module_path), name)
+    else:
+        resolved = _PLACEHOLDERS.get(name, DummyDiagramComponent)
+
+    # Cache as a real module attribute so later lookups skip this hook
+    globals()[name] = resolved
+    return resolved
+
+
+def _resolve_class(name: str) -> Any:
+    """
+    Get a diagrams class by name, honoring patched module attributes.
+
+    Args:
+        name: Class name from the lazy registry
+
+    Returns:
+        The resolved class
+    """
+    # GOTCHA: Global name lookups inside this module bypass __getattr__
+    resolved = globals().get(name)
+    return resolved if resolved is not None else __getattr__(name)
+
 
 from ..config.settings import settings
 from ..models.data_models import DiagramComponent, DiagramSpec, GeneratedDiagram
+from .disk_cache import DiskCache
+from .dot_emitter import (
+    DEFAULT_ICON_HEIGHT,
+    DOT_DEFAULT_CONNECTION_ATTRS,
+    compile_dot,
+    render_dot,
+    resolve_icon_path,
+)
+from .render_workers import RenderTimeoutError, RenderWorkerPool
 
+# Bump whenever rendering output changes so stale cached images are ignored
+RENDERER_VERSION = "1"
 
-class DiagramGenerator:
+# Process-wide render pool shared by every DiagramGenerator instance
+_render_pool: Optional[RenderWorkerPool] = None
+
+
+def _get_render_pool() -> RenderWorkerPool:
     """
-    Core diagram generation using diagrams library.
-    
-    Generates architecture diagrams from specifications with proper
-    async support and resource management.
+    Get the shared diagram render pool, creating it on first use.
+
+    Returns:
+        RenderWorkerPool bounded by settings.diagram_render_workers
+    """
+    global _render_pool
+
+    if _render_pool is None:
+        _render_pool = RenderWorkerPool(
+            max_workers=settings.diagram_render_workers,
+            max_renders_per_worker=settings.diagram_worker_max_renders
+        )
+        logger.info(f"Started diagram render pool with {settings.diagram_render_workers} workers")
+
+    return _render_pool
+
+
+def shutdown_render_pool() -> None:
+    """Shut down the shared diagram render pool if it is running."""
+    global _render_pool
+
+    if _render_pool is not None:
+        _render_pool.shutdown()
+        _render_pool = None
+        logger.info("Diagram render pool shut down")
+
+
+def get_render_pool_stats() -> Dict[str, Any]:
+    """
+    Get statistics of the shared diagram render pool.
+
+    Returns:
+        Pool counters, or {"running": False} if the pool was never started
+    """
+    if _render_pool is None:
+        return {"running": False}
+    return {"running": True, **_render_pool.get_stats()}
+
+
+def render_diagram(styling_config: Dict[str, Any], spec: DiagramSpec, output_path: str) -> None:
+    """
+    Render a diagram to "<output_path>.png" with the configured engine.
+
+    Runs inside render pool workers, so it only builds a DiagramRenderer;
+    the image store lives on the parent-side DiagramGenerator.
+
+    Args:
+        styling_config: Styling configuration for diagrams
+        spec: Diagram specification
+        output_path: Output path without extension
+    """
+    DiagramRenderer(styling_config)._generate_diagram_sync(spec, output_path)
+
+
+class DiagramRenderer:
     """
+    Renders diagram specifications to images.
 
-    def __init__(self, output_dir: Path, styling_config: Dict[str, Any]):
+    Holds only the styling and icon mappings, so it is cheap to build in a
+    render worker. DiagramGenerator adds the image store and process pool.
+    """
+
+    def __init__(self, styling_config: Dict[str, Any]):
         """
-        Initialize diagram generator.
+        Initialize diagram renderer.
 
         Args:
-            output_dir: Directory for generated diagram files
             styling_config: Styling configuration for diagrams
         """
-        self.output_dir = output_dir
         self.styling = styling_config
-        
-        # Ensure output directory exists
-        self.output_dir.mkdir(parents=True, exist_ok=True)
-        
+
         # Component icon mappings
         self.icon_mappings = self._initialize_icon_mappings()
-        
-        logger.info(f"DiagramGenerator initialized with output dir: {output_dir}")
 
-    def _initialize_icon_mappings(self) -> Dict[str, Dict[str, Any]]:
-        """Initialize icon mappings for different providers and component types."""
+    def _initialize_icon_mappings(self) -> Dict[str, Dict[str, str]]:
+        """
+        Initialize icon mappings for different providers and component types.
+
+        Values are class names from the lazy registry, resolved on first use.
+        """
         return {
             "aws": {
-                "api": APIGateway,
-                "service": Lambda,
-                "microservice": Lambda,
-                "database": RDS,
-                "nosql": Dynamodb,
-                "queue": SQS,
-                "notification": SNS,
-                "storage": S3,
-                "compute": EC2,
-                "container": ECS,
-                "loadbalancer": ElasticLoadBalancing,
-                "analytics": EMR,
-                "etl": Glue,
-                "streaming": Kinesis,
-                "warehouse": Redshift
+                "api": "APIGateway",
+                "service": "Lambda",
+                "microservice": "Lambda",
+                "database": "RDS",
+                "nosql": "Dynamodb",
+                "queue": "SQS",
+                "notification": "SNS",
+                "storage": "S3",
+                "compute": "EC2",
+                "container": "ECS",
+                "loadbalancer": "ElasticLoadBalancing",
+                "analytics": "EMR",
+                "etl": "Glue",
+                "streaming": "Kinesis",
+                "warehouse": "Redshift"
             },
             "azure": {
-                "api": ApplicationGateway,
-                "service": FunctionApps,
-                "microservice": FunctionApps,
-                "database": SQLDatabases,
-                "nosql": CosmosDb,
-                "queue": ServiceBus,
-                "notification": ServiceBus,
-                "storage": BlobStorage,
-                "compute": ContainerInstances,
-                "container": ContainerInstances,
-                "loadbalancer": LoadBalancers,
-                "analytics": SynapseAnalytics,
-                "etl": DataFactories,
-                "streaming": EventHubs
+                "api": "ApplicationGateway",
+                "service": "FunctionApps",
+                "microservice": "FunctionApps",
+                "database": "SQLDatabases",
+                "nosql": "CosmosDb",
+                "queue": "ServiceBus",
+                "notification": "ServiceBus",
+                "storage": "BlobStorage",
+                "compute": "ContainerInstances",
+                "container": "ContainerInstances",
+                "loadbalancer": "LoadBalancers",
+                "analytics": "SynapseAnalytics",
+                "etl": "DataFactories",
+                "streaming": "EventHubs"
             },
             "gcp": {
-                "api": LoadBalancing,
-                "service": Functions,
-                "microservice": Functions,
-                "database": SQL,
-                "nosql": Firestore,
-                "queue": Pubsub,
-                "notification": Pubsub,
-                "storage": Storage,
-                "compute": ComputeEngine,
-                "container": KubernetesEngine,
-                "loadbalancer": LoadBalancing,
-                "analytics": Bigquery,
-                "etl": Dataflow,
-                "streaming": Pubsub
+                "api": "LoadBalancing",
+                "service": "Functions",
+                "microservice": "Functions",
+                "database": "SQL",
+                "nosql": "Firestore",
+                "queue": "Pubsub",
+                "notification": "Pubsub",
+                "storage": "Storage",
+                "compute": "ComputeEngine",
+                "container": "KubernetesEngine",
+                "loadbalancer": "LoadBalancing",
+                "analytics": "Bigquery",
+                "etl": "Dataflow",
+                "streaming": "Pubsub"
             },
             "kubernetes": {
-                "service": Pod,
-                "microservice": Pod,
-                "network": Service
+                "service": "Pod",
+                "microservice": "Pod",
+                "network": "Service"
             },
             "onprem": {
-                "database": PostgreSQL,
-                "mysql": MySQL,
-                "cache": Redis,
-                "queue": RabbitMQ
+                "database": "PostgreSQL",
+                "mysql": "MySQL",
+                "cache": "Redis",
+                "queue": "RabbitMQ"
             }
         }
 
-    async def generate_diagram(self, spec: DiagramSpec) -> GeneratedDiagram:
+    def _generate_diagram_sync(self, spec: DiagramSpec, output_path: str) -> None:
         """
-        Generate diagram from specification.
+        Generate diagram synchronously with the configured engine.
 
         Args:
-            spec: Diagram specification with components and connections
-
-        Returns:
-            GeneratedDiagram object with path and metadata
-
-        Raises:
-            ValueError: If diagram generation fails
-            FileNotFoundError: If generated file is not found
+            spec: Diagram specification
+            output_path: Output path without extension
         """
-        start_time = time.time() * 1000  # Start timing in milliseconds
-        
-        try:
-            logger.info(f"Starting diagram generation: {spec.title}")
-            
-            # Check if diagrams library is available
-            if not DIAGRAMS_AVAILABLE:
-                raise ValueError(
-                    "Diagrams library not available. Please install: pip install diagrams graphviz"
-                )
-            
-            # Create safe filename
-            safe_title = spec.title.lower().replace(' ', '_').replace('-', '_')
-            diagram_filename = f"{safe_title}_{int(start_time)}"
-            diagram_path = self.output_dir / f"{diagram_filename}.png"
-            
-            # Run diagram generation in executor to avoid blocking
-            loop = asyncio.get_event_loop()
-            await loop.run_in_executor(
-                None, self._generate_diagram_sync, spec, str(diagram_path.with_suffix(''))
-            )
-            
-            # Verify file was created
-            if not diagram_path.exists():
-                raise FileNotFoundError(f"Diagram generation failed: {diagram_path}")
-            
-            # Calculate generation time and file size
-            generation_time = int(time.time() * 1000 - start_time)
-            file_size_kb = diagram_path.stat().st_size // 1024
-            
-            # Determine slide target and positioning
-            slide_target = 2  # Default to second slide for diagrams
-            position = self._calculate_slide_position(spec.diagram_type)
-            
-            result = GeneratedDiagram(
-                spec=spec,
-                image_path=diagram_path,
-                file_size_kb=file_size_kb,
-                generation_time_ms=generation_time,
-                slide_target=slide_target,
-                position=position
-            )
+        if settings.diagram_engine == "dot":
+            render_dot(self.compile_dot(spec), f"{output_path}.png")
+            return
+
+        # Generate diagram using context manager
+        diagram_class = _resolve_class("Diagram")
+        with diagram_class(spec.title, **self._get_diagram_attributes(spec, output_path)):
+            # Create components
+            components = self._create_components(spec.components)
             
-            logger.info(
-                f"Successfully generated diagram: {diagram_path.name} "
-                f"({file_size_kb}KB, {generation_time}ms)"
-            )
-            return result
+            # Apply clustering if specified
+            if spec.clustering:
+                components = self._apply_clustering(components, spec.clustering)
             
-        except Exception as e:
-            error_msg = f"Diagram generation failed for {spec.title}: {str(e)}"
-            logger.error(error_msg)
-            raise ValueError(error_msg) from e
-        finally:
-            # Force garbage collection to free memory
-            gc.collect()
+            # Create connections
+            self._create_connections(components, spec.connections)
 
-    def _generate_diagram_sync(self, spec: DiagramSpec, output_path: str) -> None:
+    def _get_diagram_attributes(self, spec: DiagramSpec, output_path: str) -> Dict[str, Any]:
         """
-        Generate diagram synchronously using diagrams library.
+        Get the diagrams.Diagram keyword arguments for a specification.
 
         Args:
             spec: Diagram specification
             output_path: Output path without extension
+
+        Returns:
+            Diagram keyword arguments
         """
         # Configure diagram styling
         diagram_attrs = {
@@ -304,17 +364,77 @@ class DiagramGenerator:
             
             diagram_attrs.update(valid_styling)
 
-        # Generate diagram using context manager
-        with Diagram(spec.title, **diagram_attrs):
-            # Create components
-            components = self._create_components(spec.components)
-            
-            # Apply clustering if specified
-            if spec.clustering:
-                components = self._apply_clustering(components, spec.clustering)
-            
-            # Create connections
-            self._create_connections(components, spec.connections)
+        return diagram_attrs
+
+    def compile_dot(self, spec: DiagramSpec) -> str:
+        """
+        Compile a specification straight to DOT source.
+
+        Produces the graph the diagrams engine builds for the same
+        specification, without creating diagrams objects.
+
+        Args:
+            spec: Diagram specification
+
+        Returns:
+            DOT source text
+        """
+        attrs = self._get_diagram_attributes(spec, "")
+        autolabel = bool(attrs.get("autolabel", False))
+
+        nodes = []
+        node_ids: Dict[str, str] = {}
+        for index, comp_spec in enumerate(spec.components):
+            try:
+                icon_class = self._get_icon_class(
+                    comp_spec.icon_provider, comp_spec.component_type, comp_spec.icon_name
+                )
+            except Exception as e:
+                logger.warning(f"Failed to resolve icon for {comp_spec.name}: {e}. Using default component.")
+                icon_class = _resolve_class("Lambda")
+
+            label = comp_spec.name
+            if autolabel:
+                label = f"{icon_class.__name__}\n{label}" if label else icon_class.__name__
+
+            node_attrs: Dict[str, Any] = {"label": label}
+            icon_path = resolve_icon_path(icon_class)
+            if icon_path:
+                # Match diagrams.Node: taller icon nodes, plus room for extra label lines
+                height = getattr(icon_class, "_height", DEFAULT_ICON_HEIGHT) + 0.4 * label.count("\n")
+                node_attrs.update({"shape": "none", "height": str(height), "image": icon_path})
+
+            node_id = f"n{index}"
+            nodes.append((node_id, node_attrs))
+            node_ids[comp_spec.name] = node_id
+
+        # GOTCHA: The diagrams engine creates every node before opening its
+        # clusters, so its clusters are empty and Graphviz draws nothing for
+        # them; clusters are therefore omitted here to render the same image
+        edges = []
+        for connection in spec.connections:
+            source = node_ids.get(connection.source)
+            target = node_ids.get(connection.target)
+            if not (source and target):
+                logger.warning(
+                    f"Cannot connect {connection.source} -> {connection.target}: "
+                    f"Component not found"
+                )
+                continue
+            direction = "none" if connection.connection_type == "bidirectional" else "forward"
+            edges.append((source, target, {**DOT_DEFAULT_CONNECTION_ATTRS, "dir": direction}))
+
+        return compile_dot(
+            name=attrs.get("name", spec.title),
+            direction=attrs["direction"],
+            curvestyle=attrs.get("curvestyle", "ortho"),
+            graph_attr=attrs.get("graph_attr") or {},
+            node_attr=attrs.get("node_attr") or {},
+            edge_attr=attrs.get("edge_attr") or {},
+            nodes=nodes,
+            edges=edges,
+            strict=bool(attrs.get("strict", False))
+        )
 
     def _create_components(self, component_specs: List[DiagramComponent]) -> Dict[str, Any]:
         """
@@ -349,7 +469,7 @@ class DiagramGenerator:
                     f"Using default component."
                 )
                 # Fallback to basic AWS service
-                components[comp_spec.name] = Lambda(comp_spec.name)
+                components[comp_spec.name] = _resolve_class("Lambda")(comp_spec.name)
         
         return components
 
@@ -369,18 +489,18 @@ class DiagramGenerator:
         
         # Try exact component type match first
         if component_type in provider_icons:
-            return provider_icons[component_type]
+            return _resolve_class(provider_icons[component_type])
         
         # Try icon name match
         if icon_name.lower() in provider_icons:
-            return provider_icons[icon_name.lower()]
+            return _resolve_class(provider_icons[icon_name.lower()])
         
         # Fallback to default service for provider
         if provider in self.icon_mappings:
-            return provider_icons.get("service", Lambda)
+            return _resolve_class(provider_icons.get("service", "Lambda"))
         
         # Ultimate fallback
-        return Lambda
+        return _resolve_class("Lambda")
 
     def _apply_clustering(
         self, 
@@ -401,7 +521,7 @@ class DiagramGenerator:
         unclustered = dict(components)
         
         for cluster_name, component_names in clustering.items():
-            with Cluster(cluster_name):
+            with _resolve_class("Cluster")(cluster_name):
                 cluster_components = {}
                 for comp_name in component_names:
                     if comp_name in unclustered:
@@ -464,6 +584,212 @@ class DiagramGenerator:
             "ranksep": "0.8"
         }
 
+
+class DiagramGenerator(DiagramRenderer):
+    """
+    Core diagram generation using diagrams library.
+    
+    Generates architecture diagrams from specifications with proper
+    async support and resource management. Graphviz rendering runs in a
+    shared process pool when settings.diagram_render_workers is greater
+    than zero, so several diagrams render in parallel.
+
+    Rendered images are stored content-addressed in the output directory,
+    keyed by the specification, styling and DPI, and evicted least-recently-used
+    once the directory exceeds settings.diagram_cache_max_mb. With the cache
+    enabled, an identical diagram is served from disk without rendering.
+    """
+
+    def __init__(
+        self,
+        output_dir: Path,
+        styling_config: Dict[str, Any],
+        use_process_pool: Optional[bool] = None,
+        use_cache: Optional[bool] = None
+    ):
+        """
+        Initialize diagram generator.
+
+        Args:
+            output_dir: Directory for generated diagram files
+            styling_config: Styling configuration for diagrams
+            use_process_pool: Render in worker processes
+                (defaults to settings.diagram_render_workers > 0)
+            use_cache: Serve identical diagrams from previously rendered images
+                (defaults to settings.diagram_cache_enabled)
+        """
+        super().__init__(styling_config)
+        self.output_dir = output_dir
+        self.use_process_pool = (
+            settings.diagram_render_workers > 0 if use_process_pool is None else use_process_pool
+        )
+        self.use_cache = settings.diagram_cache_enabled if use_cache is None else use_cache
+        
+        # Ensure output directory exists
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+
+        # Size-bounded image store; also bounds disk use when lookups are disabled
+        self.image_store = DiskCache(
+            self.output_dir,
+            max_size_bytes=settings.diagram_cache_max_mb * 1024 * 1024,
+            suffix=".png"
+        )
+
+        logger.info(f"DiagramGenerator initialized with output dir: {output_dir}")
+
+    async def generate_diagram(self, spec: DiagramSpec) -> GeneratedDiagram:
+        """
+        Generate diagram from specification.
+
+        Args:
+            spec: Diagram specification with components and connections
+
+        Returns:
+            GeneratedDiagram object with path and metadata
+
+        Raises:
+            ValueError: If diagram generation fails
+            RenderTimeoutError: If rendering exceeded settings.diagram_generation_timeout
+        """
+        start_time = time.time() * 1000  # Start timing in milliseconds
+        
+        try:
+            logger.info(f"Starting diagram generation: {spec.title}")
+
+            cache_key = self.get_cache_key(spec)
+            diagram_path = self.image_store.get_path(cache_key) if self.use_cache else None
+            cached = diagram_path is not None
+
+            if not cached:
+                # Check if diagrams library is available
+                if not DIAGRAMS_AVAILABLE:
+                    raise ValueError(
+                        "Diagrams library not available. Please install: pip install diagrams graphviz"
+                    )
+
+                diagram_path = await self._render_to_store(spec, cache_key)
+            
+            # Calculate generation time and file size
+            generation_time = int(time.time() * 1000 - start_time)
+            file_size_kb = diagram_path.stat().st_size // 1024
+            
+            # Determine slide target and positioning
+            slide_target = 2  # Default to second slide for diagrams
+            position = self._calculate_slide_position(spec.diagram_type)
+            
+            result = GeneratedDiagram(
+                spec=spec,
+                image_path=diagram_path,
+                file_size_kb=file_size_kb,
+                generation_time_ms=generation_time,
+                slide_target=slide_target,
+                position=position,
+                cached=cached
+            )
+            
+            logger.info(
+                f"{'Reused cached' if cached else 'Successfully generated'} diagram: "
+                f"{diagram_path.name} ({file_size_kb}KB, {generation_time}ms)"
+            )
+            return result
+            
+        except RenderTimeoutError as e:
+            logger.error(f"Diagram generation timed out for {spec.title}: {e}")
+            raise
+        except Exception as e:
+            error_msg = f"Diagram generation failed for {spec.title}: {str(e)}"
+            logger.error(error_msg)
+            raise ValueError(error_msg) from e
+
+    def get_cache_key(self, spec: DiagramSpec) -> str:
+        """
+        Compute the content address of a rendered diagram.
+
+        Args:
+            spec: Diagram specification
+
+        Returns:
+            Hex digest of the specification, resolved styling and DPI
+        """
+        payload = json.dumps(
+            [
+                RENDERER_VERSION,
+                spec.model_dump(mode="json"),
+                self.styling,
+                self._get_graph_attributes(),
+                settings.diagram_dpi,
+                settings.diagram_engine,
+            ],
+            sort_keys=True,
+            default=str
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    async def _render_to_store(self, spec: DiagramSpec, cache_key: str) -> Path:
+        """
+        Render a diagram and move the image into the image store.
+
+        Args:
+            spec: Diagram specification
+            cache_key: Content address from get_cache_key
+
+        Returns:
+            Path of the stored image
+
+        Raises:
+            FileNotFoundError: If rendering produced no image
+        """
+        # GOTCHA: Render into a private directory inside the output dir so the
+        # final move is atomic and concurrent renders never clobber each other
+        render_dir = Path(tempfile.mkdtemp(dir=self.output_dir, prefix=".render-"))
+        try:
+            rendered_path = render_dir / f"{cache_key}.png"
+
+            # Render off the event loop, in a worker process when enabled
+            await self._render(spec, str(rendered_path.with_suffix('')))
+
+            # Verify file was created
+            if not rendered_path.exists():
+                raise FileNotFoundError(f"Diagram generation failed: {rendered_path}")
+
+            return self.image_store.set_file(cache_key, rendered_path)
+        finally:
+            shutil.rmtree(render_dir, ignore_errors=True)
+
+    async def _render(self, spec: DiagramSpec, output_path: str) -> None:
+        """
+        Render a diagram without blocking the event loop.
+
+        Args:
+            spec: Diagram specification
+            output_path: Output path without extension
+
+        Raises:
+            RenderTimeoutError: If rendering exceeded settings.diagram_generation_timeout
+        """
+        timeout = settings.diagram_generation_timeout
+
+        if self.use_process_pool:
+            # The waiting thread only polls a pipe; the worker is killed on timeout
+            await asyncio.to_thread(
+                _get_render_pool().run,
+                render_diagram,
+                (self.styling, spec, output_path),
+                timeout
+            )
+            return
+
+        loop = asyncio.get_running_loop()
+        try:
+            await asyncio.wait_for(
+                loop.run_in_executor(None, self._generate_diagram_sync, spec, output_path),
+                timeout=timeout
+            )
+        except asyncio.TimeoutError as e:
+            # GOTCHA: A thread cannot be killed - the render keeps running in the
+            # background; use render workers to actually reclaim the resources
+            raise RenderTimeoutError(f"Render did not finish within {timeout}s") from e
+
     def _calculate_slide_position(self, diagram_type: str) -> Dict[str, float]:
         """
         Calculate optimal slide position for diagram type.
@@ -484,40 +810,34 @@ class DiagramGenerator:
         
         return positions.get(diagram_type, positions["microservices"])
 
-    async def cleanup_old_diagrams(self, max_age_hours: int = 24) -> int:
+    async def cleanup_old_diagrams(self) -> int:
         """
-        Clean up old diagram files.
-
-        Args:
-            max_age_hours: Maximum age of files to keep in hours
+        Evict least-recently-used diagram images beyond the size bound.
 
         Returns:
             Number of files cleaned up
         """
         try:
-            import time
-            
-            current_time = time.time()
-            max_age_seconds = max_age_hours * 3600
-            cleanup_count = 0
-            
-            for file_path in self.output_dir.glob("*.png"):
-                if file_path.is_file():
-                    file_age = current_time - file_path.stat().st_mtime
-                    if file_age > max_age_seconds:
-                        file_path.unlink()
-                        cleanup_count += 1
-                        logger.debug(f"Cleaned up old diagram: {file_path.name}")
-            
+            cleanup_count = await asyncio.to_thread(self.image_store.trim)
+
             if cleanup_count > 0:
                 logger.info(f"Cleaned up {cleanup_count} old diagram files")
-            
+
             return cleanup_count
-            
+
         except Exception as e:
             logger.error(f"Error during diagram cleanup: {e}")
             return 0
 
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """
+        Get diagram image store statistics.
+
+        Returns:
+            Dictionary with hit/miss counters and size information
+        """
+        return {"enabled": self.use_cache, **self.image_store.get_stats()}
+
     def get_supported_providers(self) -> List[str]:
         """
         Get list of supported icon providers.
@@ -0,0 +1,287 @@
+"""
+Size-bounded on-disk cache with LRU eviction.
+
+This module provides a small content-addressed key/value store used to
+persist expensive intermediate results (such as extracted document content)
+across application runs.
+"""
+
+import logging
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class DiskCache:
+    """
+    Persistent key/value cache stored as one file per entry.
+
+    Entries are evicted least-recently-used first once the total size of the
+    cache directory exceeds the configured bound. Recency is tracked through
+    file modification times, so it survives process restarts.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        max_size_bytes: int,
+        suffix: str = ".bin"
+    ) -> None:
+        """
+        Initialize the disk cache.
+
+        Args:
+            cache_dir: Directory holding cache entries
+            max_size_bytes: Maximum total size of all entries in bytes
+            suffix: File suffix used for entry files
+        """
+        self.cache_dir = Path(cache_dir)
+        self.max_size_bytes = max_size_bytes
+        self.suffix = suffix
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._current_size = self._scan_size()
+
+    def _entry_path(self, key: str) -> Path:
+        """
+        Get the file path for a cache key.
+
+        Args:
+            key: Cache key (must be filename-safe, e.g. a hex digest)
+
+        Returns:
+            Path of the entry file
+        """
+        return self.cache_dir / f"{key}{self.suffix}"
+
+    def _scan_size(self) -> int:
+        """
+        Compute the total size of all entries on disk.
+
+        Returns:
+            Total size in bytes
+        """
+        total = 0
+        for entry in self.cache_dir.glob(f"*{self.suffix}"):
+            try:
+                total += entry.stat().st_size
+            except OSError:
+                continue
+        return total
+
+    def get(self, key: str) -> Optional[bytes]:
+        """
+        Read a cache entry and mark it as recently used.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Entry bytes or None on a cache miss
+        """
+        entry_path = self._entry_path(key)
+
+        try:
+            data = entry_path.read_bytes()
+            os.utime(entry_path)  # Refresh recency for LRU eviction
+        except OSError:
+            with self._lock:
+                self.misses += 1
+            return None
+
+        with self._lock:
+            self.hits += 1
+        return data
+
+    def get_path(self, key: str) -> Optional[Path]:
+        """
+        Look up the file of a cache entry and mark it as recently used.
+
+        Use this instead of get() when callers consume the entry from disk.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Path of the entry file or None on a cache miss
+        """
+        entry_path = self._entry_path(key)
+
+        try:
+            os.utime(entry_path)  # Refresh recency for LRU eviction
+        except OSError:
+            with self._lock:
+                self.misses += 1
+            return None
+
+        with self._lock:
+            self.hits += 1
+        return entry_path
+
+    def set(self, key: str, data: bytes) -> Path:
+        """
+        Store a cache entry, evicting old entries if the size bound is exceeded.
+
+        Args:
+            key: Cache key
+            data: Entry bytes
+
+        Returns:
+            Path of the stored entry file
+        """
+        entry_path = self._entry_path(key)
+
+        previous_size = entry_path.stat().st_size if entry_path.exists() else 0
+
+        # Write atomically so concurrent readers never see partial entries
+        fd, tmp_name = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as tmp_file:
+                tmp_file.write(data)
+            os.replace(tmp_name, entry_path)
+        except Exception:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+        self._account(entry_path, len(data) - previous_size)
+        return entry_path
+
+    def set_file(self, key: str, source_path: Path) -> Path:
+        """
+        Move an existing file into the cache as an entry.
+
+        Args:
+            key: Cache key
+            source_path: File to move; must be on the same filesystem as the cache
+
+        Returns:
+            Path of the stored entry file
+        """
+        entry_path = self._entry_path(key)
+
+        previous_size = entry_path.stat().st_size if entry_path.exists() else 0
+        size = Path(source_path).stat().st_size
+        os.replace(source_path, entry_path)  # Atomic, so readers never see partial entries
+
+        self._account(entry_path, size - previous_size)
+        return entry_path
+
+    def _account(self, entry_path: Path, size_delta: int) -> None:
+        """
+        Track a size change and evict old entries if the size bound is exceeded.
+
+        Args:
+            entry_path: Entry that was just written
+            size_delta: Change of the total cache size in bytes
+        """
+        with self._lock:
+            self._current_size += size_delta
+            over_budget = self._current_size > self.max_size_bytes
+
+        if over_budget:
+            self._evict(keep=entry_path)
+
+    def trim(self) -> int:
+        """
+        Evict least-recently-used entries until the cache fits its size bound.
+
+        Also accounts for entry files added or removed by other processes.
+
+        Returns:
+            Number of evicted entries
+        """
+        with self._lock:
+            evictions_before = self.evictions
+
+        self._evict()
+
+        with self._lock:
+            return self.evictions - evictions_before
+
+    def delete(self, key: str) -> None:
+        """
+        Remove a cache entry if it exists.
+
+        Args:
+            key: Cache key
+        """
+        entry_path = self._entry_path(key)
+
+        try:
+            size = entry_path.stat().st_size
+            entry_path.unlink()
+        except OSError:
+            return
+
+        with self._lock:
+            self._current_size -= size
+
+    def _evict(self, keep: Optional[Path] = None) -> None:
+        """
+        Evict least-recently-used entries until the cache fits its size bound.
+
+        Args:
+            keep: Entry that must not be evicted (the one just written)
+        """
+        entries = []
+        for entry in self.cache_dir.glob(f"*{self.suffix}"):
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry))
+
+        entries.sort(key=lambda item: item[0])
+        total = sum(size for _, size, _ in entries)
+
+        for _, size, entry in entries:
+            if total <= self.max_size_bytes:
+                break
+            if entry == keep:
+                continue
+            try:
+                entry.unlink()
+            except OSError:
+                continue
+            total -= size
+            with self._lock:
+                self.evictions += 1
+            logger.debug(f"Evicted cache entry: {entry.name}")
+
+        with self._lock:
+            self._current_size = total
+
+    def clear(self) -> None:
+        """Remove all cache entries."""
+        for entry in self.cache_dir.glob(f"*{self.suffix}"):
+            entry.unlink(missing_ok=True)
+
+        with self._lock:
+            self._current_size = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with hit/miss counters and size information
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "size_bytes": self._current_size,
+                "max_size_bytes": self.max_size_bytes,
+            }
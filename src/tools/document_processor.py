@@ -5,36 +5,493 @@ This module provides utilities to extract text content from PowerPoint presentat
 and PDF documents, handling various file formats and edge cases safely.
 """
 
+import asyncio
+import hashlib
+import itertools
+import json
 import logging
+import mmap
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import ExitStack
 from io import BytesIO
 from pathlib import Path
-from typing import List, Optional, Union
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Tuple, Union
 
 import pypdf
 from pptx import Presentation
 from pptx.exc import PackageNotFoundError
 
+from ..config.settings import settings
 from ..models.data_models import ExtractedContent
+from .disk_cache import DiskCache
+from .pptx_xml_extractor import iter_pptx_xml_content
 
 logger = logging.getLogger(__name__)
 
+# Bump whenever extraction output changes so stale cache entries are ignored
+EXTRACTOR_VERSION = "1"
+
+# Process-wide extraction pool shared by every DocumentProcessor instance
+_extraction_pool: Optional[ProcessPoolExecutor] = None
+_extraction_pool_lock = threading.Lock()
+
+
+def _get_extraction_pool() -> ProcessPoolExecutor:
+    """
+    Get the shared extraction process pool, creating it on first use.
+
+    Returns:
+        ProcessPoolExecutor bounded by settings.extraction_workers
+    """
+    global _extraction_pool
+
+    with _extraction_pool_lock:
+        if _extraction_pool is None:
+            # GOTCHA: Use spawn - forking the threaded Streamlit server can deadlock
+            _extraction_pool = ProcessPoolExecutor(
+                max_workers=settings.extraction_workers,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+            logger.info(f"Started extraction pool with {settings.extraction_workers} workers")
+
+        return _extraction_pool
+
+
+def shutdown_extraction_pool() -> None:
+    """Shut down the shared extraction process pool if it is running."""
+    global _extraction_pool
+
+    with _extraction_pool_lock:
+        pool, _extraction_pool = _extraction_pool, None
+
+    if pool is not None:
+        pool.shutdown(wait=True, cancel_futures=True)
+        logger.info("Extraction pool shut down")
+
+
+def _discard_broken_extraction_pool(pool: ProcessPoolExecutor) -> None:
+    """
+    Drop a broken extraction pool so the next caller starts a fresh one.
+
+    Safe to call from the event loop: the shutdown does not wait for workers.
+
+    Args:
+        pool: The pool that raised BrokenProcessPool
+    """
+    global _extraction_pool
+
+    # CRITICAL: Another request may already have replaced the broken pool;
+    # only clear the global if it still holds this one
+    with _extraction_pool_lock:
+        if _extraction_pool is pool:
+            _extraction_pool = None
+
+    pool.shutdown(wait=False, cancel_futures=True)
+    logger.info("Discarded broken extraction pool")
+
+
+def hash_file_source(file_source: Any) -> str:
+    """
+    Compute the SHA-256 of an uploaded document.
+
+    Args:
+        file_source: Path, BytesIO or file-like object
+
+    Returns:
+        Hex digest of the file bytes
+    """
+    if isinstance(file_source, (str, Path)):
+        with open(file_source, "rb") as file_obj:
+            return hashlib.file_digest(file_obj, "sha256").hexdigest()
+
+    if isinstance(file_source, BytesIO):
+        with file_source.getbuffer() as buffer:
+            return hashlib.sha256(buffer).hexdigest()
+
+    file_source.seek(0)
+    digest = hashlib.file_digest(file_source, "sha256").hexdigest()
+    file_source.seek(0)
+    return digest
+
+
+def _iter_powerpoint_content(
+    file_source: Union[Path, BytesIO],
+    filename: str
+) -> Iterator[ExtractedContent]:
+    """
+    Yield text content from PowerPoint file using the configured engine.
+
+    The raw-XML engine falls back to python-pptx on any error, resuming after
+    the slides it already yielded (both engines produce identical items).
+
+    Args:
+        file_source: Path to file or BytesIO object
+        filename: Original filename for metadata
+
+    Yields:
+        ExtractedContent for each slide with meaningful content
+    """
+    if settings.pptx_extraction_engine != "xml":
+        yield from _iter_powerpoint_content_python_pptx(file_source, filename)
+        return
+
+    yielded = 0
+    try:
+        for item in iter_pptx_xml_content(file_source, filename):
+            yield item
+            yielded += 1
+        return
+    except Exception as e:
+        logger.warning(
+            f"Raw XML extraction failed for {filename}, falling back to python-pptx: {e}"
+        )
+
+    if isinstance(file_source, BytesIO):
+        file_source.seek(0)
+
+    yield from itertools.islice(
+        _iter_powerpoint_content_python_pptx(file_source, filename), yielded, None
+    )
+
+
+def _iter_powerpoint_content_python_pptx(
+    file_source: Union[Path, BytesIO],
+    filename: str
+) -> Iterator[ExtractedContent]:
+    """
+    Yield text content from PowerPoint file one slide at a time via python-pptx.
+
+    Args:
+        file_source: Path to file or BytesIO object
+        filename: Original filename for metadata
+
+    Yields:
+        ExtractedContent for each slide with meaningful content
+    """
+    try:
+        # PATTERN: Use python-pptx with careful error handling
+        presentation = Presentation(file_source)
+
+        for slide_num, slide in enumerate(presentation.slides, 1):
+            # GOTCHA: Handle different slide layouts safely
+            title = ""
+            content = ""
+
+            # CRITICAL: Use try-except for placeholder access
+            try:
+                if slide.shapes.title:
+                    title = slide.shapes.title.text.strip()
+            except AttributeError:
+                title = f"Slide {slide_num}"
+
+            # Extract text from all text shapes
+            text_content = []
+            for shape in slide.shapes:
+                if hasattr(shape, "text") and shape.text.strip():
+                    text_content.append(shape.text.strip())
+
+            content = "\n".join(text_content)
+
+            # Get layout name safely
+            layout_type = "unknown"
+            try:
+                layout_type = slide.slide_layout.name
+            except AttributeError:
+                layout_type = f"layout_{slide.slide_layout_id}"
+
+            # Only add slides with meaningful content
+            if content.strip() or title.strip():
+                yield ExtractedContent(
+                    slide_number=slide_num,
+                    title=title or f"Slide {slide_num}",
+                    content=content,
+                    layout_type=layout_type,
+                    source_file=filename,
+                    file_type="pptx"
+                )
+
+    except PackageNotFoundError:
+        logger.error(f"Invalid PowerPoint file: {filename}")
+        raise ValueError(f"File {filename} is not a valid PowerPoint presentation")
+    except Exception as e:
+        logger.error(f"Error extracting from PowerPoint {filename}: {e}")
+        raise
+
+
+def _extract_powerpoint_content(
+    file_source: Union[Path, BytesIO],
+    filename: str
+) -> List[ExtractedContent]:
+    """
+    Extract text content from PowerPoint file synchronously.
+
+    Args:
+        file_source: Path to file or BytesIO object
+        filename: Original filename for metadata
+
+    Returns:
+        List of ExtractedContent objects
+    """
+    extracted_content = list(_iter_powerpoint_content(file_source, filename))
+    logger.info(f"Extracted {len(extracted_content)} slides from {filename}")
+    return extracted_content
+
+
+def _iter_pdf_content(
+    file_source: Union[Path, BytesIO],
+    filename: str,
+    start_page: int = 0,
+    end_page: Optional[int] = None
+) -> Iterator[ExtractedContent]:
+    """
+    Yield text content from PDF file one page at a time.
+
+    Args:
+        file_source: Path to file or BytesIO object
+        filename: Original filename for metadata
+        start_page: Index of the first page to extract (0-based)
+        end_page: Index after the last page to extract (defaults to all pages)
+
+    Yields:
+        ExtractedContent for each page with text
+    """
+    with ExitStack() as stack:
+        try:
+            pdf_reader = _open_pdf_reader(file_source, stack)
+        except Exception as e:
+            logger.error(f"Error extracting from PDF {filename}: {e}")
+            raise ValueError(f"Failed to process PDF file {filename}: {e}")
+
+        if end_page is None:
+            end_page = len(pdf_reader.pages)
+
+        yield from _iter_pdf_pages(pdf_reader, filename, start_page, end_page)
+
+
+def _open_pdf_reader(file_source: Any, stack: ExitStack) -> pypdf.PdfReader:
+    """
+    Open a PdfReader, memory-mapping files on disk.
+
+    pypdf reads a whole file into memory when given a path; a read-only
+    memory map lets it page the file in lazily instead.
+
+    Args:
+        file_source: Path to file, BytesIO or other seekable binary stream
+        stack: Exit stack that owns the opened file and mapping
+
+    Returns:
+        PdfReader over the source
+    """
+    if isinstance(file_source, (str, Path)):
+        pdf_file = stack.enter_context(open(file_source, "rb"))
+        file_source = stack.enter_context(
+            mmap.mmap(pdf_file.fileno(), 0, access=mmap.ACCESS_READ)
+        )
+
+    return pypdf.PdfReader(file_source)
+
+
+def _iter_pdf_pages(
+    pdf_reader: pypdf.PdfReader,
+    filename: str,
+    start_page: int,
+    end_page: int
+) -> Iterator[ExtractedContent]:
+    """
+    Yield text content for a range of pages of an open PDF.
+
+    Args:
+        pdf_reader: Open PdfReader
+        filename: Original filename for metadata
+        start_page: Index of the first page to extract (0-based)
+        end_page: Index after the last page to extract
+
+    Yields:
+        ExtractedContent for each page with text
+    """
+    for page_num in range(start_page + 1, end_page + 1):
+        try:
+            # Extract text from page
+            text = pdf_reader.pages[page_num - 1].extract_text()
+
+            if not text.strip():
+                continue
+
+            # Try to extract a title from the first line or first few words
+            lines = text.strip().split('\n')
+            title = ""
+            content = text.strip()
+
+            if lines:
+                # Use first non-empty line as title if it's short enough
+                first_line = lines[0].strip()
+                if len(first_line) <= 100 and len(lines) > 1:
+                    title = first_line
+                    content = '\n'.join(lines[1:]).strip()
+                else:
+                    # Use page number as title
+                    title = f"Page {page_num}"
+
+            item = ExtractedContent(
+                slide_number=page_num,
+                title=title or f"Page {page_num}",
+                content=content,
+                layout_type="pdf_page",
+                source_file=filename,
+                file_type="pdf"
+            )
+
+        except Exception as e:
+            logger.warning(f"Error extracting page {page_num} from {filename}: {e}")
+            continue
+
+        yield item
+
+
+def _extract_pdf_content(
+    file_source: Union[Path, BytesIO],
+    filename: str
+) -> List[ExtractedContent]:
+    """
+    Extract text content from PDF file synchronously.
+
+    Args:
+        file_source: Path to file or BytesIO object
+        filename: Original filename for metadata
+
+    Returns:
+        List of ExtractedContent objects
+    """
+    try:
+        extracted_content = list(_iter_pdf_content(file_source, filename))
+    except ValueError:
+        raise
+    except Exception as e:
+        logger.error(f"Error extracting from PDF {filename}: {e}")
+        raise ValueError(f"Failed to process PDF file {filename}: {e}")
+
+    logger.info(f"Extracted {len(extracted_content)} pages from {filename}")
+    return extracted_content
+
+
+def _extract_document_in_worker(
+    file_source: Union[Path, bytes],
+    filename: str,
+    file_type: str
+) -> List[ExtractedContent]:
+    """
+    Extract a document inside an extraction pool worker process.
+
+    Args:
+        file_source: Path to file or raw file bytes
+        filename: Original filename for metadata
+        file_type: File type ("pptx" or "pdf")
+
+    Returns:
+        List of extracted content from the document
+    """
+    if isinstance(file_source, bytes):
+        file_source = BytesIO(file_source)
+
+    if file_type == "pptx":
+        return _extract_powerpoint_content(file_source, filename)
+    return _extract_pdf_content(file_source, filename)
+
+
+def _extract_pdf_shard_in_worker(
+    file_source: Union[Path, bytes],
+    filename: str,
+    start_page: int,
+    end_page: int
+) -> List[ExtractedContent]:
+    """
+    Extract a page range of a PDF inside an extraction pool worker process.
+
+    Each worker opens its own PdfReader, so shards of one document run in parallel.
+
+    Args:
+        file_source: Path to file or raw file bytes
+        filename: Original filename for metadata
+        start_page: Index of the first page to extract (0-based)
+        end_page: Index after the last page to extract
+
+    Returns:
+        List of extracted content for the pages in the shard
+    """
+    if isinstance(file_source, bytes):
+        file_source = BytesIO(file_source)
+
+    return list(_iter_pdf_content(file_source, filename, start_page, end_page))
+
+
+def _count_pdf_pages(file_source: Union[Path, bytes]) -> int:
+    """
+    Count the pages of a PDF without extracting any text.
+
+    Args:
+        file_source: Path to file or raw file bytes
+
+    Returns:
+        Number of pages, or 0 if the PDF cannot be read
+    """
+    if isinstance(file_source, bytes):
+        file_source = BytesIO(file_source)
+
+    try:
+        with ExitStack() as stack:
+            return len(_open_pdf_reader(file_source, stack).pages)
+    except Exception:
+        # Let the regular extraction path report the error
+        return 0
+
 
 class DocumentProcessor:
     """
     Processor for extracting text content from PowerPoint and PDF files.
-    
+
     Handles both file paths and BytesIO objects (for Streamlit uploads).
+    CPU-bound extraction runs in a shared process pool when
+    settings.extraction_workers is greater than zero.
     """
 
-    def __init__(self) -> None:
-        """Initialize the document processor."""
+    def __init__(
+        self,
+        use_process_pool: Optional[bool] = None,
+        use_cache: Optional[bool] = None
+    ) -> None:
+        """
+        Initialize the document processor.
+
+        Args:
+            use_process_pool: Run extraction in worker processes
+                (defaults to settings.extraction_workers > 0)
+            use_cache: Cache extracted content on disk by file hash
+                (defaults to settings.extraction_cache_enabled)
+        """
         self.supported_extensions = {".pptx", ".pdf"}
+        self.use_process_pool = (
+            settings.extraction_workers > 0 if use_process_pool is None else use_process_pool
+        )
+
+        if use_cache is None:
+            use_cache = settings.extraction_cache_enabled
+        self.cache: Optional[DiskCache] = None
+        if use_cache:
+            self.cache = DiskCache(
+                settings.extraction_cache_dir,
+                max_size_bytes=settings.extraction_cache_max_mb * 1024 * 1024,
+                suffix=".json"
+            )
 
     async def process_document(
         self,
         file_source: Union[Path, BytesIO],
         filename: str,
-        file_type: str
+        file_type: str,
+        file_hash: Optional[str] = None
     ) -> List[ExtractedContent]:
         """
         Process a document and extract its content.
@@ -43,6 +500,7 @@ class DocumentProcessor:
             file_source: Path to file or BytesIO object with file content
             filename: Original filename for metadata
             file_type: File type ("pptx" or "pdf")
+            file_hash: Optional digest from hash_file_source, saves hashing the file again
 
         Returns:
             List of extracted content from the document
@@ -57,89 +515,368 @@ class DocumentProcessor:
             raise ValueError(f"Unsupported file type: {file_type}")
 
         try:
-            if file_type == "pptx":
-                return await self._extract_from_powerpoint(file_source, filename)
-            elif file_type == "pdf":
-                return await self._extract_from_pdf(file_source, filename)
+            cache_key = None
+            if self.cache is not None:
+                cache_key = await self._get_cache_key(file_source, file_type, file_hash)
+                cached_content = self._load_cached_content(cache_key, filename)
+                if cached_content is not None:
+                    logger.info(f"Loaded {len(cached_content)} cached items for {filename}")
+                    return cached_content
+
+            if self.use_process_pool:
+                content = await self._extract_in_pool(file_source, filename, file_type)
+            elif file_type == "pptx":
+                content = await self._extract_from_powerpoint(file_source, filename)
+            else:
+                content = await self._extract_from_pdf(file_source, filename)
+
+            if cache_key is not None:
+                self._store_cached_content(cache_key, content)
+
+            return content
+
         except Exception as e:
             logger.error(f"Failed to process {filename}: {e}")
             raise
 
-    async def _extract_from_powerpoint(
+    async def aiter_document(
+        self,
+        file_source: Union[Path, BytesIO],
+        filename: str,
+        file_type: str,
+        max_items: Optional[int] = None,
+        file_hash: Optional[str] = None
+    ) -> AsyncIterator[ExtractedContent]:
+        """
+        Extract a document incrementally, yielding each slide or page as it is decoded.
+
+        Args:
+            file_source: Path to file or BytesIO object with file content
+            filename: Original filename for metadata
+            file_type: File type ("pptx" or "pdf")
+            max_items: Optional budget - stop after this many extracted items
+            file_hash: Optional digest from hash_file_source, saves hashing the file again
+
+        Yields:
+            ExtractedContent items in slide/page order
+
+        Raises:
+            ValueError: If file type is not supported or the file is invalid
+        """
+        file_type = file_type.lower()
+
+        if file_type not in ["pptx", "pdf"]:
+            raise ValueError(f"Unsupported file type: {file_type}")
+
+        cache_key = None
+        if self.cache is not None:
+            cache_key = await self._get_cache_key(file_source, file_type, file_hash)
+            cached_content = self._load_cached_content(cache_key, filename)
+            if cached_content is not None:
+                for item in cached_content[:max_items]:
+                    yield item
+                return
+
+        shards = None
+        if file_type == "pdf" and self.use_process_pool:
+            worker_source = self._to_worker_source(file_source)
+            shards = await self._plan_pdf_shards(worker_source, filename)
+
+        if shards:
+            items = self._aiter_pdf_shards(worker_source, filename, shards)
+        else:
+            items = self._aiter_in_process(file_source, filename, file_type)
+
+        extracted_content = []
+        exhausted = False
+
+        try:
+            while max_items is None or len(extracted_content) < max_items:
+                item = await anext(items, None)
+                if item is None:
+                    exhausted = True
+                    break
+
+                extracted_content.append(item)
+                yield item
+        except Exception as e:
+            logger.error(f"Failed to process {filename}: {e}")
+            raise
+        finally:
+            await items.aclose()
+
+        logger.info(f"Streamed {len(extracted_content)} items from {filename}")
+
+        # Only complete extractions are cacheable
+        if exhausted and cache_key is not None:
+            self._store_cached_content(cache_key, extracted_content)
+
+    async def _aiter_in_process(
         self,
         file_source: Union[Path, BytesIO],
+        filename: str,
+        file_type: str
+    ) -> AsyncIterator[ExtractedContent]:
+        """
+        Stream a document from an in-process generator without blocking the event loop.
+
+        Args:
+            file_source: Path to file or BytesIO object
+            filename: Original filename for metadata
+            file_type: File type ("pptx" or "pdf")
+
+        Yields:
+            ExtractedContent items in slide/page order
+        """
+        if file_type == "pptx":
+            iterator = _iter_powerpoint_content(file_source, filename)
+        else:
+            iterator = _iter_pdf_content(file_source, filename)
+
+        loop = asyncio.get_running_loop()
+
+        try:
+            while True:
+                # Decode the next slide/page off the event loop
+                item = await loop.run_in_executor(None, next, iterator, None)
+                if item is None:
+                    return
+                yield item
+        finally:
+            try:
+                iterator.close()
+            except ValueError:
+                # Generator still running in the executor after cancellation
+                pass
+
+    async def _plan_pdf_shards(
+        self,
+        worker_source: Union[Path, bytes],
+        filename: str
+    ) -> Optional[List[Tuple[int, int]]]:
+        """
+        Decide whether a PDF is large enough for page-parallel extraction.
+
+        Args:
+            worker_source: Path to file or raw file bytes
+            filename: Original filename for metadata
+
+        Returns:
+            List of (start_page, end_page) shards, or None to extract serially
+        """
+        loop = asyncio.get_running_loop()
+        page_count = await loop.run_in_executor(None, _count_pdf_pages, worker_source)
+
+        if page_count < settings.pdf_parallel_page_threshold:
+            return None
+
+        shard_size = settings.pdf_shard_pages
+        shards = [
+            (start, min(start + shard_size, page_count))
+            for start in range(0, page_count, shard_size)
+        ]
+        logger.info(f"Extracting {page_count} pages of {filename} in {len(shards)} shards")
+        return shards
+
+    async def _aiter_pdf_shards(
+        self,
+        worker_source: Union[Path, bytes],
+        filename: str,
+        shards: List[Tuple[int, int]]
+    ) -> AsyncIterator[ExtractedContent]:
+        """
+        Extract PDF page shards in the process pool and yield pages in order.
+
+        Args:
+            worker_source: Path to file or raw file bytes
+            filename: Original filename for metadata
+            shards: List of (start_page, end_page) ranges
+
+        Yields:
+            ExtractedContent items in page order
+        """
+        loop = asyncio.get_running_loop()
+        pool = _get_extraction_pool()
+
+        # Submit every shard up front; results are merged back in page order
+        futures = [
+            loop.run_in_executor(
+                pool, _extract_pdf_shard_in_worker, worker_source, filename, start, end
+            )
+            for start, end in shards
+        ]
+
+        try:
+            for future, (start, end) in zip(futures, shards):
+                try:
+                    shard_content = await future
+                except BrokenProcessPool:
+                    # A crashed worker poisons the pool - recreate it next time and extract inline
+                    logger.warning(
+                        f"Extraction pool broken while processing {filename}, "
+                        f"retrying pages {start + 1}-{end} in-process"
+                    )
+                    _discard_broken_extraction_pool(pool)
+                    shard_content = await loop.run_in_executor(
+                        None, _extract_pdf_shard_in_worker, worker_source, filename, start, end
+                    )
+
+                for item in shard_content:
+                    yield item
+        finally:
+            for future in futures:
+                future.cancel()
+
+    async def _get_cache_key(
+        self,
+        file_source: Any,
+        file_type: str,
+        file_hash: Optional[str] = None
+    ) -> str:
+        """
+        Build the extraction cache key for a document.
+
+        Args:
+            file_source: Path, BytesIO or file-like object
+            file_type: File type ("pptx" or "pdf")
+            file_hash: Optional precomputed digest of the file bytes
+
+        Returns:
+            Key combining the SHA-256 of the file bytes and the extractor version
+        """
+        if file_hash is None:
+            # Hash in a thread so large uploads do not block the event loop
+            file_hash = await asyncio.to_thread(hash_file_source, file_source)
+        return f"{file_hash}-{file_type}-v{EXTRACTOR_VERSION}"
+
+    def _load_cached_content(
+        self,
+        cache_key: str,
         filename: str
+    ) -> Optional[List[ExtractedContent]]:
+        """
+        Load extracted content from the cache.
+
+        Args:
+            cache_key: Extraction cache key
+            filename: Filename to report as the content source
+
+        Returns:
+            Cached content or None on a cache miss
+        """
+        data = self.cache.get(cache_key)
+        if data is None:
+            return None
+
+        try:
+            items = json.loads(data)
+            # The same bytes may be uploaded under a different name
+            return [
+                ExtractedContent.model_validate({**item, "source_file": filename})
+                for item in items
+            ]
+        except (ValueError, TypeError) as e:
+            logger.warning(f"Discarding corrupt extraction cache entry {cache_key}: {e}")
+            self.cache.delete(cache_key)
+            return None
+
+    def _store_cached_content(
+        self,
+        cache_key: str,
+        content: List[ExtractedContent]
+    ) -> None:
+        """
+        Store extracted content in the cache.
+
+        Args:
+            cache_key: Extraction cache key
+            content: Extracted content to store
+        """
+        try:
+            data = json.dumps([item.model_dump() for item in content]).encode("utf-8")
+            self.cache.set(cache_key, data)
+        except OSError as e:
+            # Caching is an optimization - never fail extraction because of it
+            logger.warning(f"Failed to write extraction cache entry {cache_key}: {e}")
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """
+        Get extraction cache statistics.
+
+        Returns:
+            Dictionary with cache hit/miss counters, or disabled marker
+        """
+        if self.cache is None:
+            return {"enabled": False}
+        return {"enabled": True, **self.cache.get_stats()}
+
+    async def _extract_in_pool(
+        self,
+        file_source: Union[Path, BytesIO],
+        filename: str,
+        file_type: str
     ) -> List[ExtractedContent]:
         """
-        Extract text content from PowerPoint file.
+        Extract a document in the shared process pool.
 
         Args:
             file_source: Path to file or BytesIO object
             filename: Original filename for metadata
+            file_type: File type ("pptx" or "pdf")
 
         Returns:
             List of ExtractedContent objects
         """
-        try:
-            # PATTERN: Use python-pptx with careful error handling
-            presentation = Presentation(file_source)
-            extracted_content = []
+        worker_source = self._to_worker_source(file_source)
+        loop = asyncio.get_running_loop()
 
-            for slide_num, slide in enumerate(presentation.slides, 1):
-                # GOTCHA: Handle different slide layouts safely
-                title = ""
-                content = ""
+        if file_type == "pdf":
+            shards = await self._plan_pdf_shards(worker_source, filename)
+            if shards:
+                return [
+                    item async for item in self._aiter_pdf_shards(worker_source, filename, shards)
+                ]
 
-                # CRITICAL: Use try-except for placeholder access
-                try:
-                    if slide.shapes.title:
-                        title = slide.shapes.title.text.strip()
-                except AttributeError:
-                    title = f"Slide {slide_num}"
+        pool = _get_extraction_pool()
+        try:
+            return await loop.run_in_executor(
+                pool, _extract_document_in_worker, worker_source, filename, file_type
+            )
+        except BrokenProcessPool:
+            # A crashed worker poisons the pool - recreate it next time and extract inline
+            logger.warning(f"Extraction pool broken while processing {filename}, retrying in-process")
+            _discard_broken_extraction_pool(pool)
+            # GOTCHA: Still off the event loop - a full extraction would stall every request
+            return await asyncio.to_thread(_extract_document_in_worker, worker_source, filename, file_type)
+
+    def _to_worker_source(self, file_source: Any) -> Union[Path, bytes]:
+        """
+        Convert a file source into a picklable form for worker processes.
 
-                # Extract text from all text shapes
-                text_content = []
-                for shape in slide.shapes:
-                    if hasattr(shape, "text") and shape.text.strip():
-                        text_content.append(shape.text.strip())
+        Args:
+            file_source: Path, BytesIO or file-like object
 
-                content = "\n".join(text_content)
+        Returns:
+            Path for files on disk, raw bytes for in-memory sources
+        """
+        if isinstance(file_source, (str, Path)):
+            return Path(file_source)
+        if isinstance(file_source, BytesIO):
+            return file_source.getvalue()
 
-                # Get layout name safely
-                layout_type = "unknown"
-                try:
-                    layout_type = slide.slide_layout.name
-                except AttributeError:
-                    layout_type = f"layout_{slide.slide_layout_id}"
-
-                # Only add slides with meaningful content
-                if content.strip() or title.strip():
-                    extracted_content.append(ExtractedContent(
-                        slide_number=slide_num,
-                        title=title or f"Slide {slide_num}",
-                        content=content,
-                        layout_type=layout_type,
-                        source_file=filename,
-                        file_type="pptx"
-                    ))
-
-            logger.info(f"Extracted {len(extracted_content)} slides from {filename}")
-            return extracted_content
-
-        except PackageNotFoundError:
-            logger.error(f"Invalid PowerPoint file: {filename}")
-            raise ValueError(f"File {filename} is not a valid PowerPoint presentation")
-        except Exception as e:
-            logger.error(f"Error extracting from PowerPoint {filename}: {e}")
-            raise
+        # Generic file-like object (e.g. Streamlit UploadedFile)
+        file_source.seek(0)
+        data = file_source.read()
+        file_source.seek(0)
+        return data
 
-    async def _extract_from_pdf(
+    async def _extract_from_powerpoint(
         self,
         file_source: Union[Path, BytesIO],
         filename: str
     ) -> List[ExtractedContent]:
         """
-        Extract text content from PDF file.
+        Extract text content from PowerPoint file.
 
         Args:
             file_source: Path to file or BytesIO object
@@ -148,57 +885,24 @@ class DocumentProcessor:
         Returns:
             List of ExtractedContent objects
         """
-        try:
-            # Handle BytesIO vs Path
-            if isinstance(file_source, BytesIO):
-                pdf_reader = pypdf.PdfReader(file_source)
-            else:
-                pdf_reader = pypdf.PdfReader(str(file_source))
+        return _extract_powerpoint_content(file_source, filename)
 
-            extracted_content = []
+    async def _extract_from_pdf(
+        self,
+        file_source: Union[Path, BytesIO],
+        filename: str
+    ) -> List[ExtractedContent]:
+        """
+        Extract text content from PDF file.
 
-            for page_num, page in enumerate(pdf_reader.pages, 1):
-                try:
-                    # Extract text from page
-                    text = page.extract_text()
-                    
-                    if not text.strip():
-                        continue
-
-                    # Try to extract a title from the first line or first few words
-                    lines = text.strip().split('\n')
-                    title = ""
-                    content = text.strip()
-
-                    if lines:
-                        # Use first non-empty line as title if it's short enough
-                        first_line = lines[0].strip()
-                        if len(first_line) <= 100 and len(lines) > 1:
-                            title = first_line
-                            content = '\n'.join(lines[1:]).strip()
-                        else:
-                            # Use page number as title
-                            title = f"Page {page_num}"
-
-                    extracted_content.append(ExtractedContent(
-                        slide_number=page_num,
-                        title=title or f"Page {page_num}",
-                        content=content,
-                        layout_type="pdf_page",
-                        source_file=filename,
-                        file_type="pdf"
-                    ))
-
-                except Exception as e:
-                    logger.warning(f"Error extracting page {page_num} from {filename}: {e}")
-                    continue
-
-            logger.info(f"Extracted {len(extracted_content)} pages from {filename}")
-            return extracted_content
+        Args:
+            file_source: Path to file or BytesIO object
+            filename: Original filename for metadata
 
-        except Exception as e:
-            logger.error(f"Error extracting from PDF {filename}: {e}")
-            raise ValueError(f"Failed to process PDF file {filename}: {e}")
+        Returns:
+            List of ExtractedContent objects
+        """
+        return _extract_pdf_content(file_source, filename)
 
     def validate_file_type(self, filename: str) -> bool:
         """
@@ -239,22 +943,32 @@ class DocumentProcessor:
         """
         Process multiple documents concurrently.
 
+        One task is started per document; with the process pool enabled the
+        extraction stage takes as long as the slowest document rather than
+        the sum of all of them.
+
         Args:
             documents: List of tuples (file_source, filename, file_type)
 
         Returns:
-            Combined list of all extracted content
+            Combined list of all extracted content, in input order
         """
+        results = await asyncio.gather(
+            *(
+                self.process_document(file_source, filename, file_type)
+                for file_source, filename, file_type in documents
+            ),
+            return_exceptions=True
+        )
+
         all_content = []
-        
-        for file_source, filename, file_type in documents:
-            try:
-                content = await self.process_document(file_source, filename, file_type)
-                all_content.extend(content)
-            except Exception as e:
-                logger.error(f"Failed to process {filename}: {e}")
+
+        for (_, filename, _), result in zip(documents, results):
+            if isinstance(result, BaseException):
+                logger.error(f"Failed to process {filename}: {result}")
                 # Continue processing other documents
                 continue
+            all_content.extend(result)
 
         logger.info(f"Processed {len(documents)} documents, extracted {len(all_content)} content items")
         return all_content
@@ -302,4 +1016,4 @@ async def extract_text_from_pdf(file_path: Path) -> List[ExtractedContent]:
         List of extracted content
     """
     processor = DocumentProcessor()
-    return await processor._extract_from_pdf(file_path, file_path.name)
\ No newline at end of file
+    return await processor._extract_from_pdf(file_path, file_path.name)
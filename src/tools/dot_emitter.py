@@ -0,0 +1,209 @@
+"""
+Direct DOT emission for architecture diagrams.
+
+The diagrams library builds a Python object per node, assembles a
+graphviz.Digraph and writes it to disk before shelling out to Graphviz.
+This module compiles a DiagramSpec straight to DOT text with the same
+default attributes as the library and pipes it into a single dot
+invocation, so both engines produce the same image.
+"""
+
+import importlib.util
+import logging
+import os
+import re
+import subprocess
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# CRITICAL: Mirror diagrams.Diagram, Node and Edge defaults so the engines match
+DOT_DEFAULT_GRAPH_ATTRS = {
+    "pad": "2.0",
+    "splines": "ortho",
+    "nodesep": "0.60",
+    "ranksep": "0.75",
+    "fontname": "Sans-Serif",
+    "fontsize": "15",
+    "fontcolor": "#2D3436",
+}
+DOT_DEFAULT_NODE_ATTRS = {
+    "shape": "box",
+    "style": "rounded",
+    "fixedsize": "true",
+    "width": "1.4",
+    "height": "1.4",
+    "labelloc": "b",
+    "imagescale": "true",
+    "fontname": "Sans-Serif",
+    "fontsize": "13",
+    "fontcolor": "#2D3436",
+}
+DOT_DEFAULT_EDGE_ATTRS = {
+    "color": "#7B8894",
+}
+DOT_DEFAULT_CONNECTION_ATTRS = {
+    "fontcolor": "#2D3436",
+    "fontname": "Sans-Serif",
+    "fontsize": "13",
+}
+
+# Default node height of icon nodes (diagrams.Node._height)
+DEFAULT_ICON_HEIGHT = 1.9
+
+VALID_DIRECTIONS = {"TB", "BT", "LR", "RL"}
+VALID_CURVESTYLES = {"ortho", "curved"}
+
+_UNESCAPED_QUOTE = re.compile(r'(?<!\\)"')
+
+
+@lru_cache(maxsize=1)
+def _diagrams_resources_root() -> Optional[Path]:
+    """
+    Locate the directory the diagrams library resolves icon paths against.
+
+    Returns:
+        Parent directory of the diagrams package, or None if it is not installed
+    """
+    spec = importlib.util.find_spec("diagrams")
+    if spec is None or not spec.submodule_search_locations:
+        return None
+    return Path(os.path.abspath(list(spec.submodule_search_locations)[0])).parent
+
+
+def resolve_icon_path(icon_class: Any) -> Optional[str]:
+    """
+    Resolve the icon image of a diagrams node class without instantiating it.
+
+    Args:
+        icon_class: diagrams node class (e.g. diagrams.aws.compute.Lambda)
+
+    Returns:
+        Absolute icon path, or None if the class has no icon
+    """
+    icon = getattr(icon_class, "_icon", None)
+    icon_dir = getattr(icon_class, "_icon_dir", None)
+    root = _diagrams_resources_root()
+    if not icon or not icon_dir or root is None:
+        return None
+    return os.path.join(root, icon_dir, icon)
+
+
+def quote(value: Any) -> str:
+    """
+    Quote a DOT identifier or attribute value.
+
+    Args:
+        value: Value to quote
+
+    Returns:
+        Double-quoted DOT string
+    """
+    # Like the graphviz package, keep backslash escapes (e.g. \n, \l) intact
+    text = _UNESCAPED_QUOTE.sub(r'\\"', str(value))
+    return f'"{text}"'
+
+
+def _attr_list(attrs: Dict[str, Any], label_first: bool = False) -> str:
+    """
+    Format an attribute list in the order the graphviz package emits.
+
+    Args:
+        attrs: Attribute names and values
+        label_first: Emit the label before the sorted remaining attributes
+            (node and edge statements)
+
+    Returns:
+        DOT attribute list such as [a="1" b="2"]
+    """
+    items = sorted(attrs.items(), key=lambda item: (not (label_first and item[0] == "label"), item[0]))
+    return "[" + " ".join(f"{name}={quote(value)}" for name, value in items) + "]"
+
+
+def compile_dot(
+    name: str,
+    direction: str,
+    curvestyle: str,
+    graph_attr: Dict[str, Any],
+    node_attr: Dict[str, Any],
+    edge_attr: Dict[str, Any],
+    nodes: Iterable[Tuple[str, Dict[str, Any]]],
+    edges: Iterable[Tuple[str, str, Dict[str, Any]]],
+    strict: bool = False
+) -> str:
+    """
+    Compile a diagram to DOT source.
+
+    Args:
+        name: Diagram name, used as graph name and label
+        direction: Rank direction (TB, BT, LR or RL)
+        curvestyle: Edge routing (ortho or curved)
+        graph_attr: Graph attributes overriding the defaults
+        node_attr: Node attributes overriding the defaults
+        edge_attr: Edge attributes overriding the defaults
+        nodes: (node id, attributes including label) pairs in declaration order
+        edges: (source id, target id, attributes) triples in declaration order
+        strict: Whether Graphviz should merge multi-edges
+
+    Returns:
+        DOT source text
+
+    Raises:
+        ValueError: If the direction or curve style is invalid
+    """
+    if direction.upper() not in VALID_DIRECTIONS:
+        raise ValueError(f'"{direction}" is not a valid direction')
+    if curvestyle.lower() not in VALID_CURVESTYLES:
+        raise ValueError(f'"{curvestyle}" is not a valid curvestyle')
+
+    graph_attrs = {
+        **DOT_DEFAULT_GRAPH_ATTRS,
+        "label": name,
+        "rankdir": direction,
+        "splines": curvestyle,
+        **graph_attr,
+    }
+
+    lines: List[str] = [
+        f"{'strict ' if strict else ''}digraph {quote(name)} {{",
+        f"\tgraph {_attr_list(graph_attrs)}",
+        f"\tnode {_attr_list({**DOT_DEFAULT_NODE_ATTRS, **node_attr})}",
+        f"\tedge {_attr_list({**DOT_DEFAULT_EDGE_ATTRS, **edge_attr})}",
+    ]
+    lines.extend(f"\t{quote(node_id)} {_attr_list(attrs, label_first=True)}" for node_id, attrs in nodes)
+    lines.extend(
+        f"\t{quote(source)} -> {quote(target)} {_attr_list(attrs, label_first=True)}"
+        for source, target, attrs in edges
+    )
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+
+def render_dot(source: str, output_file: str) -> None:
+    """
+    Render DOT source to a PNG with a single dot invocation.
+
+    Args:
+        source: DOT source text
+        output_file: PNG output path
+
+    Raises:
+        ValueError: If the dot executable is missing
+        RuntimeError: If dot reports an error
+    """
+    try:
+        subprocess.run(
+            ["dot", "-Kdot", "-Tpng", "-o", output_file],
+            input=source.encode("utf-8"),
+            capture_output=True,
+            check=True
+        )
+    except FileNotFoundError as e:
+        raise ValueError(
+            "Graphviz 'dot' executable not found, make sure Graphviz is on your PATH"
+        ) from e
+    except subprocess.CalledProcessError as e:
+        stderr = e.stderr.decode("utf-8", errors="replace").strip()
+        raise RuntimeError(f"dot exited with code {e.returncode}: {stderr}") from e
@@ -6,7 +6,6 @@ for the PowerPoint Assistant Streamlit application.
 """
 
 import logging
-from io import BytesIO
 from typing import Dict, List, Optional, Tuple
 
 import streamlit as st
@@ -14,6 +13,7 @@ import streamlit as st
 from ..config.settings import settings
 from ..models.data_models import ExtractedContent, FileUploadInfo, ProcessingStatus
 from .document_processor import DocumentProcessor
+from .upload_spool import cleanup_spooled_uploads, release_spooled_upload, spool_upload
 
 logger = logging.getLogger(__name__)
 
@@ -30,6 +30,9 @@ class FileUploadHandler:
         self.document_processor = DocumentProcessor()
         self.session_key = "uploaded_files_info"
         self.content_key = "extracted_content"
+
+        # Remove spooled uploads left behind by earlier sessions
+        cleanup_spooled_uploads()
         
         # Initialize session state if needed
         if self.session_key not in st.session_state:
@@ -219,16 +222,30 @@ class FileUploadHandler:
                     logger.warning(f"Skipping unsupported file: {uploaded_file.name}")
                     continue
 
-                # Convert uploaded file to BytesIO
-                file_content = BytesIO(uploaded_file.read())
-                
-                # Reset file pointer for potential re-reading
-                uploaded_file.seek(0)
-
-                # Process the document
-                content = await self.document_processor.process_document(
-                    file_content, uploaded_file.name, file_type
-                )
+                # CRITICAL: Spool large uploads to disk instead of copying them into memory
+                file_content = spool_upload(uploaded_file, uploaded_file.name)
+
+                # Stream the document so progress advances slide by slide
+                content = []
+                try:
+                    async for item in self.document_processor.aiter_document(
+                        file_content,
+                        uploaded_file.name,
+                        file_type,
+                        max_items=settings.extraction_item_budget
+                    ):
+                        content.append(item)
+
+                        if show_progress:
+                            status_text.text(
+                                f"Processing {uploaded_file.name}... ({i+1}/{total_files}) "
+                                f"- {len(content)} items extracted"
+                            )
+                finally:
+                    release_spooled_upload(file_content)
+
+                    # Reset file pointer for potential re-reading
+                    uploaded_file.seek(0)
                 
                 all_content.extend(content)
                 
@@ -0,0 +1,341 @@
+"""
+Persistent LLM response cache shared by all chains.
+
+Regenerating a deck with identical inputs, or retrying after a failure
+further down the pipeline, used to pay for every LLM round trip again.
+This module wraps the ``prompt | llm`` runnables of the chains with a
+disk-backed cache keyed on the model, the temperature and the fully
+rendered prompt. Entries expire after a configurable TTL and the cache
+directory is bounded in size with LRU eviction.
+"""
+
+import hashlib
+import json
+import logging
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+from langchain_core.messages import AIMessage
+
+from ..config.settings import settings
+from .disk_cache import DiskCache
+
+logger = logging.getLogger(__name__)
+
+# Bump whenever the entry format changes so stale entries are ignored
+LLM_CACHE_FORMAT_VERSION = 1
+
+# Chains that can be cached, each with its own settings.llm_cache_<name> flag
+CACHEABLE_CHAINS = (
+    "document_analysis",
+    "project_analysis",
+    "content_generation",
+    "diagram_generation",
+)
+
+
+class LLMResponseCache:
+    """
+    Disk-backed cache of LLM response texts.
+
+    Hit/miss counters are tracked overall and per chain so the orchestrator
+    can report cache effectiveness.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        max_size_bytes: Optional[int] = None,
+        ttl_seconds: Optional[float] = None
+    ) -> None:
+        """
+        Initialize the LLM response cache.
+
+        Args:
+            cache_dir: Directory holding cache entries (defaults to settings.llm_cache_dir)
+            max_size_bytes: Maximum total size of all entries
+                (defaults to settings.llm_cache_max_mb)
+            ttl_seconds: Entry lifetime in seconds, 0 for no expiry
+                (defaults to settings.llm_cache_ttl_hours)
+        """
+        if max_size_bytes is None:
+            max_size_bytes = settings.llm_cache_max_mb * 1024 * 1024
+        if ttl_seconds is None:
+            ttl_seconds = settings.llm_cache_ttl_hours * 3600
+
+        self.store = DiskCache(
+            cache_dir or settings.llm_cache_dir,
+            max_size_bytes=max_size_bytes,
+            suffix=".json"
+        )
+        self.ttl_seconds = ttl_seconds
+
+        self._lock = threading.Lock()
+        self.expired = 0
+        self.chain_stats: Dict[str, Dict[str, int]] = {}
+
+    @staticmethod
+    def make_key(model: Any, temperature: Any, prompt: str) -> str:
+        """
+        Build the cache key for a rendered prompt.
+
+        Args:
+            model: Model name
+            temperature: Sampling temperature
+            prompt: Fully rendered prompt text
+
+        Returns:
+            Hex digest identifying the request
+        """
+        payload = json.dumps(
+            [LLM_CACHE_FORMAT_VERSION, str(model), str(temperature), prompt],
+            ensure_ascii=False
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str, chain_name: str = "default") -> Optional[str]:
+        """
+        Look up a cached response.
+
+        Args:
+            key: Cache key from make_key
+            chain_name: Name of the calling chain, for statistics
+
+        Returns:
+            Cached response text, or None on a miss or expired entry
+        """
+        content = None
+        data = self.store.get(key)
+
+        if data is not None:
+            try:
+                entry = json.loads(data)
+                if self.ttl_seconds and time.time() - entry["created_at"] > self.ttl_seconds:
+                    self.store.delete(key)
+                    with self._lock:
+                        self.expired += 1
+                else:
+                    content = entry["content"]
+            except (ValueError, KeyError, TypeError) as e:
+                logger.warning(f"Discarding corrupt LLM cache entry {key[:12]}: {e}")
+                self.store.delete(key)
+
+        with self._lock:
+            stats = self._chain_counters(chain_name)
+            stats["hits" if content is not None else "misses"] += 1
+
+        return content
+
+    def record_rejected(self, chain_name: str = "default") -> None:
+        """
+        Count a response that failed validation and was not cached.
+
+        Args:
+            chain_name: Name of the calling chain, for statistics
+        """
+        with self._lock:
+            self._chain_counters(chain_name)["rejected"] += 1
+
+    def _chain_counters(self, chain_name: str) -> Dict[str, int]:
+        """Get the counters of a chain; callers must hold self._lock."""
+        return self.chain_stats.setdefault(chain_name, {"hits": 0, "misses": 0, "rejected": 0})
+
+    def set(self, key: str, content: str) -> None:
+        """
+        Store a response.
+
+        Args:
+            key: Cache key from make_key
+            content: Response text
+        """
+        entry = {"created_at": time.time(), "content": content}
+        try:
+            self.store.set(key, json.dumps(entry, ensure_ascii=False).encode("utf-8"))
+        except OSError as e:
+            # GOTCHA: A full or read-only cache directory must not fail generation
+            logger.warning(f"Failed to store LLM cache entry: {e}")
+
+    def clear(self) -> None:
+        """Remove all cache entries."""
+        self.store.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with overall and per-chain hit/miss/rejected counters
+        """
+        store_stats = self.store.get_stats()
+
+        with self._lock:
+            chains = {
+                name: {
+                    **counts,
+                    "hit_rate": (
+                        counts["hits"] / (counts["hits"] + counts["misses"])
+                        if counts["hits"] + counts["misses"] else 0.0
+                    ),
+                }
+                for name, counts in self.chain_stats.items()
+            }
+            hits = sum(counts["hits"] for counts in self.chain_stats.values())
+            misses = sum(counts["misses"] for counts in self.chain_stats.values())
+            rejected = sum(counts["rejected"] for counts in self.chain_stats.values())
+            expired = self.expired
+
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": hits / (hits + misses) if hits + misses else 0.0,
+            "rejected": rejected,
+            "expired": expired,
+            "evictions": store_stats["evictions"],
+            "size_bytes": store_stats["size_bytes"],
+            "max_size_bytes": store_stats["max_size_bytes"],
+            "chains": chains,
+        }
+
+
+class CachedLLMChain:
+    """
+    Drop-in replacement for a ``prompt | llm`` runnable with response caching.
+
+    Only ``ainvoke`` is cached; cache hits return an AIMessage so callers can
+    keep reading ``result.content``. Responses rejected by ``validate`` (e.g.
+    truncated or non-JSON output) are returned but not cached, so a retry
+    asks the LLM again instead of replaying the bad response.
+    """
+
+    def __init__(
+        self,
+        prompt: Any,
+        llm: Any,
+        chain_name: str,
+        cache: LLMResponseCache,
+        validate: Optional[Callable[[str], bool]] = None
+    ) -> None:
+        """
+        Initialize the cached chain.
+
+        Args:
+            prompt: PromptTemplate rendering the chain inputs
+            llm: Chat model invoked on cache misses
+            chain_name: Name of the chain, for statistics
+            cache: Response cache to use
+            validate: Optional check a response text must pass to be cached
+        """
+        self.prompt = prompt
+        self.llm = llm
+        self.chain_name = chain_name
+        self.cache = cache
+        self.validate = validate
+        self.runnable = prompt | llm
+
+    async def ainvoke(self, inputs: Dict[str, Any]) -> Any:
+        """
+        Invoke the chain, serving identical requests from the cache.
+
+        Args:
+            inputs: Prompt template variables
+
+        Returns:
+            LLM response message
+        """
+        rendered_prompt = self.prompt.format(**inputs)
+        key = LLMResponseCache.make_key(
+            getattr(self.llm, "model_name", None),
+            getattr(self.llm, "temperature", None),
+            rendered_prompt
+        )
+
+        cached_content = self.cache.get(key, self.chain_name)
+        if cached_content is not None:
+            logger.info(f"LLM cache hit for {self.chain_name}")
+            return AIMessage(content=cached_content)
+
+        result = await self.runnable.ainvoke(inputs)
+
+        content = result.content if hasattr(result, "content") else result
+        if isinstance(content, str) and self._is_cacheable(content):
+            self.cache.set(key, content)
+
+        return result
+
+    def _is_cacheable(self, content: str) -> bool:
+        """
+        Check whether a response may be cached.
+
+        Args:
+            content: Response text
+
+        Returns:
+            True if there is no validator or the response passes it
+        """
+        if self.validate is None:
+            return True
+        try:
+            valid = bool(self.validate(content))
+        except Exception as e:
+            logger.debug(f"LLM response validation raised for {self.chain_name}: {e}")
+            valid = False
+
+        if not valid:
+            self.cache.record_rejected(self.chain_name)
+            logger.warning(f"Not caching invalid LLM response for {self.chain_name}")
+        return valid
+
+
+_shared_cache: Optional[LLMResponseCache] = None
+_shared_cache_lock = threading.Lock()
+
+
+def get_llm_cache() -> LLMResponseCache:
+    """
+    Get the process-wide LLM response cache.
+
+    Returns:
+        Shared LLMResponseCache instance
+    """
+    global _shared_cache
+
+    with _shared_cache_lock:
+        if _shared_cache is None:
+            _shared_cache = LLMResponseCache()
+        return _shared_cache
+
+
+def get_llm_cache_stats() -> Optional[Dict[str, Any]]:
+    """
+    Get statistics of the process-wide LLM response cache.
+
+    Returns:
+        Cache statistics, or None if the cache has not been used
+    """
+    return _shared_cache.get_stats() if _shared_cache is not None else None
+
+
+# Convenience function used by the chains to build their runnables
+def build_llm_chain(
+    prompt: Any,
+    llm: Any,
+    chain_name: str,
+    validate: Optional[Callable[[str], bool]] = None
+) -> Any:
+    """
+    Build a ``prompt | llm`` runnable, cached if enabled for the chain.
+
+    Args:
+        prompt: PromptTemplate rendering the chain inputs
+        llm: Chat model
+        chain_name: One of CACHEABLE_CHAINS
+        validate: Optional check a response text must pass to be cached
+
+    Returns:
+        CachedLLMChain if caching is enabled for the chain, else the plain runnable
+    """
+    if settings.llm_cache_enabled and getattr(settings, f"llm_cache_{chain_name}", False):
+        return CachedLLMChain(prompt, llm, chain_name, get_llm_cache(), validate=validate)
+    return prompt | llm
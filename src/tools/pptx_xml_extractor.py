@@ -0,0 +1,384 @@
+"""
+Raw-XML text extractor for PowerPoint files.
+
+This module reads slide text straight from the .pptx zip package with an
+incremental lxml parse, skipping the python-pptx object model. Its output
+matches the python-pptx extraction path item for item; callers are expected
+to fall back to python-pptx if it raises.
+"""
+
+import logging
+import posixpath
+import zipfile
+from io import BytesIO
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+from lxml import etree
+
+from ..models.data_models import ExtractedContent
+
+logger = logging.getLogger(__name__)
+
+_NS_A = "http://schemas.openxmlformats.org/drawingml/2006/main"
+_NS_P = "http://schemas.openxmlformats.org/presentationml/2006/main"
+_NS_R = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+_NS_PKG_RELS = "http://schemas.openxmlformats.org/package/2006/relationships"
+_NS_CONTENT_TYPES = "http://schemas.openxmlformats.org/package/2006/content-types"
+
+_RT_OFFICE_DOCUMENT = f"{_NS_R}/officeDocument"
+_RT_SLIDE = f"{_NS_R}/slide"
+_RT_SLIDE_LAYOUT = f"{_NS_R}/slideLayout"
+
+# Same content types python-pptx accepts as a presentation main part
+_PRESENTATION_CONTENT_TYPES = {
+    "application/vnd.openxmlformats-officedocument.presentationml.presentation.main+xml",
+    "application/vnd.ms-powerpoint.presentation.macroEnabled.main+xml",
+}
+
+# Direct children of p:spTree that python-pptx treats as shapes
+_SHAPE_TAGS = [
+    f"{{{_NS_P}}}sp",
+    f"{{{_NS_P}}}grpSp",
+    f"{{{_NS_P}}}graphicFrame",
+    f"{{{_NS_P}}}cxnSp",
+    f"{{{_NS_P}}}pic",
+    f"{{{_NS_P}}}contentPart",
+]
+
+_TAG_SP = f"{{{_NS_P}}}sp"
+_TAG_SP_TREE = f"{{{_NS_P}}}spTree"
+_TAG_C_SLD = f"{{{_NS_P}}}cSld"
+_TAG_TX_BODY = f"{{{_NS_P}}}txBody"
+_TAG_NV_PR = f"{{{_NS_P}}}nvPr"
+_TAG_PH = f"{{{_NS_P}}}ph"
+_TAG_PARAGRAPH = f"{{{_NS_A}}}p"
+_TAG_RUN = f"{{{_NS_A}}}r"
+_TAG_BREAK = f"{{{_NS_A}}}br"
+_TAG_FIELD = f"{{{_NS_A}}}fld"
+_TAG_TEXT = f"{{{_NS_A}}}t"
+
+
+class PptxXmlExtractionError(Exception):
+    """Raised when a package does not have the structure the raw-XML extractor expects."""
+
+
+def _parse_xml(data: bytes) -> etree._Element:
+    """
+    Parse a small package part with the same options python-pptx uses.
+
+    Args:
+        data: Raw XML bytes
+
+    Returns:
+        Root element
+    """
+    # CRITICAL: Same blank-text handling as python-pptx so run text is identical
+    parser = etree.XMLParser(remove_blank_text=True, resolve_entities=False)
+    return etree.fromstring(data, parser)
+
+
+def _rels_path(partname: str) -> str:
+    """
+    Get the relationships part name for a package part.
+
+    Args:
+        partname: Zip member name of the source part (e.g. "ppt/slides/slide1.xml")
+
+    Returns:
+        Zip member name of its .rels part
+    """
+    directory, name = posixpath.split(partname)
+    return posixpath.join(directory, "_rels", f"{name}.rels")
+
+
+def _read_relationships(package: zipfile.ZipFile, partname: str) -> Dict[str, Tuple[str, str]]:
+    """
+    Read the internal relationships of a package part.
+
+    Args:
+        package: Open .pptx zip package
+        partname: Zip member name of the source part ("" for the package itself)
+
+    Returns:
+        Mapping of relationship ID to (relationship type, target member name)
+    """
+    rels_name = _rels_path(partname) if partname else "_rels/.rels"
+
+    try:
+        rels_root = _parse_xml(package.read(rels_name))
+    except KeyError:
+        return {}
+
+    base_dir = posixpath.dirname(partname)
+    relationships = {}
+    for rel in rels_root.iterchildren(f"{{{_NS_PKG_RELS}}}Relationship"):
+        if rel.get("TargetMode") == "External":
+            continue
+
+        target = rel.get("Target", "")
+        if target.startswith("/"):
+            target_name = posixpath.normpath(target.lstrip("/"))
+        else:
+            target_name = posixpath.normpath(posixpath.join(base_dir, target))
+
+        relationships[rel.get("Id")] = (rel.get("Type"), target_name)
+
+    return relationships
+
+
+def _content_type(package: zipfile.ZipFile, partname: str) -> Optional[str]:
+    """
+    Look up the content type of a package part.
+
+    Args:
+        package: Open .pptx zip package
+        partname: Zip member name of the part
+
+    Returns:
+        Content type or None if the part is not declared
+    """
+    types_root = _parse_xml(package.read("[Content_Types].xml"))
+
+    for override in types_root.iterchildren(f"{{{_NS_CONTENT_TYPES}}}Override"):
+        if override.get("PartName", "").lower() == f"/{partname}".lower():
+            return override.get("ContentType")
+
+    extension = posixpath.splitext(partname)[1].lstrip(".").lower()
+    for default in types_root.iterchildren(f"{{{_NS_CONTENT_TYPES}}}Default"):
+        if default.get("Extension", "").lower() == extension:
+            return default.get("ContentType")
+
+    return None
+
+
+def _find_slide_parts(package: zipfile.ZipFile) -> List[str]:
+    """
+    Resolve slide parts in presentation (slide-ID list) order.
+
+    Args:
+        package: Open .pptx zip package
+
+    Returns:
+        Zip member names of the slides
+
+    Raises:
+        PptxXmlExtractionError: If the package layout is not understood
+    """
+    main_parts = [
+        target for rel_type, target in _read_relationships(package, "").values()
+        if rel_type == _RT_OFFICE_DOCUMENT
+    ]
+    if not main_parts:
+        raise PptxXmlExtractionError("Package has no main document part")
+
+    presentation_name = main_parts[0]
+    if _content_type(package, presentation_name) not in _PRESENTATION_CONTENT_TYPES:
+        raise PptxXmlExtractionError(f"Main part {presentation_name} is not a presentation")
+
+    presentation_rels = _read_relationships(package, presentation_name)
+    presentation_root = _parse_xml(package.read(presentation_name))
+
+    slide_parts = []
+    sld_id_lst = presentation_root.find(f"{{{_NS_P}}}sldIdLst")
+    if sld_id_lst is not None:
+        for sld_id in sld_id_lst.iterchildren(f"{{{_NS_P}}}sldId"):
+            rel_type, target = presentation_rels[sld_id.get(f"{{{_NS_R}}}id")]
+            if rel_type != _RT_SLIDE:
+                raise PptxXmlExtractionError(f"sldId does not reference a slide: {target}")
+            slide_parts.append(target)
+
+    return slide_parts
+
+
+def _layout_name(
+    package: zipfile.ZipFile,
+    slide_part: str,
+    layout_names: Dict[str, str]
+) -> str:
+    """
+    Get the name of the layout a slide inherits from.
+
+    Args:
+        package: Open .pptx zip package
+        slide_part: Zip member name of the slide
+        layout_names: Per-package cache of layout part name to layout name
+
+    Returns:
+        Layout name ("" when the layout is unnamed, as in python-pptx)
+
+    Raises:
+        PptxXmlExtractionError: If the slide has no layout relationship
+    """
+    layout_parts = [
+        target for rel_type, target in _read_relationships(package, slide_part).values()
+        if rel_type == _RT_SLIDE_LAYOUT
+    ]
+    if not layout_parts:
+        raise PptxXmlExtractionError(f"Slide {slide_part} has no layout")
+
+    layout_part = layout_parts[0]
+    if layout_part not in layout_names:
+        name = ""
+        with package.open(layout_part) as layout_stream:
+            # Only the cSld start tag is needed - stop before the shape tree
+            for _, c_sld in etree.iterparse(
+                layout_stream, events=("start",), tag=_TAG_C_SLD, resolve_entities=False
+            ):
+                name = c_sld.get("name", "")
+                break
+        layout_names[layout_part] = name
+
+    return layout_names[layout_part]
+
+
+def _placeholder_idx(shape: etree._Element) -> Optional[int]:
+    """
+    Get the placeholder index of a shape element.
+
+    Args:
+        shape: Shape element (direct child of p:spTree)
+
+    Returns:
+        Placeholder idx (0 when omitted) or None if the shape is not a placeholder
+    """
+    # PATTERN: Mirrors python-pptx's "./*[1]/p:nvPr/p:ph" lookup
+    if len(shape) == 0:
+        return None
+
+    nv_pr = shape[0].find(_TAG_NV_PR)
+    if nv_pr is None:
+        return None
+
+    ph = nv_pr.find(_TAG_PH)
+    if ph is None:
+        return None
+
+    return int(ph.get("idx", "0"))
+
+
+def _shape_text(shape: etree._Element) -> str:
+    """
+    Get the text of an autoshape the way python-pptx's Shape.text does.
+
+    Args:
+        shape: p:sp element
+
+    Returns:
+        Paragraphs joined by newlines, line breaks as vertical tabs
+
+    Raises:
+        PptxXmlExtractionError: If a run is missing its required text element
+    """
+    tx_body = shape.find(_TAG_TX_BODY)
+    if tx_body is None:
+        return ""
+
+    paragraphs = []
+    for paragraph in tx_body.iterchildren(_TAG_PARAGRAPH):
+        parts = []
+        for child in paragraph.iterchildren(_TAG_RUN, _TAG_BREAK, _TAG_FIELD):
+            if child.tag == _TAG_BREAK:
+                parts.append("\v")
+                continue
+
+            text_elm = child.find(_TAG_TEXT)
+            if text_elm is None:
+                if child.tag == _TAG_RUN:
+                    raise PptxXmlExtractionError("Text run without a:t element")
+                continue
+            parts.append(text_elm.text or "")
+
+        paragraphs.append("".join(parts))
+
+    return "\n".join(paragraphs)
+
+
+def _extract_slide(
+    package: zipfile.ZipFile,
+    slide_part: str,
+    slide_num: int
+) -> Tuple[str, str]:
+    """
+    Extract title and body text from one slide with an incremental parse.
+
+    Args:
+        package: Open .pptx zip package
+        slide_part: Zip member name of the slide
+        slide_num: 1-based slide number
+
+    Returns:
+        Tuple of (title, content) matching the python-pptx extraction path
+    """
+    title: Optional[str] = None
+    text_content = []
+
+    with package.open(slide_part) as slide_stream:
+        for _, shape in etree.iterparse(
+            slide_stream,
+            events=("end",),
+            tag=_SHAPE_TAGS,
+            remove_blank_text=True,
+            resolve_entities=False
+        ):
+            parent = shape.getparent()
+            # Shapes nested in groups are handled with (and ignored like) their group
+            if parent is None or parent.tag != _TAG_SP_TREE:
+                continue
+            grandparent = parent.getparent()
+            if grandparent is None or grandparent.tag != _TAG_C_SLD:
+                continue
+
+            is_autoshape = shape.tag == _TAG_SP
+            text = _shape_text(shape) if is_autoshape else ""
+
+            # GOTCHA: First placeholder with idx 0 is the title, whatever its type
+            if title is None and _placeholder_idx(shape) == 0:
+                title = text.strip() if is_autoshape else f"Slide {slide_num}"
+
+            if is_autoshape and text.strip():
+                text_content.append(text.strip())
+
+            # Free processed shapes so memory stays bounded on large slides
+            shape.clear()
+            while shape.getprevious() is not None:
+                del parent[0]
+
+    return title or "", "\n".join(text_content)
+
+
+def iter_pptx_xml_content(
+    file_source: Union[Path, BytesIO],
+    filename: str
+) -> Iterator[ExtractedContent]:
+    """
+    Yield text content from PowerPoint file one slide at a time via raw XML.
+
+    Args:
+        file_source: Path to file or BytesIO object
+        filename: Original filename for metadata
+
+    Yields:
+        ExtractedContent for each slide with meaningful content
+
+    Raises:
+        Exception: Any error means the package should be re-read with python-pptx
+    """
+    with zipfile.ZipFile(file_source) as package:
+        slide_parts = _find_slide_parts(package)
+        layout_names: Dict[str, str] = {}
+
+        for slide_num, slide_part in enumerate(slide_parts, 1):
+            title, content = _extract_slide(package, slide_part, slide_num)
+            layout_type = _layout_name(package, slide_part, layout_names)
+
+            # Only add slides with meaningful content
+            if content.strip() or title.strip():
+                yield ExtractedContent(
+                    slide_number=slide_num,
+                    title=title or f"Slide {slide_num}",
+                    content=content,
+                    layout_type=layout_type,
+                    source_file=filename,
+                    file_type="pptx"
+                )
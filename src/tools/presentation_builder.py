@@ -7,8 +7,9 @@ using company templates with proper branding and formatting.
 
 import logging
 from datetime import datetime
+from io import BytesIO
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
 from ..config.settings import settings
 from ..models.data_models import (
@@ -40,22 +41,29 @@ class PresentationBuilder:
         """
         self.template_manager = TemplateManager(template_path)
         self.current_spec = None
+        # Results of the diagram slides added by the last build_presentation call
+        self.diagram_insertion_results: dict[str, any] = {}
+        # Presentation of the last build; edits patch it in place
+        self.presentation = None
 
     async def build_presentation(
         self,
         project: ProjectDescription,
         generation_result: ContentGenerationResult,
         output_filename: Optional[str] = None,
-        template_path: Optional[Path] = None
+        template_path: Optional[Path] = None,
+        diagrams: Optional[list[GeneratedDiagram]] = None
     ) -> Path:
         """
-        Build complete PowerPoint presentation.
+        Build complete PowerPoint presentation and save it to the output directory.
 
         Args:
             project: Project description and details
             generation_result: Generated content from content generation chain
             output_filename: Optional custom output filename
             template_path: Optional template file path
+            diagrams: Optional diagrams to add as dedicated slides; results
+                are stored in diagram_insertion_results
 
         Returns:
             Path to created presentation file
@@ -64,49 +72,156 @@ class PresentationBuilder:
             ValueError: If presentation building fails
         """
         try:
-            logger.info(f"Building presentation for {project.client_name}")
+            presentation = await self._assemble_presentation(
+                project, generation_result, output_filename, template_path, diagrams
+            )
 
-            # Generate output filename if not provided
-            if not output_filename:
-                output_filename = self._generate_output_filename(project)
+            # CRITICAL: The only serialization of the deck
+            created_path = self.template_manager.save_presentation(presentation, self.current_spec.output_path)
 
-            # Ensure output path has correct extension
-            if not output_filename.endswith('.pptx'):
-                output_filename += '.pptx'
+            logger.info(f"Successfully created presentation: {created_path}")
+            return created_path
 
-            # Create full output path
-            output_path = settings.output_dir / output_filename
+        except Exception as e:
+            logger.error(f"Failed to build presentation: {e}")
+            raise ValueError(f"Presentation building failed: {e}") from e
 
-            # Create presentation specification
-            presentation_spec = PresentationSpec(
-                project=project,
-                slides=generation_result.slides,
-                template_path=template_path or settings.template_path,
-                output_path=output_path
-            )
+    async def build_presentation_buffer(
+        self,
+        project: ProjectDescription,
+        generation_result: ContentGenerationResult,
+        output_filename: Optional[str] = None,
+        template_path: Optional[Path] = None,
+        diagrams: Optional[list[GeneratedDiagram]] = None
+    ) -> BytesIO:
+        """
+        Build complete PowerPoint presentation in memory.
 
-            # Store current spec for potential adjustments
-            self.current_spec = presentation_spec
+        Nothing is written to disk; use save_presentation_buffer() to
+        persist the deck later if needed.
 
-            # Validate template
-            is_valid, error_msg = self.template_manager.validate_template(presentation_spec.template_path)
-            if not is_valid:
-                logger.warning(f"Template validation failed: {error_msg}")
-                # Continue with default template handling
+        Args:
+            project: Project description and details
+            generation_result: Generated content from content generation chain
+            output_filename: Optional custom output filename
+            template_path: Optional template file path
+            diagrams: Optional diagrams to add as dedicated slides; results
+                are stored in diagram_insertion_results
 
-            # Create the presentation
-            created_path = self.template_manager.create_presentation_from_spec(presentation_spec)
+        Returns:
+            Buffer positioned at the start of the .pptx package; its name
+            attribute holds the output filename
 
-            # Add metadata and properties
-            self._set_presentation_properties(created_path, project, generation_result)
+        Raises:
+            ValueError: If presentation building fails
+        """
+        try:
+            presentation = await self._assemble_presentation(
+                project, generation_result, output_filename, template_path, diagrams
+            )
 
-            logger.info(f"Successfully created presentation: {created_path}")
-            return created_path
+            buffer = self.template_manager.serialize_presentation(presentation)
+            buffer.name = self.current_spec.output_path.name
+
+            logger.info(
+                f"Successfully built presentation in memory: {buffer.name} "
+                f"({buffer.getbuffer().nbytes / 1024:.0f} KB)"
+            )
+            return buffer
 
         except Exception as e:
             logger.error(f"Failed to build presentation: {e}")
             raise ValueError(f"Presentation building failed: {e}") from e
 
+    @staticmethod
+    def save_presentation_buffer(buffer: BytesIO, output_path: Optional[Path] = None) -> Path:
+        """
+        Persist a presentation built by build_presentation_buffer().
+
+        Args:
+            buffer: Presentation buffer
+            output_path: Optional output path (defaults to the buffer name
+                in the output directory)
+
+        Returns:
+            Path to saved presentation file
+        """
+        output_path = output_path or settings.output_dir / buffer.name
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output_path.write_bytes(buffer.getbuffer())
+
+        logger.info(f"Saved presentation: {output_path}")
+        return output_path
+
+    async def _assemble_presentation(
+        self,
+        project: ProjectDescription,
+        generation_result: ContentGenerationResult,
+        output_filename: Optional[str],
+        template_path: Optional[Path],
+        diagrams: Optional[list[GeneratedDiagram]]
+    ) -> Any:
+        """
+        Assemble the complete presentation in a single in-memory pass.
+
+        One Presentation object is kept through slide creation, core
+        properties and diagram slides; callers serialize it once.
+
+        Args:
+            project: Project description and details
+            generation_result: Generated content from content generation chain
+            output_filename: Optional custom output filename
+            template_path: Optional template file path
+            diagrams: Optional diagrams to add as dedicated slides
+
+        Returns:
+            Assembled PowerPoint presentation object
+        """
+        logger.info(f"Building presentation for {project.client_name}")
+
+        # Generate output filename if not provided
+        if not output_filename:
+            output_filename = self._generate_output_filename(project)
+
+        # Ensure output path has correct extension
+        if not output_filename.endswith('.pptx'):
+            output_filename += '.pptx'
+
+        # Create full output path
+        output_path = settings.output_dir / output_filename
+
+        # Create presentation specification
+        presentation_spec = PresentationSpec(
+            project=project,
+            slides=generation_result.slides,
+            template_path=template_path or settings.template_path,
+            output_path=output_path
+        )
+
+        # Store current spec for potential adjustments; the previous deck must
+        # not be paired with it if this build fails
+        self.current_spec = presentation_spec
+        self.presentation = None
+
+        # Create the presentation in memory
+        presentation = self.template_manager.build_presentation_from_spec(presentation_spec)
+
+        # PATTERN: Validate the template already loaded for the build, not a second copy
+        is_valid, error_msg = self.template_manager.validate_presentation(presentation)
+        if not is_valid:
+            logger.warning(f"Template validation failed: {error_msg}")
+            # Continue with default template handling
+
+        # Add metadata and properties
+        self._set_presentation_properties(presentation, project, generation_result)
+
+        # Add diagram slides to the same in-memory presentation
+        self.diagram_insertion_results = await self._add_diagram_slides(presentation, diagrams or [])
+
+        # Keep the deck for incremental edits; slide i of current_spec is deck slide i
+        self.presentation = presentation
+        return presentation
+
     def _generate_output_filename(self, project: ProjectDescription) -> str:
         """
         Generate appropriate output filename.
@@ -131,7 +246,7 @@ class PresentationBuilder:
 
     def _set_presentation_properties(
         self,
-        presentation_path: Path,
+        presentation: Any,
         project: ProjectDescription,
         generation_result: ContentGenerationResult
     ) -> None:
@@ -139,18 +254,13 @@ class PresentationBuilder:
         Set presentation properties and metadata.
 
         Args:
-            presentation_path: Path to the presentation file
+            presentation: PowerPoint presentation object
             project: Project description
             generation_result: Generation result with metadata
         """
         try:
-            from pptx import Presentation
-
-            # Load the presentation
-            prs = Presentation(str(presentation_path))
-
             # Set core properties
-            core_props = prs.core_properties
+            core_props = presentation.core_properties
             core_props.title = f"{project.description[:50]}... - Proposal for {project.client_name}"
             core_props.author = "Keyrus"
             core_props.subject = f"Technology Proposal for {project.client_name}"
@@ -160,9 +270,6 @@ class PresentationBuilder:
             core_props.created = datetime.now()
             core_props.modified = datetime.now()
 
-            # Save updated properties
-            prs.save(str(presentation_path))
-
         except Exception as e:
             logger.warning(f"Failed to set presentation properties: {e}")
 
@@ -176,6 +283,9 @@ class PresentationBuilder:
         """
         Customize content of a specific slide.
 
+        The slide of the built presentation is patched in place; no other
+        slide is touched.
+
         Args:
             slide_index: Index of slide to customize (0-based)
             new_content: New bullet point content
@@ -185,7 +295,7 @@ class PresentationBuilder:
         Returns:
             True if customization successful, False otherwise
         """
-        if not self.current_spec or slide_index >= len(self.current_spec.slides):
+        if not self.current_spec or not 0 <= slide_index < len(self.current_spec.slides):
             logger.error(f"Invalid slide index: {slide_index}")
             return False
 
@@ -201,6 +311,12 @@ class PresentationBuilder:
             if new_notes:
                 slide.notes = new_notes
 
+            if self.presentation is not None:
+                # PATTERN: Re-populate only this slide's placeholders
+                self.template_manager._populate_slide_content(
+                    self.presentation.slides[slide_index], slide
+                )
+
             logger.info(f"Customized slide {slide_index}: {slide.title}")
             return True
 
@@ -219,6 +335,9 @@ class PresentationBuilder:
         """
         Add a new slide to the presentation.
 
+        Only the new slide is created in the built presentation; it is then
+        moved into place in the slide order.
+
         Args:
             title: Slide title
             content: Bullet point content
@@ -241,10 +360,18 @@ class PresentationBuilder:
                 notes=notes or ""
             )
 
-            if position is not None and 0 <= position <= len(self.current_spec.slides):
-                self.current_spec.slides.insert(position, new_slide)
-            else:
-                self.current_spec.slides.append(new_slide)
+            if position is None or not 0 <= position <= len(self.current_spec.slides):
+                # Append after the content slides, ahead of any diagram slides
+                position = len(self.current_spec.slides)
+
+            if self.presentation is not None:
+                self.template_manager.create_slide_from_spec(new_slide)
+                slide_id_list = self.presentation.slides._sldIdLst
+                slide_id = slide_id_list[-1]
+                slide_id_list.remove(slide_id)
+                slide_id_list.insert(position, slide_id)
+
+            self.current_spec.slides.insert(position, new_slide)
 
             logger.info(f"Added slide: {title}")
             return True
@@ -257,17 +384,25 @@ class PresentationBuilder:
         """
         Remove a slide from the presentation.
 
+        The slide is unlinked from the built presentation; its part, notes
+        and media are no longer reachable and are left out on save.
+
         Args:
             slide_index: Index of slide to remove (0-based)
 
         Returns:
             True if slide removed successfully, False otherwise
         """
-        if not self.current_spec or slide_index >= len(self.current_spec.slides):
+        if not self.current_spec or not 0 <= slide_index < len(self.current_spec.slides):
             logger.error(f"Invalid slide index: {slide_index}")
             return False
 
         try:
+            if self.presentation is not None:
+                slide_id_list = self.presentation.slides._sldIdLst
+                self.presentation.part.drop_rel(slide_id_list[slide_index].rId)
+                del slide_id_list[slide_index]
+
             removed_slide = self.current_spec.slides.pop(slide_index)
             logger.info(f"Removed slide: {removed_slide.title}")
             return True
@@ -280,6 +415,9 @@ class PresentationBuilder:
         """
         Reorder slides in the presentation.
 
+        Only the slide id list of the built presentation is reshuffled;
+        diagram slides keep their place after the content slides.
+
         Args:
             new_order: List of slide indices in new order
 
@@ -299,6 +437,14 @@ class PresentationBuilder:
             return False
 
         try:
+            if self.presentation is not None:
+                slide_id_list = self.presentation.slides._sldIdLst
+                slide_ids = list(slide_id_list)[:len(new_order)]
+                for slide_id in slide_ids:
+                    slide_id_list.remove(slide_id)
+                for position, index in enumerate(new_order):
+                    slide_id_list.insert(position, slide_ids[index])
+
             original_slides = self.current_spec.slides.copy()
             self.current_spec.slides = [original_slides[i] for i in new_order]
 
@@ -311,7 +457,10 @@ class PresentationBuilder:
 
     def rebuild_presentation(self) -> Optional[Path]:
         """
-        Rebuild the presentation with current specifications.
+        Save the presentation with current specifications.
+
+        A built presentation already carries all edits and is saved as is;
+        without one the deck is regenerated from the template.
 
         Returns:
             Path to rebuilt presentation or None if failed
@@ -321,8 +470,13 @@ class PresentationBuilder:
             return None
 
         try:
-            # Create new presentation with updated specs
-            rebuilt_path = self.template_manager.create_presentation_from_spec(self.current_spec)
+            if self.presentation is not None:
+                rebuilt_path = self.template_manager.save_presentation(
+                    self.presentation, self.current_spec.output_path
+                )
+            else:
+                # Create new presentation with updated specs
+                rebuilt_path = self.template_manager.create_presentation_from_spec(self.current_spec)
 
             logger.info(f"Successfully rebuilt presentation: {rebuilt_path}")
             return rebuilt_path
@@ -331,6 +485,26 @@ class PresentationBuilder:
             logger.error(f"Failed to rebuild presentation: {e}")
             return None
 
+    def rebuild_presentation_buffer(self) -> Optional[BytesIO]:
+        """
+        Serialize the edited presentation into an in-memory buffer.
+
+        Returns:
+            Buffer named after the output file, or None if no presentation was built
+        """
+        if self.presentation is None or not self.current_spec:
+            logger.error("No built presentation to serialize")
+            return None
+
+        try:
+            buffer = self.template_manager.serialize_presentation(self.presentation)
+            buffer.name = self.current_spec.output_path.name
+            return buffer
+
+        except Exception as e:
+            logger.error(f"Failed to serialize presentation: {e}")
+            return None
+
     async def add_diagram_as_dedicated_slide(
         self,
         presentation: any,
@@ -413,7 +587,10 @@ class PresentationBuilder:
         diagrams: list[GeneratedDiagram]
     ) -> dict[str, any]:
         """
-        Insert multiple diagrams as dedicated pages in the presentation.
+        Insert multiple diagrams as dedicated pages in a saved presentation.
+
+        build_presentation(diagrams=...) adds diagram slides without the
+        extra load and save; use this for presentations already on disk.
 
         Args:
             presentation_path: Path to the presentation file
@@ -422,16 +599,9 @@ class PresentationBuilder:
         Returns:
             Dictionary with insertion results
         """
-        results = {
-            "total_diagrams": len(diagrams),
-            "successful_insertions": 0,
-            "failed_insertions": 0,
-            "insertion_details": []
-        }
-
         if not diagrams:
             logger.info("No diagrams to insert")
-            return results
+            return self._new_insertion_results(diagrams)
 
         try:
             from pptx import Presentation
@@ -439,55 +609,97 @@ class PresentationBuilder:
             # Load presentation
             prs = Presentation(str(presentation_path))
 
-            for diagram in diagrams:
-                try:
-                    # Create a dedicated slide for this diagram
-                    success = await self.add_diagram_as_dedicated_slide(
-                        prs, diagram
-                    )
-
-                    if success:
-                        results["successful_insertions"] += 1
-                        results["insertion_details"].append({
-                            "diagram_title": diagram.spec.title,
-                            "slide_index": len(prs.slides) - 1,  # Last added slide
-                            "status": "success",
-                            "image_path": str(diagram.image_path),
-                            "file_size_kb": diagram.file_size_kb
-                        })
-                    else:
-                        results["failed_insertions"] += 1
-                        results["insertion_details"].append({
-                            "diagram_title": diagram.spec.title,
-                            "slide_index": -1,
-                            "status": "failed",
-                            "error": "Failed to create dedicated diagram slide"
-                        })
-
-                except Exception as e:
-                    results["failed_insertions"] += 1
-                    results["insertion_details"].append({
-                        "diagram_title": diagram.spec.title,
-                        "slide_index": -1,
-                        "status": "failed",
-                        "error": str(e)
-                    })
-                    logger.error(f"Failed to insert diagram '{diagram.spec.title}': {e}")
+            results = await self._add_diagram_slides(prs, diagrams)
 
             # Save the presentation with new diagram slides
             prs.save(str(presentation_path))
 
-            logger.info(
-                f"Diagram insertion complete: {results['successful_insertions']} successful, "
-                f"{results['failed_insertions']} failed"
-            )
-
         except Exception as e:
             logger.error(f"Error during diagram insertion: {e}")
+            results = self._new_insertion_results(diagrams)
             results["error"] = str(e)
 
         return results
 
+    @staticmethod
+    def _new_insertion_results(diagrams: list[GeneratedDiagram]) -> dict[str, any]:
+        """
+        Create an empty diagram insertion result.
+
+        Args:
+            diagrams: Diagrams that are about to be inserted
+
+        Returns:
+            Dictionary with zeroed insertion counters
+        """
+        return {
+            "total_diagrams": len(diagrams),
+            "successful_insertions": 0,
+            "failed_insertions": 0,
+            "insertion_details": []
+        }
+
+    async def _add_diagram_slides(
+        self,
+        presentation: Any,
+        diagrams: list[GeneratedDiagram]
+    ) -> dict[str, any]:
+        """
+        Add diagrams as dedicated slides to an in-memory presentation.
+
+        Args:
+            presentation: PowerPoint presentation object
+            diagrams: List of generated diagrams to insert
+
+        Returns:
+            Dictionary with insertion results
+        """
+        results = self._new_insertion_results(diagrams)
+
+        if not diagrams:
+            return results
+
+        for diagram in diagrams:
+            try:
+                # Create a dedicated slide for this diagram
+                success = await self.add_diagram_as_dedicated_slide(
+                    presentation, diagram
+                )
+
+                if success:
+                    results["successful_insertions"] += 1
+                    results["insertion_details"].append({
+                        "diagram_title": diagram.spec.title,
+                        "slide_index": len(presentation.slides) - 1,  # Last added slide
+                        "status": "success",
+                        "image_path": str(diagram.image_path),
+                        "file_size_kb": diagram.file_size_kb
+                    })
+                else:
+                    results["failed_insertions"] += 1
+                    results["insertion_details"].append({
+                        "diagram_title": diagram.spec.title,
+                        "slide_index": -1,
+                        "status": "failed",
+                        "error": "Failed to create dedicated diagram slide"
+                    })
+
+            except Exception as e:
+                results["failed_insertions"] += 1
+                results["insertion_details"].append({
+                    "diagram_title": diagram.spec.title,
+                    "slide_index": -1,
+                    "status": "failed",
+                    "error": str(e)
+                })
+                logger.error(f"Failed to insert diagram '{diagram.spec.title}': {e}")
+
+        logger.info(
+            f"Diagram insertion complete: {results['successful_insertions']} successful, "
+            f"{results['failed_insertions']} failed"
+        )
+        return results
+
     def _optimize_diagram_positioning(
         self,
         slide_layout_name: str,
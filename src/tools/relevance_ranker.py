@@ -0,0 +1,207 @@
+"""
+BM25 relevance ranking of extracted content against the project description.
+
+Not every uploaded slide is relevant to the project at hand. This module
+builds a small in-memory BM25 index over the extracted slides/pages of one
+request, scores them against the project description and key technologies,
+and keeps the best-scoring items that fit a token budget. Scoring uses a
+dense document x query-term matrix, so only the query vocabulary is ever
+materialized and ranking thousands of slides takes milliseconds.
+"""
+
+import logging
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from ..config.settings import settings
+from ..models.data_models import ExtractedContent
+from .token_utils import estimate_tokens
+
+logger = logging.getLogger(__name__)
+
+# Standard BM25 parameters
+BM25_K1 = 1.5
+BM25_B = 0.75
+
+# Query weight of key technology terms relative to description terms
+TECHNOLOGY_QUERY_WEIGHT = 2.0
+
+_TERM_PATTERN = re.compile(r"\w+")
+
+# Common English words that carry no relevance signal in project descriptions
+_STOP_WORDS = frozenset(
+    "a an and are as at be by for from has have in is it its of on or that the "
+    "to was we were will with our this these those into their they you your".split()
+)
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Split text into lower-cased index terms.
+
+    Args:
+        text: Text to tokenize
+
+    Returns:
+        Terms in order of appearance, stop words removed
+    """
+    return [term for term in _TERM_PATTERN.findall(text.lower()) if term not in _STOP_WORDS]
+
+
+class RelevanceRanker:
+    """
+    Ranks extracted slides/pages against a project query with BM25.
+
+    The index is built per request; nothing is persisted between calls.
+    """
+
+    def __init__(
+        self,
+        token_budget: Optional[int] = None,
+        top_k: Optional[int] = None
+    ) -> None:
+        """
+        Initialize the relevance ranker.
+
+        Args:
+            token_budget: Maximum estimated tokens of selected content
+                (defaults to settings.relevance_token_budget)
+            top_k: Maximum number of items to select
+                (defaults to settings.relevance_top_k; None means no limit)
+        """
+        self.token_budget = settings.relevance_token_budget if token_budget is None else token_budget
+        self.top_k = settings.relevance_top_k if top_k is None else top_k
+
+    def score(
+        self,
+        documents: List[ExtractedContent],
+        project_description: str,
+        key_technologies: Optional[List[str]] = None
+    ) -> np.ndarray:
+        """
+        Compute BM25 scores of each item against the project query.
+
+        Args:
+            documents: Extracted content to score
+            project_description: Description of the project requirements
+            key_technologies: Key technologies of the project, weighted higher
+
+        Returns:
+            Array of scores aligned with documents
+        """
+        query_weights: Dict[str, float] = {}
+        for term in tokenize(project_description):
+            query_weights[term] = query_weights.get(term, 0.0) + 1.0
+        for term in tokenize(" ".join(key_technologies or [])):
+            query_weights[term] = query_weights.get(term, 0.0) + TECHNOLOGY_QUERY_WEIGHT
+
+        if not documents or not query_weights:
+            return np.zeros(len(documents))
+
+        query_index = {term: index for index, term in enumerate(query_weights)}
+        weights = np.fromiter(query_weights.values(), dtype=np.float64, count=len(query_weights))
+
+        document_terms = [tokenize(f"{doc.title}\n{doc.content}") for doc in documents]
+        lengths = np.fromiter((len(terms) for terms in document_terms), dtype=np.float64,
+                              count=len(documents))
+
+        # PATTERN: Flatten all terms once and build the document x query-term
+        # frequency matrix with a single bincount
+        term_ids = np.fromiter(
+            (query_index.get(term, -1) for terms in document_terms for term in terms),
+            dtype=np.int64,
+            count=int(lengths.sum())
+        )
+        doc_ids = np.repeat(np.arange(len(documents)), lengths.astype(np.int64))
+        matched = term_ids >= 0
+        term_frequency = np.bincount(
+            doc_ids[matched] * len(query_index) + term_ids[matched],
+            minlength=len(documents) * len(query_index)
+        ).reshape(len(documents), len(query_index)).astype(np.float64)
+
+        document_frequency = np.count_nonzero(term_frequency, axis=0)
+        idf = np.log1p((len(documents) - document_frequency + 0.5) / (document_frequency + 0.5))
+
+        average_length = lengths.mean() or 1.0
+        length_norm = BM25_K1 * (1.0 - BM25_B + BM25_B * lengths / average_length)
+        saturated = term_frequency * (BM25_K1 + 1.0) / (term_frequency + length_norm[:, None])
+
+        return saturated @ (idf * weights)
+
+    def select(
+        self,
+        documents: List[ExtractedContent],
+        project_description: str,
+        key_technologies: Optional[List[str]] = None
+    ) -> Tuple[List[ExtractedContent], Dict[str, Any]]:
+        """
+        Keep the most relevant items that fit the token budget.
+
+        Items are taken in descending score order and skipped if they would
+        exceed the budget, so a long low-value slide does not crowd out
+        several shorter relevant ones.
+
+        Args:
+            documents: Extracted content to rank
+            project_description: Description of the project requirements
+            key_technologies: Key technologies of the project, weighted higher
+
+        Returns:
+            Tuple of (selected content in original order, statistics)
+        """
+        scores = self.score(documents, project_description, key_technologies)
+        item_tokens = [estimate_tokens(f"{doc.title}\n{doc.content}") for doc in documents]
+
+        # GOTCHA: A stable sort keeps the original order between equal scores
+        ranking = np.argsort(-scores, kind="stable")
+
+        selected_indices = []
+        selected_tokens = 0
+        for index in ranking:
+            if self.top_k is not None and len(selected_indices) >= self.top_k:
+                break
+            if selected_tokens + item_tokens[index] > self.token_budget:
+                continue
+            selected_indices.append(int(index))
+            selected_tokens += item_tokens[index]
+
+        selected_indices.sort()
+        selected = [documents[index] for index in selected_indices]
+
+        stats = {
+            "items_before": len(documents),
+            "items_selected": len(selected),
+            "token_budget": self.token_budget,
+            "top_k": self.top_k,
+            "tokens_before": sum(item_tokens),
+            "tokens_selected": selected_tokens,
+            "top_score": float(scores.max()) if len(documents) else 0.0,
+        }
+
+        logger.info(
+            f"Selected {stats['items_selected']} of {stats['items_before']} items by relevance "
+            f"(~{selected_tokens} of {stats['tokens_before']} tokens)"
+        )
+        return selected, stats
+
+
+# Convenience function for one-off relevance selection
+def select_relevant_content(
+    documents: List[ExtractedContent],
+    project_description: str,
+    key_technologies: Optional[List[str]] = None
+) -> Tuple[List[ExtractedContent], Dict[str, Any]]:
+    """
+    Keep the most relevant content using default settings.
+
+    Args:
+        documents: Extracted content to rank
+        project_description: Description of the project requirements
+        key_technologies: Key technologies of the project
+
+    Returns:
+        Tuple of (selected content, statistics)
+    """
+    return RelevanceRanker().select(documents, project_description, key_technologies)
@@ -0,0 +1,320 @@
+"""
+Killable worker processes for diagram rendering.
+
+concurrent.futures.ProcessPoolExecutor cannot abandon a single hung task:
+a Graphviz layout that never finishes keeps its worker (and the waiting
+thread) busy forever. This module runs each render in a dedicated worker
+process that is terminated when its timeout fires and replaced on demand,
+so one pathological diagram cannot stall the service. Each worker leads
+its own process group, so the Graphviz ``dot`` subprocess doing the actual
+layout is killed along with it. Workers are also recycled after a fixed
+number of renders to release leaked memory.
+"""
+
+import logging
+import multiprocessing
+import os
+import signal
+import threading
+from multiprocessing.connection import Connection
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+
+class RenderTimeoutError(TimeoutError):
+    """Raised when a render exceeds its timeout; the worker has been killed."""
+
+
+class RenderWorkerError(RuntimeError):
+    """Raised when a render fails or its worker process dies unexpectedly."""
+
+
+def _worker_main(conn: Connection) -> None:
+    """
+    Serve render requests until the parent sends None or closes the pipe.
+
+    Args:
+        conn: Child end of the request/response pipe
+    """
+    # CRITICAL: Lead a new session so a timeout can kill the Graphviz
+    # subprocesses too; killing only this process would orphan them
+    if hasattr(os, "setsid"):
+        os.setsid()
+
+    while True:
+        try:
+            request = conn.recv()
+        except (EOFError, OSError):
+            break
+        if request is None:
+            break
+
+        func, args = request
+        try:
+            conn.send(("ok", func(*args)))
+        except Exception as e:
+            # GOTCHA: Not every exception pickles; send a description instead
+            conn.send(("error", f"{type(e).__name__}: {e}"))
+
+
+class RenderWorker:
+    """A single worker process with its request/response pipe."""
+
+    def __init__(self, mp_context: Any) -> None:
+        """
+        Start the worker process.
+
+        Args:
+            mp_context: Multiprocessing context used to create the process
+        """
+        self.conn, child_conn = mp_context.Pipe()
+        self.process = mp_context.Process(target=_worker_main, args=(child_conn,), daemon=True)
+        self.process.start()
+        child_conn.close()
+        self.render_count = 0
+
+    def call(self, func: Callable[..., Any], args: Sequence[Any], timeout: Optional[float]) -> Any:
+        """
+        Run a function in the worker and wait for its result.
+
+        Args:
+            func: Picklable module-level function
+            args: Picklable positional arguments
+            timeout: Maximum wait in seconds (None = no limit)
+
+        Returns:
+            Function result
+
+        Raises:
+            RenderTimeoutError: If no result arrived within the timeout
+            RenderWorkerError: If the function raised or the worker died
+        """
+        self.render_count += 1
+        self.conn.send((func, tuple(args)))
+
+        if not self.conn.poll(timeout):
+            raise RenderTimeoutError(f"Render did not finish within {timeout}s")
+
+        try:
+            status, payload = self.conn.recv()
+        except (EOFError, OSError) as e:
+            self.process.join(timeout=1)
+            raise RenderWorkerError(
+                f"Render worker exited unexpectedly (exit code {self.process.exitcode})"
+            ) from e
+
+        if status == "error":
+            raise RenderWorkerError(payload)
+        return payload
+
+    @property
+    def alive(self) -> bool:
+        """Whether the worker process is still running."""
+        return self.process.is_alive()
+
+    def stop(self) -> None:
+        """Ask the worker to exit after its current request."""
+        try:
+            self.conn.send(None)
+        except (OSError, ValueError):
+            pass
+        self.process.join(timeout=5)
+        if self.process.is_alive():
+            self.kill()
+        else:
+            self.conn.close()
+
+    def kill(self) -> None:
+        """Terminate the worker and every subprocess it started immediately."""
+        self._signal_group(signal.SIGTERM)
+        self.process.terminate()
+        self.process.join(timeout=1)
+        # Subprocesses outlive the worker; SIGKILL whatever is left of the group
+        self._signal_group(getattr(signal, "SIGKILL", None))
+        if self.process.is_alive():
+            self.process.kill()
+            self.process.join()
+        self.conn.close()
+
+    def _signal_group(self, signum: Optional[int]) -> None:
+        """
+        Send a signal to the worker's process group.
+
+        Args:
+            signum: Signal to send (ignored where process groups are unsupported)
+        """
+        if signum is None or not hasattr(os, "killpg") or self.process.pid is None:
+            return
+        try:
+            # GOTCHA: Use the worker pid as the group id, never os.getpgid() -
+            # before setsid() ran that would be the parent's own group
+            os.killpg(self.process.pid, signum)
+        except (ProcessLookupError, PermissionError):
+            # Group already gone, or setsid() has not run yet
+            pass
+
+
+class RenderWorkerPool:
+    """
+    Bounded pool of killable render workers.
+
+    run() blocks the calling thread; use it through asyncio.to_thread or
+    run_in_executor. At most max_workers renders run at once, further
+    callers wait for a free slot.
+    """
+
+    def __init__(
+        self,
+        max_workers: int,
+        max_renders_per_worker: int,
+        mp_context: Optional[Any] = None
+    ) -> None:
+        """
+        Initialize the pool; worker processes are started on demand.
+
+        Args:
+            max_workers: Maximum number of concurrent renders
+            max_renders_per_worker: Renders after which a worker is replaced
+            mp_context: Multiprocessing context (defaults to spawn)
+        """
+        self.max_workers = max_workers
+        self.max_renders_per_worker = max_renders_per_worker
+        # GOTCHA: Use spawn - forking the threaded Streamlit server can deadlock
+        self.mp_context = mp_context or multiprocessing.get_context("spawn")
+
+        self._slots = threading.BoundedSemaphore(max_workers)
+        self._lock = threading.Lock()
+        self._idle: List[RenderWorker] = []
+        self._closed = False
+
+        self.stats: Dict[str, int] = {
+            "renders": 0,
+            "timeouts": 0,
+            "failures": 0,
+            "workers_started": 0,
+            "workers_recycled": 0,
+            "workers_killed": 0,
+        }
+
+    def run(
+        self,
+        func: Callable[..., Any],
+        args: Sequence[Any] = (),
+        timeout: Optional[float] = None
+    ) -> Any:
+        """
+        Run a function in a worker process, killing the worker on timeout.
+
+        Args:
+            func: Picklable module-level function
+            args: Picklable positional arguments
+            timeout: Maximum render time in seconds (None = no limit)
+
+        Returns:
+            Function result
+
+        Raises:
+            RenderTimeoutError: If the render timed out
+            RenderWorkerError: If the render failed or its worker died
+        """
+        with self._slots:
+            worker = self._acquire()
+            try:
+                result = worker.call(func, args, timeout)
+            except RenderTimeoutError:
+                self._discard(worker, "timeouts")
+                raise
+            except RenderWorkerError:
+                if worker.alive:
+                    # The function raised; the worker itself is healthy
+                    self._release(worker)
+                    self._count("failures")
+                else:
+                    self._discard(worker, "failures")
+                raise
+            except BaseException:
+                # Unknown worker state (e.g. a request that did not pickle)
+                self._discard(worker, "failures")
+                raise
+
+            self._count("renders")
+            self._release(worker)
+            return result
+
+    def shutdown(self) -> None:
+        """Stop all idle workers; busy workers stop when their render returns."""
+        with self._lock:
+            self._closed = True
+            idle, self._idle = self._idle, []
+
+        for worker in idle:
+            worker.stop()
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Get pool statistics.
+
+        Returns:
+            Counters of renders, timeouts, failures and worker lifecycle events
+        """
+        with self._lock:
+            return {**self.stats, "idle_workers": len(self._idle)}
+
+    def _acquire(self) -> RenderWorker:
+        """
+        Take an idle worker or start a new one.
+
+        Returns:
+            Running worker reserved for the caller
+        """
+        with self._lock:
+            while self._idle:
+                worker = self._idle.pop()
+                if worker.alive:
+                    return worker
+                worker.kill()
+            self.stats["workers_started"] += 1
+
+        return RenderWorker(self.mp_context)
+
+    def _release(self, worker: RenderWorker) -> None:
+        """
+        Return a worker to the pool, recycling it once it reached its render limit.
+
+        Args:
+            worker: Worker that finished a request
+        """
+        with self._lock:
+            keep = not self._closed and worker.render_count < self.max_renders_per_worker
+            if keep:
+                self._idle.append(worker)
+            elif not self._closed:
+                self.stats["workers_recycled"] += 1
+
+        if not keep:
+            worker.stop()
+
+    def _discard(self, worker: RenderWorker, counter: str) -> None:
+        """
+        Kill a worker whose state can no longer be trusted.
+
+        Args:
+            worker: Worker to kill
+            counter: Statistics counter to increment
+        """
+        worker.kill()
+        with self._lock:
+            self.stats[counter] += 1
+            self.stats["workers_killed"] += 1
+        logger.warning(f"Killed render worker (pid {worker.process.pid}) after {counter[:-1]}")
+
+    def _count(self, counter: str) -> None:
+        """
+        Increment a statistics counter.
+
+        Args:
+            counter: Counter name
+        """
+        with self._lock:
+            self.stats[counter] += 1
@@ -5,9 +5,13 @@ This module handles loading Keyrus PowerPoint templates and creating
 slides with proper placeholder management and branding preservation.
 """
 
+import hashlib
 import logging
+import threading
+from collections import OrderedDict
+from io import BytesIO
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, Optional
 
 from pptx import Presentation
 from pptx.exc import PackageNotFoundError
@@ -20,6 +24,287 @@ from ..models.data_models import GeneratedSlide, PresentationSpec
 logger = logging.getLogger(__name__)
 
 
+def map_slide_layouts(slide_layouts: Any) -> Dict[str, int]:
+    """
+    Map slide layouts by name and common patterns.
+
+    Args:
+        slide_layouts: Slide layouts of a presentation
+
+    Returns:
+        Dictionary mapping layout names and pattern keys to layout indices
+    """
+    layout_mapping = {}
+
+    for i, layout in enumerate(slide_layouts):
+        layout_name = layout.name.lower()
+        layout_mapping[layout_name] = i
+
+        # Common layout patterns
+        if "title" in layout_name and "slide" in layout_name:
+            layout_mapping["title"] = i
+        elif "title" in layout_name and "content" in layout_name:
+            layout_mapping["title_content"] = i
+        elif "content" in layout_name or "bullet" in layout_name:
+            layout_mapping["bullet"] = i
+        elif "blank" in layout_name:
+            layout_mapping["blank"] = i
+        elif "section" in layout_name:
+            layout_mapping["section"] = i
+        elif "two content" in layout_name or "comparison" in layout_name:
+            layout_mapping["two_content"] = i
+        elif "picture" in layout_name or "caption" in layout_name:
+            layout_mapping["picture_caption"] = i
+
+        # Diagram-specific layout patterns
+        if "diagram" in layout_name:
+            layout_mapping["diagram"] = i
+        elif "split" in layout_name:
+            layout_mapping["split"] = i
+
+    return layout_mapping
+
+
+def check_template_layouts(presentation: Presentation) -> tuple[bool, str]:
+    """
+    Check that a loaded template has the layouts slide creation relies on.
+
+    Args:
+        presentation: Presentation loaded from the template
+
+    Returns:
+        Tuple of (is_valid, error_message)
+    """
+    try:
+        # Check basic requirements
+        if len(presentation.slide_layouts) == 0:
+            return False, "Template has no slide layouts"
+
+        # Check for common layouts
+        layout_names = [layout.name.lower() for layout in presentation.slide_layouts]
+        has_title_layout = any("title" in name for name in layout_names)
+        has_content_layout = any(("content" in name or "bullet" in name) for name in layout_names)
+
+        if not (has_title_layout and has_content_layout):
+            return False, "Template missing required layouts (title, content)"
+
+        return True, "Template is valid"
+
+    except Exception as e:
+        return False, f"Template validation failed: {e}"
+
+
+def remove_template_slides(presentation: Presentation) -> int:
+    """
+    Remove all slides a template ships with, keeping masters and layouts.
+
+    python-pptx serializes only the parts reachable through the relationship
+    graph from the package root, so dropping the slide relationships is
+    enough to keep the slides, their notes and media out of the output.
+
+    Args:
+        presentation: Presentation to strip
+
+    Returns:
+        Size in bytes of the parts that became unreachable
+    """
+    slide_count = len(presentation.slides)
+    if slide_count == 0:
+        return 0
+
+    package = presentation.part.package
+    reachable_before = list(package.iter_parts())
+
+    for i in range(slide_count - 1, -1, -1):
+        slide_id = presentation.slides._sldIdLst[i]
+        presentation.part.drop_rel(slide_id.rId)
+        del presentation.slides._sldIdLst[i]
+
+    # Same graph walk the serializer does
+    reachable_after = {id(part) for part in package.iter_parts()}
+    pruned_bytes = sum(
+        len(part.blob) for part in reachable_before if id(part) not in reachable_after
+    )
+
+    logger.debug(f"Removed {slide_count} template slides ({pruned_bytes / 1024:.0f} KB of parts)")
+    return pruned_bytes
+
+
+class CachedTemplate:
+    """
+    A template parsed once and shared by all builds of the process.
+
+    Holds the template package with its own slides stripped, plus the
+    layout mapping and validation result; every build parses its own
+    clone from the in-memory package.
+    """
+
+    def __init__(self, path: Path, data: bytes, mtime_ns: int) -> None:
+        """
+        Parse a template and derive its layout mapping and validation result.
+
+        Args:
+            path: Resolved template path
+            data: Template package bytes
+            mtime_ns: Modification time the bytes were read at
+
+        Raises:
+            PackageNotFoundError: If the bytes are not a PowerPoint package
+        """
+        self.path = path
+        self.size = len(data)
+        self.mtime_ns = mtime_ns
+        self.content_hash = hashlib.sha256(data).hexdigest()
+
+        presentation = Presentation(BytesIO(data))
+        self.layout_mapping = map_slide_layouts(presentation.slide_layouts)
+        self.validation = check_template_layouts(presentation)
+
+        # CRITICAL: Strip the template's own slides once so clones never parse
+        # slide, notes and media parts that every build would drop
+        self.pruned_bytes = remove_template_slides(presentation)
+
+        buffer = BytesIO()
+        presentation.save(buffer)
+        self._package = buffer.getvalue()
+
+    def clone(self) -> Presentation:
+        """
+        Create an independent presentation from the stripped template package.
+
+        Returns:
+            Presentation that can be modified and saved freely
+        """
+        # GOTCHA: copy.deepcopy of a python-pptx Presentation is not safe - proxies
+        # cached on the original (e.g. prs.slides) keep pointing at detached copies
+        # of their elements, so slides added to the clone are silently lost on save
+        return Presentation(BytesIO(self._package))
+
+
+class TemplateCache:
+    """
+    Process-wide cache of parsed templates keyed by path and modification time.
+
+    An entry whose file changed on disk is re-read; if the content hash is
+    unchanged the parsed template and its validation result are kept.
+    Least-recently-used entries are dropped beyond max_entries.
+    """
+
+    def __init__(self, max_entries: int) -> None:
+        """
+        Initialize the template cache.
+
+        Args:
+            max_entries: Maximum number of parsed templates kept in memory
+        """
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Path, CachedTemplate]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, template_path: Path) -> CachedTemplate:
+        """
+        Get the parsed template for a path, parsing it on first use.
+
+        Args:
+            template_path: Template file path
+
+        Returns:
+            Cached template
+
+        Raises:
+            FileNotFoundError: If the template file does not exist
+            PackageNotFoundError: If the file is not a PowerPoint package
+        """
+        path = Path(template_path).resolve()
+        stat = path.stat()
+
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is not None and entry.mtime_ns == stat.st_mtime_ns and entry.size == stat.st_size:
+                self._entries.move_to_end(path)
+                self.hits += 1
+                return entry
+
+        data = path.read_bytes()
+
+        if entry is not None and entry.content_hash == hashlib.sha256(data).hexdigest():
+            # Touched but unchanged: keep the parsed template and validation
+            with self._lock:
+                entry.mtime_ns = stat.st_mtime_ns
+                self._entries.move_to_end(path)
+                self.hits += 1
+            return entry
+
+        # GOTCHA: Parse outside the lock; concurrent first uses may parse twice
+        entry = CachedTemplate(path, data, stat.st_mtime_ns)
+
+        with self._lock:
+            self._entries[path] = entry
+            self._entries.move_to_end(path)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            self.misses += 1
+
+        logger.info(
+            f"Parsed and cached template: {path.name} ({len(entry.layout_mapping)} layout patterns, "
+            f"{entry.pruned_bytes / 1024:.0f} KB of template slide parts pruned)"
+        )
+        return entry
+
+    def clear(self) -> None:
+        """Drop all parsed templates."""
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with hit/miss counters and the number of cached templates
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "templates": len(self._entries),
+                "pruned_bytes": sum(entry.pruned_bytes for entry in self._entries.values()),
+            }
+
+
+_template_cache: Optional[TemplateCache] = None
+_template_cache_lock = threading.Lock()
+
+
+def get_template_cache() -> TemplateCache:
+    """
+    Get the process-wide template cache.
+
+    Returns:
+        Shared TemplateCache instance
+    """
+    global _template_cache
+
+    with _template_cache_lock:
+        if _template_cache is None:
+            _template_cache = TemplateCache(settings.template_cache_max_entries)
+        return _template_cache
+
+
+def get_template_cache_stats() -> Optional[Dict[str, Any]]:
+    """
+    Get statistics of the process-wide template cache.
+
+    Returns:
+        Cache statistics, or None if the cache has not been used
+    """
+    return _template_cache.get_stats() if _template_cache is not None else None
+
+
 class TemplateManager:
     """
     Manages PowerPoint templates and slide creation.
@@ -39,6 +324,7 @@ class TemplateManager:
         self.presentation = None
         self.slide_layouts = None
         self._layout_mapping = {}
+        self._template_validation: Optional[tuple[bool, str]] = None
 
     def load_template(self, template_path: Optional[Path] = None) -> Presentation:
         """
@@ -60,12 +346,21 @@ class TemplateManager:
             raise FileNotFoundError(f"Template file not found: {template_path}")
 
         try:
-            # PATTERN: Load company template safely
-            self.presentation = Presentation(str(template_path))
-            self.slide_layouts = self.presentation.slide_layouts
+            if settings.template_cache_enabled:
+                # PATTERN: Clone the process-wide parsed template
+                cached = get_template_cache().get(template_path)
+                self.presentation = cached.clone()
+                self.slide_layouts = self.presentation.slide_layouts
+                self._layout_mapping = dict(cached.layout_mapping)
+                self._template_validation = cached.validation
+            else:
+                # PATTERN: Load company template safely
+                self.presentation = Presentation(str(template_path))
+                self.slide_layouts = self.presentation.slide_layouts
 
-            # Map layouts for easier access
-            self._map_slide_layouts()
+                # Map layouts for easier access
+                self._map_slide_layouts()
+                self._template_validation = None
 
             logger.info(f"Loaded template: {template_path.name} with {len(self.slide_layouts)} layouts")
             return self.presentation
@@ -78,33 +373,7 @@ class TemplateManager:
 
     def _map_slide_layouts(self) -> None:
         """Map slide layouts by name and common patterns."""
-        self._layout_mapping = {}
-
-        for i, layout in enumerate(self.slide_layouts):
-            layout_name = layout.name.lower()
-            self._layout_mapping[layout_name] = i
-
-            # Common layout patterns
-            if "title" in layout_name and "slide" in layout_name:
-                self._layout_mapping["title"] = i
-            elif "title" in layout_name and "content" in layout_name:
-                self._layout_mapping["title_content"] = i
-            elif "content" in layout_name or "bullet" in layout_name:
-                self._layout_mapping["bullet"] = i
-            elif "blank" in layout_name:
-                self._layout_mapping["blank"] = i
-            elif "section" in layout_name:
-                self._layout_mapping["section"] = i
-            elif "two content" in layout_name or "comparison" in layout_name:
-                self._layout_mapping["two_content"] = i
-            elif "picture" in layout_name or "caption" in layout_name:
-                self._layout_mapping["picture_caption"] = i
-
-            # Diagram-specific layout patterns
-            if "diagram" in layout_name:
-                self._layout_mapping["diagram"] = i
-            elif "split" in layout_name:
-                self._layout_mapping["split"] = i
+        self._layout_mapping = map_slide_layouts(self.slide_layouts)
 
         logger.debug(f"Mapped {len(self._layout_mapping)} layout patterns")
 
@@ -428,32 +697,76 @@ class TemplateManager:
             ValueError: If template loading or slide creation fails
         """
         try:
-            # Load template
-            self.load_template(spec.template_path)
+            presentation = self.build_presentation_from_spec(spec)
+            return self.save_presentation(presentation, spec.output_path)
 
-            # Remove existing slides (except keep master)
-            slide_count = len(self.presentation.slides)
-            for i in range(slide_count - 1, -1, -1):
-                slide_id = self.presentation.slides._sldIdLst[i]
-                self.presentation.part.drop_rel(slide_id.rId)
-                del self.presentation.slides._sldIdLst[i]
+        except Exception as e:
+            logger.error(f"Error creating presentation: {e}")
+            raise
 
-            # Create slides from specification
-            for slide_spec in spec.slides:
-                self.create_slide_from_spec(slide_spec)
+    def build_presentation_from_spec(self, spec: PresentationSpec) -> Presentation:
+        """
+        Build a presentation from specification in memory without saving it.
 
-            # Ensure output directory exists
-            spec.output_path.parent.mkdir(parents=True, exist_ok=True)
+        Callers can keep adding to the returned presentation (properties,
+        diagram slides) and serialize it once with save_presentation().
 
-            # Save presentation
-            self.presentation.save(str(spec.output_path))
+        Args:
+            spec: Complete presentation specification
 
-            logger.info(f"Created presentation: {spec.output_path}")
-            return spec.output_path
+        Returns:
+            Presentation object with all slides created
 
-        except Exception as e:
-            logger.error(f"Error creating presentation: {e}")
-            raise
+        Raises:
+            ValueError: If template loading or slide creation fails
+        """
+        # Load template
+        self.load_template(spec.template_path)
+
+        # Remove existing slides (except keep master); a cached template is already stripped
+        pruned_bytes = remove_template_slides(self.presentation)
+        if pruned_bytes:
+            logger.info(f"Excluded {pruned_bytes / 1024:.0f} KB of template slide parts from the output")
+
+        # Create slides from specification
+        for slide_spec in spec.slides:
+            self.create_slide_from_spec(slide_spec)
+
+        return self.presentation
+
+    def serialize_presentation(self, presentation: Presentation) -> BytesIO:
+        """
+        Serialize a presentation into an in-memory buffer.
+
+        Args:
+            presentation: Presentation to serialize
+
+        Returns:
+            Buffer positioned at the start of the .pptx package
+        """
+        buffer = BytesIO()
+        presentation.save(buffer)
+        buffer.seek(0)
+        return buffer
+
+    def save_presentation(self, presentation: Presentation, output_path: Path) -> Path:
+        """
+        Serialize a presentation to disk.
+
+        Args:
+            presentation: Presentation to save
+            output_path: Output file path
+
+        Returns:
+            Path to saved presentation file
+        """
+        # Ensure output directory exists
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+
+        presentation.save(str(output_path))
+
+        logger.info(f"Created presentation: {output_path}")
+        return output_path
 
     def get_template_info(self) -> dict:
         """
@@ -486,25 +799,29 @@ class TemplateManager:
             if not template_path.exists():
                 return False, f"Template file not found: {template_path}"
 
-            # Try to load the template
-            test_presentation = Presentation(str(template_path))
+            if settings.template_cache_enabled:
+                # Validation results are cached with the parsed template
+                return get_template_cache().get(template_path).validation
 
-            # Check basic requirements
-            if len(test_presentation.slide_layouts) == 0:
-                return False, "Template has no slide layouts"
+            # Try to load the template
+            return check_template_layouts(Presentation(str(template_path)))
 
-            # Check for common layouts
-            layout_names = [layout.name.lower() for layout in test_presentation.slide_layouts]
-            has_title_layout = any("title" in name for name in layout_names)
-            has_content_layout = any(("content" in name or "bullet" in name) for name in layout_names)
+        except Exception as e:
+            return False, f"Template validation failed: {e}"
 
-            if not (has_title_layout and has_content_layout):
-                return False, "Template missing required layouts (title, content)"
+    def validate_presentation(self, presentation: Presentation) -> tuple[bool, str]:
+        """
+        Validate the layouts of an already loaded template.
 
-            return True, "Template is valid"
+        Args:
+            presentation: Presentation loaded from the template
 
-        except Exception as e:
-            return False, f"Template validation failed: {e}"
+        Returns:
+            Tuple of (is_valid, error_message)
+        """
+        if presentation is self.presentation and self._template_validation is not None:
+            return self._template_validation
+        return check_template_layouts(presentation)
 
     def list_available_templates(self) -> list[Path]:
         """
@@ -0,0 +1,38 @@
+"""
+Token estimation helpers for prompt budgeting.
+
+The estimates use the common ~4 characters per token rule of thumb for
+English text with OpenAI tokenizers. They are meant for budgeting and
+reporting, not for exact billing.
+"""
+
+import math
+
+# Average characters per token for English text
+CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Estimate the number of tokens in a piece of text.
+
+    Args:
+        text: Text to estimate
+
+    Returns:
+        Estimated token count
+    """
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
+
+
+def chars_to_tokens(char_count: int) -> int:
+    """
+    Convert a character count into an estimated token count.
+
+    Args:
+        char_count: Number of characters
+
+    Returns:
+        Estimated token count
+    """
+    return math.ceil(char_count / CHARS_PER_TOKEN)
@@ -0,0 +1,146 @@
+"""
+Spooling of uploaded files to disk for bounded-memory processing.
+
+Small uploads are processed straight from the upload buffer. Larger uploads
+are copied in fixed-size chunks to a temporary file in the spool directory
+and handed to DocumentProcessor as a path, so extraction memory-maps or
+streams the file instead of holding another full in-memory copy.
+"""
+
+import logging
+import shutil
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, BinaryIO, Optional, Union
+
+from ..config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# Copy buffer size - bounds the memory used while spooling a single upload
+SPOOL_CHUNK_SIZE = 1024 * 1024
+
+SPOOL_FILE_PREFIX = "upload_"
+
+
+def _upload_size(uploaded_file: BinaryIO) -> int:
+    """
+    Get the size of an uploaded file without reading it.
+
+    Args:
+        uploaded_file: Streamlit uploaded file or any seekable binary stream
+
+    Returns:
+        Size in bytes
+    """
+    size = getattr(uploaded_file, "size", None)
+    if size is not None:
+        return size
+
+    position = uploaded_file.tell()
+    size = uploaded_file.seek(0, 2)
+    uploaded_file.seek(position)
+    return size
+
+
+def spool_upload(
+    uploaded_file: BinaryIO,
+    filename: str,
+    spool_dir: Optional[Path] = None,
+    threshold_bytes: Optional[int] = None
+) -> Union[Path, BinaryIO]:
+    """
+    Get a document source for an upload, spilling large uploads to disk.
+
+    Args:
+        uploaded_file: Streamlit uploaded file or any seekable binary stream
+        filename: Original filename (its suffix is kept on the spooled file)
+        spool_dir: Directory for spooled files (defaults to settings.upload_spool_dir)
+        threshold_bytes: Uploads larger than this are spooled
+            (defaults to settings.upload_spool_threshold_mb)
+
+    Returns:
+        Path of the spooled file, or the upload itself (rewound) if it is small
+    """
+    if threshold_bytes is None:
+        threshold_bytes = settings.upload_spool_threshold_mb * 1024 * 1024
+
+    uploaded_file.seek(0)
+    if _upload_size(uploaded_file) <= threshold_bytes:
+        return uploaded_file
+
+    spool_dir = Path(spool_dir or settings.upload_spool_dir)
+    spool_dir.mkdir(parents=True, exist_ok=True)
+
+    with tempfile.NamedTemporaryFile(
+        dir=spool_dir, prefix=SPOOL_FILE_PREFIX, suffix=Path(filename).suffix, delete=False
+    ) as spool_file:
+        try:
+            shutil.copyfileobj(uploaded_file, spool_file, SPOOL_CHUNK_SIZE)
+        except Exception:
+            Path(spool_file.name).unlink(missing_ok=True)
+            raise
+        finally:
+            uploaded_file.seek(0)
+
+    spool_path = Path(spool_file.name)
+    logger.info(f"Spooled {filename} to {spool_path}")
+    return spool_path
+
+
+def release_spooled_upload(source: Any, spool_dir: Optional[Path] = None) -> None:
+    """
+    Delete a spooled upload once it is no longer needed.
+
+    Sources that were not spooled (in-memory uploads, user files elsewhere
+    on disk) are left untouched.
+
+    Args:
+        source: Document source returned by spool_upload
+        spool_dir: Directory for spooled files (defaults to settings.upload_spool_dir)
+    """
+    if not isinstance(source, Path):
+        return
+
+    spool_dir = Path(spool_dir or settings.upload_spool_dir)
+    if source.parent.resolve() != spool_dir.resolve() or not source.name.startswith(SPOOL_FILE_PREFIX):
+        return
+
+    source.unlink(missing_ok=True)
+    logger.debug(f"Released spooled upload: {source}")
+
+
+def cleanup_spooled_uploads(
+    max_age_hours: int = 24,
+    spool_dir: Optional[Path] = None
+) -> int:
+    """
+    Delete spooled uploads left behind by sessions that ended without releasing them.
+
+    Args:
+        max_age_hours: Age after which spooled files are deleted
+        spool_dir: Directory for spooled files (defaults to settings.upload_spool_dir)
+
+    Returns:
+        Number of files deleted
+    """
+    spool_dir = Path(spool_dir or settings.upload_spool_dir)
+    if not spool_dir.exists():
+        return 0
+
+    cutoff = time.time() - max_age_hours * 3600
+    deleted = 0
+
+    for spool_file in spool_dir.glob(f"{SPOOL_FILE_PREFIX}*"):
+        try:
+            if spool_file.stat().st_mtime < cutoff:
+                spool_file.unlink()
+                deleted += 1
+        except OSError:
+            continue
+
+    if deleted:
+        logger.info(f"Cleaned up {deleted} stale spooled uploads")
+
+    return deleted
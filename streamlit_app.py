@@ -9,7 +9,6 @@ import asyncio
 import logging
 import time
 from datetime import datetime
-from io import BytesIO
 from pathlib import Path
 import traceback
 
@@ -25,6 +24,7 @@ try:
     from src.config.settings import load_env, settings
     from src.models.data_models import ProjectDescription
     from src.tools.file_handler import FileUploadHandler
+    from src.tools.upload_spool import release_spooled_upload, spool_upload
     from src.chains.orchestration_chain import PowerPointOrchestrationChain
     
     # Load environment variables
@@ -222,6 +222,12 @@ def render_project_input():
     return st.session_state.get("project", None)
 
 
+def release_file_tuples():
+    """Delete spooled upload files referenced by the current session."""
+    for file_content, _, _ in st.session_state.get("file_tuples", []):
+        release_spooled_upload(file_content)
+
+
 def render_file_upload():
     """Render the file upload section."""
     st.subheader("📁 Reference Documents")
@@ -235,11 +241,14 @@ def render_file_upload():
         # Process files and extract content
         with st.spinner("Processing uploaded files..."):
             try:
+                # Previous spooled uploads are superseded by this upload set
+                release_file_tuples()
+
                 # Convert Streamlit files to the format expected by orchestrator
                 file_tuples = []
                 for uploaded_file in uploaded_files:
-                    file_content = BytesIO(uploaded_file.read())
-                    uploaded_file.seek(0)  # Reset for potential re-reading
+                    # Large uploads are spooled to disk and passed by path
+                    file_content = spool_upload(uploaded_file, uploaded_file.name)
                     
                     file_type = st.session_state.file_handler.document_processor.get_file_type(uploaded_file.name)
                     file_tuples.append((file_content, uploaded_file.name, file_type))
@@ -361,28 +370,27 @@ def render_generation_results(results, context="default"):
     # Download section
     st.subheader("📥 Download Presentation")
     
-    presentation_path = results["presentation_path"]
+    presentation_buffer = results.get("presentation_buffer")
+    presentation_filename = results.get("presentation_filename", "presentation.pptx")
     
-    if presentation_path.exists():
-        with open(presentation_path, "rb") as file:
-            file_data = file.read()
-        
+    if presentation_buffer is not None:
         # Generate unique key with context and timestamp to prevent duplicates
         unique_id = int(time.time() * 1000)  # Millisecond timestamp
-        download_key = f"download_{context}_{presentation_path.stem}_{unique_id}"
+        download_key = f"download_{context}_{Path(presentation_filename).stem}_{unique_id}"
         
+        # PATTERN: Serve the deck straight from memory, no file read-back
         st.download_button(
             label="📥 Download PowerPoint Presentation",
-            data=file_data,
-            file_name=presentation_path.name,
+            data=presentation_buffer.getvalue(),
+            file_name=presentation_filename,
             mime="application/vnd.openxmlformats-officedocument.presentationml.presentation",
             use_container_width=True,
             key=download_key
         )
         
-        st.success(f"✅ Presentation ready: {presentation_path.name}")
+        st.success(f"✅ Presentation ready: {presentation_filename}")
     else:
-        st.error("❌ Presentation file not found")
+        st.error("❌ Presentation not available")
     
     # Detailed results
     with st.expander("📋 Detailed Results", expanded=False):
@@ -468,6 +476,7 @@ def render_settings_page():
     
     # Clear session
     if st.button("🗑️ Clear Session Data"):
+        release_file_tuples()
         keys_to_clear = ["project", "uploaded_files", "file_tuples", "generation_results", "processing_status"]
         for key in keys_to_clear:
             if key in st.session_state:
@@ -240,8 +240,12 @@ def mock_streamlit_file():
 
 
 @pytest.fixture(autouse=True)
-def setup_test_environment(mock_env_vars, temp_dir):
+def setup_test_environment(mock_env_vars, temp_dir, tmp_path):
     """Set up test environment automatically for all tests."""
+    # Keep pipeline checkpoints out of the real data directory (and out of
+    # temp_dir, which some tests expect to be empty)
+    os.environ["CHECKPOINT_DIR"] = str(tmp_path / "checkpoints")
+
     # Ensure settings are loaded with test environment
     try:
         from src.config.settings import settings
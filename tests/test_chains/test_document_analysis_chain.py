@@ -0,0 +1,169 @@
+"""
+Tests for document analysis chain map-reduce mode.
+"""
+
+import asyncio
+import json
+
+import pytest
+from unittest.mock import AsyncMock, Mock, patch
+
+from src.chains.document_analysis_chain import DocumentAnalysisChain
+from src.models.data_models import ExtractedContent
+
+
+def _slide(number, content, source_file="deck.pptx"):
+    """Build an ExtractedContent item for tests."""
+    return ExtractedContent(
+        slide_number=number,
+        title=f"Slide {number}",
+        content=content,
+        layout_type="Title and Content",
+        source_file=source_file
+    )
+
+
+def _response(technologies, approaches=None):
+    """Build a mock LLM response carrying analysis JSON."""
+    return Mock(content=json.dumps({
+        "technologies": technologies,
+        "approaches": approaches or [],
+        "case_studies": [],
+        "key_themes": ["Modernization"]
+    }))
+
+
+@pytest.fixture
+def chain():
+    """DocumentAnalysisChain with preprocessing disabled and a mocked LLM chain."""
+    with patch('src.chains.document_analysis_chain.ChatOpenAI'):
+        analysis_chain = DocumentAnalysisChain()
+    analysis_chain.normalizer = None
+    analysis_chain.deduplicator = None
+    analysis_chain.ranker = None
+    analysis_chain.chain = Mock()
+    analysis_chain.reduce_chain = Mock()
+    return analysis_chain
+
+
+@pytest.fixture
+def large_documents():
+    """Ten distinct slides of roughly 300 tokens each."""
+    return [
+        _slide(i, f"Workstream {i} covers " + " ".join(f"topic{i}_{j}" for j in range(120)))
+        for i in range(1, 11)
+    ]
+
+
+class TestDocumentAnalysisMapReduce:
+    """Test cases for token-budgeted map-reduce analysis."""
+
+    def test_chunk_sections_respects_budget(self, chain):
+        """Test that sections are grouped in order without exceeding the budget."""
+        sections = ["a" * 400, "b" * 400, "c" * 400, "d" * 2000]
+
+        chunks = chain._chunk_sections(sections, token_budget=250)
+
+        # 100 tokens each for a/b/c; the oversized section gets its own chunk
+        assert chunks == [["a" * 400, "b" * 400], ["c" * 400], ["d" * 2000]]
+
+    @pytest.mark.asyncio
+    async def test_placeholder_results_are_degraded(self, chain):
+        """Test that empty input and unparseable responses are flagged as degraded."""
+        chain.chain.ainvoke = AsyncMock(return_value=Mock(content='{"technologies": ["Azure", }'))
+
+        empty = await chain.analyze_documents([], "Cloud project")
+        unparsed = await chain.analyze_documents([_slide(1, "Azure migration")], "Cloud project")
+
+        assert empty.degraded is True
+        assert unparsed.degraded is True
+        assert unparsed.key_themes[0].startswith("Analysis parsing failed")
+
+    @pytest.mark.asyncio
+    async def test_small_upload_uses_single_call(self, chain):
+        """Test that uploads under the budget keep the single-call path."""
+        chain.chain.ainvoke = AsyncMock(return_value=_response(["Azure"]))
+
+        result = await chain.analyze_documents([_slide(1, "Azure migration")], "Cloud project")
+
+        assert chain.chain.ainvoke.await_count == 1
+        assert result.technologies == ["Azure"]
+        assert "map_reduce" not in result.preprocessing_stats
+
+    @pytest.mark.asyncio
+    async def test_map_reduce_merges_chunks_by_frequency(self, chain, large_documents):
+        """Test that chunk results are merged with the most frequent items first."""
+        responses = iter([
+            _response(["Kafka", "Azure"]),
+            _response(["Azure"]),
+            _response(["Azure", "Databricks"]),
+            _response(["Databricks"]),
+        ])
+        chain.chain.ainvoke = AsyncMock(side_effect=lambda _: next(responses))
+
+        with patch('src.chains.document_analysis_chain.settings') as mock_settings:
+            mock_settings.analysis_map_reduce_enabled = True
+            mock_settings.analysis_chunk_token_budget = 1100
+            mock_settings.analysis_max_concurrent_calls = 2
+            mock_settings.analysis_reduce_enabled = False
+            result = await chain.analyze_documents(large_documents, "Cloud project")
+
+        stats = result.preprocessing_stats["map_reduce"]
+        assert stats["chunks"] == chain.chain.ainvoke.await_count == 4
+        assert stats["largest_chunk_tokens"] <= 1100
+        assert stats["failed_chunks"] == 0
+        assert result.source_documents == 10
+        assert result.technologies == ["Azure", "Databricks", "Kafka"]
+        assert result.key_themes == ["Modernization"]
+        assert result.degraded is False
+
+    @pytest.mark.asyncio
+    async def test_map_calls_are_bounded_and_failures_tolerated(self, chain, large_documents):
+        """Test the concurrency bound and that a failed chunk does not fail the analysis."""
+        in_flight = 0
+        peak = 0
+        calls = 0
+
+        async def fake_ainvoke(_):
+            nonlocal in_flight, peak, calls
+            calls += 1
+            call_number = calls
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            if call_number == 1:
+                raise RuntimeError("rate limited")
+            return _response(["Azure"])
+
+        chain.chain.ainvoke = fake_ainvoke
+
+        with patch('src.chains.document_analysis_chain.settings') as mock_settings:
+            mock_settings.analysis_map_reduce_enabled = True
+            mock_settings.analysis_chunk_token_budget = 700
+            mock_settings.analysis_max_concurrent_calls = 2
+            mock_settings.analysis_reduce_enabled = False
+            result = await chain.analyze_documents(large_documents, "Cloud project")
+
+        assert peak == 2
+        assert result.preprocessing_stats["map_reduce"]["failed_chunks"] == 1
+        assert result.technologies == ["Azure"]
+        assert result.degraded is True
+
+    @pytest.mark.asyncio
+    async def test_optional_reduce_call(self, chain, large_documents):
+        """Test that the reduce call consolidates merged results when enabled."""
+        chain.chain.ainvoke = AsyncMock(return_value=_response(["Azure", "MS Azure"]))
+        chain.reduce_chain.ainvoke = AsyncMock(return_value=_response(["Azure"]))
+
+        with patch('src.chains.document_analysis_chain.settings') as mock_settings:
+            mock_settings.analysis_map_reduce_enabled = True
+            mock_settings.analysis_chunk_token_budget = 1000
+            mock_settings.analysis_max_concurrent_calls = 4
+            mock_settings.analysis_reduce_enabled = True
+            result = await chain.analyze_documents(large_documents, "Cloud project")
+
+        reduce_input = chain.reduce_chain.ainvoke.await_args.args[0]
+        assert json.loads(reduce_input["partial_results"])["technologies"] == ["Azure", "MS Azure"]
+        assert result.preprocessing_stats["map_reduce"]["reduce_call"] is True
+        assert result.technologies == ["Azure"]
@@ -0,0 +1,205 @@
+"""
+Tests for orchestration chain stage scheduling.
+"""
+
+import asyncio
+import threading
+from io import BytesIO
+
+import pytest
+from unittest.mock import AsyncMock, Mock, patch
+
+from src.chains.orchestration_chain import PowerPointOrchestrationChain
+from src.tools.checkpoint_store import CheckpointStore
+from src.models.data_models import (
+    ContentGenerationResult,
+    DiagramGenerationResult,
+    DocumentAnalysisResult,
+    ProjectAnalysisResult,
+)
+
+
+@pytest.fixture
+def orchestrator(temp_dir, sample_extracted_content):
+    """Orchestration chain with all components mocked and recording stage events."""
+    with patch('src.chains.orchestration_chain.DocumentProcessor'), \
+         patch('src.chains.orchestration_chain.DocumentAnalysisChain'), \
+         patch('src.chains.orchestration_chain.ProjectAnalysisChain'), \
+         patch('src.chains.orchestration_chain.DiagramGenerationChain'), \
+         patch('src.chains.orchestration_chain.ContentGenerationChain'), \
+         patch('src.chains.orchestration_chain.PresentationBuilder'):
+        chain = PowerPointOrchestrationChain()
+
+    chain.checkpoint_store = None
+    chain.events = []
+
+    def recorder(name, result, delay):
+        async def stage(*args, **kwargs):
+            chain.events.append(f"{name}_start")
+            await asyncio.sleep(delay)
+            chain.events.append(f"{name}_end")
+            return result
+        return stage
+
+    chain._process_documents = recorder("process", sample_extracted_content, 0.05)
+    chain.document_analysis_chain.analyze_documents = recorder(
+        "documents", DocumentAnalysisResult(analysis="ok", source_documents=3), 0.05
+    )
+    chain.project_analysis_chain.analyze_project = recorder("project", ProjectAnalysisResult(), 0.02)
+    chain.diagram_generation_chain.generate_diagram_specs = recorder(
+        "diagrams", DiagramGenerationResult(diagrams=[], success_count=0), 0.1
+    )
+    chain.content_generation_chain.generate_content = recorder(
+        "content", ContentGenerationResult(slides=[], confidence_score=0.8), 0.1
+    )
+    deck = BytesIO(b"pptx package")
+    deck.name = "deck.pptx"
+    chain.presentation_builder.build_presentation_buffer = recorder("build", deck, 0.0)
+    return chain
+
+
+class TestPresentationPipeline:
+    """Test cases for the orchestrator stage graph."""
+
+    @pytest.mark.asyncio
+    async def test_independent_stages_overlap(self, orchestrator, sample_project_description):
+        """Test that project analysis overlaps document work and diagrams overlap content."""
+        statuses = []
+
+        with patch('src.chains.orchestration_chain.settings') as mock_settings:
+            mock_settings.enable_diagram_generation = True
+            mock_settings.pipeline_stage_timeout = 60
+            results = await orchestrator.generate_presentation(
+                sample_project_description, [], progress_callback=statuses.append
+            )
+
+        assert results["success"] is True
+        events = orchestrator.events
+        assert events.index("project_end") < events.index("process_end")
+        assert events.index("content_start") < events.index("diagrams_end")
+        assert events.index("build_start") > max(events.index("diagrams_end"), events.index("content_end"))
+
+        timings = results["stage_timings"]
+        assert timings["generating_diagrams"]["start"] < timings["generating_content"]["end"]
+        assert timings["generating_content"]["start"] < timings["generating_diagrams"]["end"]
+
+        # Progress never moves backwards while stages overlap
+        progress = [status.progress for status in statuses]
+        assert progress == sorted(progress)
+        assert progress[-1] == 1.0
+        assert any("+" in status.status for status in statuses)
+
+    @pytest.mark.asyncio
+    async def test_presentation_returned_in_memory(self, orchestrator, sample_project_description):
+        """Test that the deck is returned as a buffer and only persisted when enabled."""
+        with patch('src.chains.orchestration_chain.settings') as mock_settings:
+            mock_settings.enable_diagram_generation = True
+            mock_settings.pipeline_stage_timeout = 60
+            mock_settings.persist_presentations = False
+            results = await orchestrator.generate_presentation(sample_project_description, [])
+
+        assert results["success"] is True
+        assert results["presentation_buffer"].getvalue() == b"pptx package"
+        assert results["presentation_filename"] == "deck.pptx"
+        assert results["presentation_path"] is None
+        assert results["summary"]["presentation_file"] == "deck.pptx"
+        orchestrator.presentation_builder.save_presentation_buffer.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_persistence_is_deferred(self, orchestrator, temp_dir, sample_project_description):
+        """Test that results are returned before the deck is written to disk."""
+        write_allowed = threading.Event()
+
+        def save(buffer, output_path):
+            assert write_allowed.wait(timeout=5)
+            return output_path
+
+        orchestrator.presentation_builder.save_presentation_buffer = Mock(side_effect=save)
+
+        with patch('src.chains.orchestration_chain.settings') as mock_settings:
+            mock_settings.enable_diagram_generation = True
+            mock_settings.pipeline_stage_timeout = 60
+            mock_settings.persist_presentations = True
+            mock_settings.output_dir = temp_dir
+            results = await orchestrator.generate_presentation(sample_project_description, [])
+
+        assert results["success"] is True
+        assert not results["presentation_save"].done()
+
+        write_allowed.set()
+        assert results["presentation_save"].result(timeout=5) == temp_dir / "deck.pptx"
+        assert results["presentation_path"] == temp_dir / "deck.pptx"
+        saved_buffer = orchestrator.presentation_builder.save_presentation_buffer.call_args.args[0]
+        assert saved_buffer is not results["presentation_buffer"]
+        assert saved_buffer.getvalue() == b"pptx package"
+
+    @pytest.mark.asyncio
+    async def test_diagram_failure_is_not_fatal(self, orchestrator, sample_project_description):
+        """Test that the presentation is built when diagram generation fails."""
+        orchestrator.diagram_generation_chain.generate_diagram_specs = AsyncMock(
+            side_effect=RuntimeError("graphviz missing")
+        )
+
+        with patch('src.chains.orchestration_chain.settings') as mock_settings:
+            mock_settings.enable_diagram_generation = True
+            mock_settings.pipeline_stage_timeout = 60
+            results = await orchestrator.generate_presentation(sample_project_description, [])
+
+        assert results["success"] is True
+        assert results["diagram_count"] == 0
+        assert results["stage_timings"]["generating_diagrams"]["status"] == "failed"
+
+    @pytest.mark.asyncio
+    async def test_disabled_diagrams_are_skipped(self, orchestrator, sample_project_description):
+        """Test that diagram generation is skipped when disabled."""
+        with patch('src.chains.orchestration_chain.settings') as mock_settings:
+            mock_settings.enable_diagram_generation = False
+            mock_settings.pipeline_stage_timeout = 60
+            results = await orchestrator.generate_presentation(sample_project_description, [])
+
+        assert results["success"] is True
+        assert "diagrams_start" not in orchestrator.events
+        assert results["stage_timings"]["generating_diagrams"]["status"] == "skipped"
+
+    @pytest.mark.asyncio
+    async def test_required_failure_cancels_running_stages(self, orchestrator, sample_project_description):
+        """Test that a failing required stage fails the run and cancels its siblings."""
+        orchestrator.project_analysis_chain.analyze_project = AsyncMock(
+            side_effect=ValueError("project analysis failed")
+        )
+
+        with patch('src.chains.orchestration_chain.settings') as mock_settings:
+            mock_settings.enable_diagram_generation = True
+            mock_settings.pipeline_stage_timeout = 60
+            results = await orchestrator.generate_presentation(sample_project_description, [])
+
+        assert results["success"] is False
+        assert "project analysis failed" in results["error"]
+        assert "process_end" not in orchestrator.events
+
+    @pytest.mark.asyncio
+    async def test_rerun_resumes_from_checkpoints(self, orchestrator, temp_dir, sample_project_description):
+        """Test that a rerun after a build failure restores the completed LLM stages."""
+        orchestrator.checkpoint_store = CheckpointStore(temp_dir / "checkpoints")
+        build = orchestrator.presentation_builder.build_presentation_buffer
+        orchestrator.presentation_builder.build_presentation_buffer = AsyncMock(
+            side_effect=OSError("disk full")
+        )
+
+        with patch('src.chains.orchestration_chain.settings') as mock_settings:
+            mock_settings.enable_diagram_generation = True
+            mock_settings.pipeline_stage_timeout = 60
+            failed = await orchestrator.generate_presentation(sample_project_description, [])
+
+            orchestrator.events.clear()
+            orchestrator.presentation_builder.build_presentation_buffer = build
+            results = await orchestrator.generate_presentation(sample_project_description, [])
+
+        assert failed["success"] is False
+        assert results["success"] is True
+        timings = results["stage_timings"]
+        for stage in ("analyzing_documents", "analyzing_project", "generating_diagrams", "generating_content"):
+            assert timings[stage]["status"] == "restored"
+        assert "documents_start" not in orchestrator.events
+        assert "content_start" not in orchestrator.events
+        assert "build_start" in orchestrator.events
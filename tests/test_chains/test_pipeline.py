@@ -0,0 +1,143 @@
+"""
+Tests for the stage-graph pipeline executor.
+"""
+
+import asyncio
+
+import pytest
+
+from src.chains.pipeline import Pipeline, PipelineError, Stage
+
+
+def _stage(name, inputs, outputs, events, delay=0.01, result=None, **kwargs):
+    """Build a stage that records its start/end and returns a fixed result."""
+    async def func(**values):
+        events.append(f"{name}_start")
+        await asyncio.sleep(delay)
+        events.append(f"{name}_end")
+        return result if result is not None else f"{name}_output"
+    return Stage(name, func, inputs=inputs, outputs=outputs, **kwargs)
+
+
+class TestPipeline:
+    """Test cases for Pipeline."""
+
+    @pytest.mark.asyncio
+    async def test_independent_stages_run_concurrently(self):
+        """Test that stages start as soon as their inputs are available."""
+        events = []
+        pipeline = Pipeline([
+            _stage("a", ["x"], ["a_out"], events, delay=0.05),
+            _stage("b", ["x"], ["b_out"], events, delay=0.01),
+            _stage("c", ["a_out", "b_out"], ["c_out"], events),
+        ])
+
+        values = await pipeline.run({"x": 1})
+
+        assert values["c_out"] == "c_output"
+        assert events.index("b_start") < events.index("a_end")
+        assert events.index("c_start") > events.index("a_end")
+        assert {result["status"] for result in pipeline.stage_results.values()} == {"completed"}
+
+    @pytest.mark.asyncio
+    async def test_progress_from_completed_weights(self):
+        """Test that progress advances by stage weight and never decreases."""
+        reports = []
+        pipeline = Pipeline(
+            [
+                _stage("a", [], ["a_out"], [], weight=3),
+                _stage("b", ["a_out"], ["b_out"], [], weight=1),
+            ],
+            progress_callback=lambda active, progress: reports.append((sorted(active), progress))
+        )
+
+        await pipeline.run({})
+
+        assert reports == [(["a"], 0.0), ([], 0.75), (["b"], 0.75), ([], 1.0)]
+
+    @pytest.mark.asyncio
+    async def test_multiple_outputs(self):
+        """Test that a tuple result is mapped onto several outputs."""
+        async def split():
+            return 1, 2
+
+        values = await Pipeline([Stage("split", split, outputs=["one", "two"])]).run({})
+
+        assert (values["one"], values["two"]) == (1, 2)
+
+    @pytest.mark.asyncio
+    async def test_optional_stage_failure_uses_fallback(self):
+        """Test that an optional stage failure yields its fallback outputs."""
+        async def fail():
+            raise RuntimeError("render failed")
+
+        pipeline = Pipeline([
+            Stage("diagrams", fail, outputs=["diagrams"], optional=True, fallback={"diagrams": []}),
+            _stage("build", ["diagrams"], ["deck"], []),
+        ])
+
+        values = await pipeline.run({})
+
+        assert values["diagrams"] == []
+        assert values["deck"] == "build_output"
+        assert pipeline.stage_results["diagrams"]["status"] == "failed"
+        assert pipeline.stage_results["diagrams"]["error"] == "render failed"
+
+    @pytest.mark.asyncio
+    async def test_disabled_stage_is_skipped(self):
+        """Test that a disabled stage does not run and produces its fallback."""
+        events = []
+        pipeline = Pipeline([
+            _stage("diagrams", [], ["diagrams"], events, enabled=False, fallback={"diagrams": None}),
+        ])
+
+        values = await pipeline.run({})
+
+        assert events == []
+        assert values["diagrams"] is None
+        assert pipeline.stage_results["diagrams"]["status"] == "skipped"
+        assert pipeline.progress == 1.0
+
+    @pytest.mark.asyncio
+    async def test_required_stage_timeout(self):
+        """Test that a required stage timeout fails the pipeline and cancels siblings."""
+        events = []
+        pipeline = Pipeline([
+            _stage("slow", [], ["slow_out"], events, delay=1, timeout=0.05),
+            _stage("sibling", [], ["sibling_out"], events, delay=1),
+        ])
+
+        with pytest.raises(PipelineError, match="slow timed out"):
+            await pipeline.run({})
+
+        assert "sibling_end" not in events
+        assert pipeline.stage_results["slow"]["status"] == "timed_out"
+
+    @pytest.mark.asyncio
+    async def test_required_stage_error_propagates(self):
+        """Test that a required stage error is raised unchanged."""
+        async def fail():
+            raise ValueError("LLM unavailable")
+
+        with pytest.raises(ValueError, match="LLM unavailable"):
+            await Pipeline([Stage("analysis", fail, outputs=["analysis"])]).run({})
+
+    def test_validate_rejects_invalid_graphs(self):
+        """Test graph validation for missing inputs, duplicate outputs and cycles."""
+        async def noop(**values):
+            return None
+
+        with pytest.raises(PipelineError, match="unsatisfiable"):
+            Pipeline([Stage("a", noop, inputs=["missing"], outputs=["a"])]).validate([])
+
+        with pytest.raises(PipelineError, match="produced by both"):
+            Pipeline([Stage("a", noop, outputs=["v"]), Stage("b", noop, outputs=["v"])]).validate([])
+
+        with pytest.raises(PipelineError, match="cycle"):
+            Pipeline([
+                Stage("a", noop, inputs=["b"], outputs=["a"]),
+                Stage("b", noop, inputs=["a"], outputs=["b"]),
+            ]).validate([])
+
+        with pytest.raises(PipelineError, match="fallback"):
+            Pipeline([Stage("a", noop, outputs=["a"], optional=True)]).validate([])
@@ -122,6 +122,7 @@ class TestProjectAnalysisChain:
         assert isinstance(result, ProjectAnalysisResult)
         assert len(result.requirements) >= 1  # Should have error message
         assert "Analysis parsing failed" in result.requirements[0]
+        assert result.degraded is True
 
     @pytest.mark.asyncio
     @patch('src.chains.project_analysis_chain.ChatOpenAI')
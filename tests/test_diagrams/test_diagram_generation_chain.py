@@ -2,10 +2,13 @@
 Tests for diagram generation chain functionality.
 """
 
+import asyncio
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 
 from src.chains.diagram_generation_chain import DiagramGenerationChain
+from src.tools.render_workers import RenderTimeoutError
 from src.models.data_models import (
     DiagramGenerationResult,
     DocumentAnalysisResult,
@@ -329,6 +332,42 @@ class TestDiagramGenerationChain:
         assert result.total_generation_time_ms >= 0
         assert 0.0 <= result.confidence_score <= 1.0
 
+    @pytest.mark.asyncio
+    async def test_render_diagrams_concurrently_with_isolation(self):
+        """Test that diagrams render concurrently and failures or timeouts do not drop the others."""
+        def diagram_data(title):
+            return {
+                "diagram_type": "microservices",
+                "title": title,
+                "components": [
+                    {"name": "API", "component_type": "api", "icon_provider": "aws"},
+                    {"name": "Service", "component_type": "service", "icon_provider": "aws"}
+                ]
+            }
+
+        active = []
+        peak = []
+
+        async def fake_generate(spec):
+            active.append(spec.title)
+            peak.append(len(active))
+            await asyncio.sleep(0.05)
+            active.remove(spec.title)
+            if spec.title == "Broken":
+                raise ValueError("render failed")
+            if spec.title == "Hung":
+                raise RenderTimeoutError("Render did not finish within 30s")
+            return MagicMock(spec=GeneratedDiagram, title=spec.title)
+
+        with patch.object(self.chain.diagram_generator, 'generate_diagram', side_effect=fake_generate):
+            diagrams, timed_out = await self.chain._render_diagrams(
+                [diagram_data("First"), diagram_data("Broken"), diagram_data("Hung"), diagram_data("Third")]
+            )
+
+        assert [diagram.title for diagram in diagrams] == ["First", "Third"]
+        assert timed_out == ["Hung"]
+        assert max(peak) == 4
+
     @pytest.mark.asyncio
     async def test_generate_diagram_specs_llm_failure(self):
         """Test handling of LLM generation failure."""
@@ -2,12 +2,17 @@
 Tests for diagram generator functionality.
 """
 
+import os
+import subprocess
+import sys
+
 import pytest
 import tempfile
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 
 from src.models.data_models import DiagramComponent, DiagramConnection, DiagramSpec
+from src.tools import diagram_generator
 from src.tools.diagram_generator import DiagramGenerator
 
 
@@ -72,6 +77,29 @@ class TestDiagramGenerator:
         icon_class = self.generator._get_icon_class("unknown", "service", "test")
         assert icon_class is not None
 
+    def test_provider_classes_resolve_lazily(self):
+        """Test that provider modules load on first use, not at import."""
+        probe = (
+            "import sys\n"
+            "import src.tools.diagram_generator as module\n"
+            "assert not any(name.startswith('diagrams') for name in sys.modules)\n"
+            "assert module.DIAGRAMS_AVAILABLE\n"
+            "lambda_class = module.Lambda\n"
+            "assert lambda_class.__module__ == 'diagrams.aws.compute'\n"
+            "assert 'diagrams.gcp.compute' not in sys.modules\n"
+            "assert module.__dict__['Lambda'] is lambda_class\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", probe],
+            capture_output=True,
+            text=True,
+            env={**os.environ, "OPENAI_API_KEY": os.environ.get("OPENAI_API_KEY", "sk-test")}
+        )
+        assert result.returncode == 0, result.stderr
+
+        with pytest.raises(AttributeError):
+            diagram_generator.NotAProviderClass
+
     def test_calculate_slide_position(self):
         """Test slide position calculation for different diagram types."""
         # Test microservices positioning
@@ -264,38 +292,140 @@ class TestDiagramGenerator:
 
     @pytest.mark.asyncio
     async def test_cleanup_old_diagrams(self):
-        """Test cleanup of old diagram files."""
-        # Create some old files
-        old_file1 = self.temp_dir / "old_diagram1.png"
-        old_file2 = self.temp_dir / "old_diagram2.png"
-        new_file = self.temp_dir / "new_diagram.png"
-        
-        old_file1.write_bytes(b"old content")
-        old_file2.write_bytes(b"old content")
-        new_file.write_bytes(b"new content")
-        
-        # Mock file modification times
-        import time
-        old_time = time.time() - (25 * 3600)  # 25 hours ago
-        new_time = time.time() - (1 * 3600)   # 1 hour ago
-        
-        with patch.object(Path, 'stat') as mock_stat:
-            def stat_side_effect(path_self):
-                mock_result = MagicMock()
-                if "old_" in str(path_self):
-                    mock_result.st_mtime = old_time
-                else:
-                    mock_result.st_mtime = new_time
-                return mock_result
-            
-            mock_stat.side_effect = stat_side_effect
-            
-            # Test cleanup with 24 hour threshold
-            cleaned_count = await self.generator.cleanup_old_diagrams(max_age_hours=24)
-        
-        # Should report attempting to clean 2 old files
-        # Note: actual deletion is mocked by the Path.unlink method
-        assert cleaned_count >= 0  # May be 0 due to mocking, but should not error
+        """Test that cleanup evicts least-recently-used images beyond the size bound."""
+        import os
+
+        for index, name in enumerate(["old_diagram1", "old_diagram2", "new_diagram"]):
+            image = self.temp_dir / f"{name}.png"
+            image.write_bytes(b"x" * 1000)
+            os.utime(image, (index + 1, index + 1))
+        self.generator.image_store.max_size_bytes = 1500
+
+        cleaned_count = await self.generator.cleanup_old_diagrams()
+
+        assert cleaned_count == 2
+        assert (self.temp_dir / "new_diagram.png").exists()
+        assert not (self.temp_dir / "old_diagram1.png").exists()
+
+    @pytest.mark.asyncio
+    async def test_render_cache_reuses_identical_diagrams(self):
+        """Test that an identical spec is served from the image store without rendering."""
+        spec = DiagramSpec(
+            diagram_type="microservices",
+            title="Cached Architecture",
+            components=[
+                DiagramComponent(name="API", component_type="api", icon_provider="aws", icon_name="api"),
+                DiagramComponent(name="Service", component_type="service", icon_provider="aws", icon_name="svc")
+            ]
+        )
+        self.generator.use_process_pool = False
+
+        def fake_render(render_spec, output_path):
+            Path(f"{output_path}.png").write_bytes(b"png" * 1000)
+
+        with patch.object(self.generator, '_generate_diagram_sync', side_effect=fake_render) as mock_sync:
+            first = await self.generator.generate_diagram(spec)
+            second = await self.generator.generate_diagram(spec)
+
+        assert mock_sync.call_count == 1
+        assert first.cached is False
+        assert second.cached is True
+        assert second.image_path == first.image_path
+        assert first.image_path.name == f"{self.generator.get_cache_key(spec)}.png"
+        assert not list(self.temp_dir.glob(".render-*"))
+
+        restyled = DiagramGenerator(self.temp_dir, {**self.styling_config, "dpi": 150})
+        assert restyled.get_cache_key(spec) != first.image_path.stem
+
+    def test_dot_defaults_match_diagrams_library(self):
+        """Test that the DOT engine mirrors the diagrams library defaults."""
+        diagrams = pytest.importorskip("diagrams")
+        from src.tools import dot_emitter
+
+        assert dot_emitter.DOT_DEFAULT_GRAPH_ATTRS == diagrams.Diagram._default_graph_attrs
+        assert dot_emitter.DOT_DEFAULT_NODE_ATTRS == diagrams.Diagram._default_node_attrs
+        assert dot_emitter.DOT_DEFAULT_EDGE_ATTRS == diagrams.Diagram._default_edge_attrs
+        assert dot_emitter.DOT_DEFAULT_CONNECTION_ATTRS == diagrams.Edge._default_edge_attrs
+        assert dot_emitter.DEFAULT_ICON_HEIGHT == diagrams.Node._height
+
+    def test_compile_dot(self):
+        """Test compiling a specification straight to DOT source."""
+        pytest.importorskip("diagrams")
+        spec = DiagramSpec(
+            diagram_type="microservices",
+            title='Orders "v2"',
+            components=[
+                DiagramComponent(name="API", component_type="api", icon_provider="aws", icon_name="api"),
+                DiagramComponent(name="Queue", component_type="queue", icon_provider="aws", icon_name="sqs")
+            ],
+            connections=[
+                DiagramConnection(source="API", target="Queue", connection_type="arrow"),
+                DiagramConnection(source="Queue", target="API", connection_type="bidirectional"),
+                DiagramConnection(source="API", target="Missing", connection_type="arrow")
+            ],
+            layout_direction="LR"
+        )
+
+        source = self.generator.compile_dot(spec)
+
+        assert source.startswith('digraph "Orders \\"v2\\"" {')
+        assert 'rankdir="LR"' in source
+        assert 'dpi="300"' in source
+        assert '"n0" [label="API"' in source
+        assert '"n0" -> "n1" [dir="forward"' in source
+        assert '"n1" -> "n0" [dir="none"' in source
+        assert source.count("->") == 2
+
+        image_paths = [line.split('image="')[1].split('"')[0] for line in source.splitlines() if "image=" in line]
+        assert len(image_paths) == 2
+        assert all(Path(path).exists() for path in image_paths)
+
+    def test_dot_engine_invokes_dot_once(self):
+        """Test that the DOT engine pipes the compiled source into a single dot call."""
+        spec = DiagramSpec(
+            diagram_type="microservices",
+            title="Single Call",
+            components=[
+                DiagramComponent(name="API", component_type="api", icon_provider="aws", icon_name="api"),
+                DiagramComponent(name="Service", component_type="service", icon_provider="aws", icon_name="svc")
+            ]
+        )
+
+        with patch('src.tools.diagram_generator.settings') as mock_settings, \
+             patch('src.tools.dot_emitter.subprocess.run') as mock_run:
+            mock_settings.diagram_engine = "dot"
+            mock_settings.keyrus_secondary_color = "#333333"
+            mock_settings.diagram_dpi = 300
+            self.generator._generate_diagram_sync(spec, str(self.temp_dir / "single_call"))
+
+        mock_run.assert_called_once()
+        command = mock_run.call_args.args[0]
+        assert command[0] == "dot"
+        assert command[-1] == str(self.temp_dir / "single_call.png")
+        assert mock_run.call_args.kwargs["input"] == self.generator.compile_dot(spec).encode("utf-8")
+
+    def test_worker_render_skips_image_store(self):
+        """Test that rendering in a worker never builds the disk-backed image store."""
+        spec = DiagramSpec(
+            diagram_type="microservices",
+            title="Worker Render",
+            components=[
+                DiagramComponent(name="API", component_type="api", icon_provider="aws", icon_name="api"),
+                DiagramComponent(name="Service", component_type="service", icon_provider="aws", icon_name="svc")
+            ]
+        )
+        output_path = str(self.temp_dir / "worker_render")
+
+        with patch('src.tools.diagram_generator.settings') as mock_settings, \
+             patch('src.tools.diagram_generator.DiskCache') as mock_store, \
+             patch('src.tools.diagram_generator.render_dot') as mock_render:
+            mock_settings.diagram_engine = "dot"
+            mock_settings.keyrus_secondary_color = "#333333"
+            mock_settings.diagram_dpi = 300
+            diagram_generator.render_diagram(self.styling_config, spec, output_path)
+
+        mock_store.assert_not_called()
+        mock_render.assert_called_once_with(self.generator.compile_dot(spec), f"{output_path}.png")
 
     def test_get_graph_attributes(self):
         """Test graph attribute generation for styling."""
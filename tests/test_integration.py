@@ -85,8 +85,10 @@ class TestOrchestrationIntegration:
             # Setup mock presentation builder
             mock_builder_instance = Mock()
             output_path = temp_dir / "test_presentation.pptx"
-            output_path.write_bytes(b"mock presentation content")
-            mock_builder_instance.build_presentation = AsyncMock(return_value=output_path)
+            presentation_buffer = BytesIO(b"mock presentation content")
+            presentation_buffer.name = output_path.name
+            mock_builder_instance.build_presentation_buffer = AsyncMock(return_value=presentation_buffer)
+            mock_builder_instance.save_presentation_buffer = Mock(return_value=output_path)
             mock_builder.return_value = mock_builder_instance
             
             # Run the orchestration
@@ -100,8 +102,8 @@ class TestOrchestrationIntegration:
             
             # Verify results
             assert results["success"] is True
-            assert "presentation_path" in results
-            assert results["presentation_path"].exists()
+            assert results["presentation_buffer"].getvalue() == b"mock presentation content"
+            assert results["presentation_filename"] == output_path.name
             assert "project_analysis" in results
             assert "document_analysis" in results
             assert "generation_result" in results
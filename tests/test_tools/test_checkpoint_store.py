@@ -0,0 +1,77 @@
+"""
+Tests for pipeline stage checkpoints.
+"""
+
+import pytest
+
+from src.chains.pipeline import Pipeline, Stage
+from src.models.data_models import DocumentAnalysisResult
+from src.tools.checkpoint_store import CheckpointStore, make_run_key
+
+
+class TestCheckpointStore:
+    """Test cases for CheckpointStore and run keys."""
+
+    def test_run_key_depends_on_inputs(self, sample_project_description):
+        """Test that the run key changes with files and options but is stable otherwise."""
+        key = make_run_key(sample_project_description, ["abc"], target_slide_count=10)
+
+        assert key == make_run_key(sample_project_description, ["abc"], target_slide_count=10)
+        assert key != make_run_key(sample_project_description, ["abd"], target_slide_count=10)
+        assert key != make_run_key(sample_project_description, ["abc"], target_slide_count=12)
+
+        changed = sample_project_description.model_copy(update={"industry": "Retail"})
+        assert key != make_run_key(changed, ["abc"], target_slide_count=10)
+
+    def test_save_and_load_round_trip(self, temp_dir):
+        """Test that a stage result is restored only for the same run."""
+        store = CheckpointStore(temp_dir)
+        result = DocumentAnalysisResult(analysis="Summary", key_themes=["cloud"], source_documents=2)
+
+        store.for_run("run1").save("analyzing_documents", result)
+
+        restored = store.for_run("run1").load("analyzing_documents", DocumentAnalysisResult)
+        assert restored == result
+        assert store.for_run("run2").load("analyzing_documents", DocumentAnalysisResult) is None
+
+    def test_invalid_checkpoint_is_not_restored(self, temp_dir):
+        """Test that the validity check can reject a restored result."""
+        checkpoint = CheckpointStore(temp_dir).for_run("run")
+        checkpoint.save("analyzing_documents", DocumentAnalysisResult(analysis="Summary", source_documents=0))
+
+        restored = checkpoint.load(
+            "analyzing_documents", DocumentAnalysisResult, lambda result: result.source_documents > 0
+        )
+
+        assert restored is None
+
+    @pytest.mark.asyncio
+    async def test_pipeline_saves_only_valid_results(self, temp_dir):
+        """Test that degraded results are not checkpointed and valid ones skip the rerun."""
+        checkpoint = CheckpointStore(temp_dir).for_run("run")
+        calls = []
+
+        def build(analysis):
+            async def analyze():
+                calls.append(analysis)
+                return DocumentAnalysisResult(
+                    analysis=analysis, source_documents=1,
+                    degraded=analysis.startswith("Analysis failed")
+                )
+            return Pipeline(
+                [Stage(
+                    "analyzing_documents", analyze, outputs=["analysis"],
+                    checkpoint_model=DocumentAnalysisResult,
+                    checkpoint_valid=lambda result: not result.degraded
+                )],
+                checkpoint=checkpoint
+            )
+
+        await build("Analysis failed: timeout").run({})
+        await build("Summary").run({})
+        pipeline = build("Other")
+        values = await pipeline.run({})
+
+        assert calls == ["Analysis failed: timeout", "Summary"]
+        assert values["analysis"].analysis == "Summary"
+        assert pipeline.stage_results["analyzing_documents"]["status"] == "restored"
@@ -0,0 +1,122 @@
+"""
+Tests for near-duplicate slide deduplication.
+"""
+
+import time
+
+import pytest
+from pydantic import ValidationError
+
+from src.config.settings import Settings
+
+from src.models.data_models import ExtractedContent, SourceReference
+from src.tools.content_deduplicator import ContentDeduplicator, simhash
+
+
+BASE_TEXT = (
+    "Our cloud data platform migration approach starts with a discovery phase "
+    "covering source systems, data volumes and governance requirements, followed "
+    "by a pilot on Azure Data Factory and Databricks with automated testing, "
+    "cost monitoring and a phased cutover plan agreed with the business owners"
+)
+
+
+def _slide(number, content, source_file="deck.pptx", title="Migration Approach"):
+    """Build an ExtractedContent item for tests."""
+    return ExtractedContent(
+        slide_number=number,
+        title=title,
+        content=content,
+        layout_type="Title and Content",
+        source_file=source_file
+    )
+
+
+class TestContentDeduplicator:
+    """Test cases for ContentDeduplicator."""
+
+    def test_simhash_is_stable_and_similar_for_near_duplicates(self):
+        """Test that fingerprints are deterministic and close for small edits."""
+        edited = BASE_TEXT.replace("business owners", "business stakeholders")
+
+        assert simhash(BASE_TEXT) == simhash(BASE_TEXT)
+        assert (simhash(BASE_TEXT) ^ simhash(edited)).bit_count() <= 6
+        assert simhash("") is None
+
+    def test_merges_near_duplicates_across_files(self):
+        """Test that forked slides collapse into the first occurrence with pointers."""
+        documents = [
+            _slide(3, BASE_TEXT, source_file="client_a.pptx"),
+            _slide(1, "Team structure with delivery lead, architects and engineers", title="Team"),
+            _slide(5, BASE_TEXT.replace("business owners", "business stakeholders"),
+                   source_file="client_b.pptx"),
+            _slide(7, BASE_TEXT, source_file="client_c.pptx"),
+        ]
+
+        deduplicated, stats = ContentDeduplicator(similarity=0.9).deduplicate(documents)
+
+        assert [doc.source_file for doc in deduplicated] == ["client_a.pptx", "deck.pptx"]
+        assert deduplicated[0].duplicates == [
+            SourceReference(source_file="client_b.pptx", slide_number=5),
+            SourceReference(source_file="client_c.pptx", slide_number=7),
+        ]
+        assert deduplicated[1].duplicates == []
+        assert stats["duplicates_merged"] == 2
+        assert stats["tokens_saved"] > 0
+
+    def test_strict_threshold_keeps_edited_slides(self):
+        """Test that similarity 1.0 only merges identical fingerprints."""
+        documents = [
+            _slide(1, BASE_TEXT),
+            _slide(2, BASE_TEXT.replace("discovery phase", "scoping workshop")),
+        ]
+
+        deduplicated, _ = ContentDeduplicator(similarity=1.0).deduplicate(documents)
+
+        assert len(deduplicated) == 2
+
+    def test_lowest_allowed_setting_uses_banded_search(self):
+        """Test that every similarity the setting accepts keeps the banded candidate search."""
+        field = Settings.model_fields["slide_dedup_similarity"]
+        lowest = next(constraint.ge for constraint in field.metadata if hasattr(constraint, "ge"))
+
+        deduplicator = ContentDeduplicator(similarity=lowest)
+        _, stats = deduplicator.deduplicate([_slide(1, BASE_TEXT)])
+
+        assert deduplicator.bands
+        assert stats["candidate_search"] == "banded"
+        with pytest.raises(ValidationError):
+            Settings(openai_api_key="sk-test", slide_dedup_similarity=lowest - 0.01)
+
+    @pytest.mark.parametrize("similarity", [0.5, 0.8])
+    def test_loose_threshold_uses_pairwise_scan(self, similarity):
+        """Test that similarities too loose for useful bands match exactly like banding would."""
+        documents = [
+            _slide(1, BASE_TEXT, source_file="deck_a.pptx"),
+            _slide(2, "Quarterly revenue grew in every region"),
+            _slide(1, BASE_TEXT.replace("discovery phase", "scoping workshop"), source_file="deck_b.pptx"),
+        ]
+        deduplicator = ContentDeduplicator(similarity=similarity)
+
+        deduplicated, stats = deduplicator.deduplicate(documents)
+
+        assert deduplicator.bands == []
+        assert stats["candidate_search"] == "pairwise"
+        assert "deck_b.pptx" in {ref.source_file for ref in deduplicated[0].duplicates}
+        assert ContentDeduplicator(similarity=0.9).bands
+
+    def test_scales_to_thousands_of_slides(self):
+        """Test that a few thousand distinct slides deduplicate quickly."""
+        documents = [
+            _slide(i, f"Case study {i}: {BASE_TEXT.split()[i % 40]} project number {i * 7919} "
+                      f"for customer segment {i % 13} in region {i % 29}", title=f"Case {i}")
+            for i in range(1, 3001)
+        ]
+
+        start = time.perf_counter()
+        deduplicated, stats = ContentDeduplicator(similarity=0.9).deduplicate(documents)
+        elapsed = time.perf_counter() - start
+
+        assert stats["items_before"] == 3000
+        assert len(deduplicated) > 2500
+        assert elapsed < 5.0
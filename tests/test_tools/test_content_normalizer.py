@@ -0,0 +1,61 @@
+"""
+Tests for boilerplate stripping.
+"""
+
+from src.models.data_models import ExtractedContent
+from src.tools.content_normalizer import ContentNormalizer
+
+
+def _slide(number, content, source_file="deck.pptx"):
+    """Build an ExtractedContent item for tests."""
+    return ExtractedContent(
+        slide_number=number,
+        title=f"Slide {number}",
+        content=content,
+        layout_type="Title and Content",
+        source_file=source_file
+    )
+
+
+class TestContentNormalizer:
+    """Test cases for ContentNormalizer."""
+
+    def test_strips_recurring_lines_per_file(self):
+        """Test that footers and slide numbers repeated on most slides are removed."""
+        topics = ["Data lake design", "Streaming ingestion", "BI dashboards", "Cost model"]
+        documents = [
+            _slide(i, f"{topic}\nConfidential - Acme Corp\nPage {i} of 4")
+            for i, topic in enumerate(topics, 1)
+        ]
+
+        normalized, stats = ContentNormalizer(line_fraction=0.6, min_slides=3).normalize(documents)
+
+        assert [doc.content for doc in normalized] == topics
+        assert [doc.slide_number for doc in normalized] == [1, 2, 3, 4]
+        assert stats["files"]["deck.pptx"]["lines_removed"] == 8
+        assert stats["chars_saved"] > 0
+        assert stats["tokens_saved"] > 0
+        # Inputs are not mutated
+        assert "Confidential" in documents[0].content
+
+    def test_boilerplate_is_per_source_file(self):
+        """Test that a line common in one file is kept in another file."""
+        bodies = ["Migration plan", "Security review", "Team structure"]
+        documents = [_slide(i, f"{body}\nShared footer") for i, body in enumerate(bodies, 1)]
+        documents.append(_slide(1, "Intro\nShared footer", source_file="other.pdf"))
+
+        normalized, stats = ContentNormalizer(line_fraction=0.6, min_slides=3).normalize(documents)
+
+        assert normalized[0].content == "Migration plan"
+        assert normalized[3].content == "Intro\nShared footer"
+        assert stats["files"]["other.pdf"]["lines_removed"] == 0
+
+    def test_collapses_whitespace_without_enough_slides(self):
+        """Test whitespace collapsing on files too small for boilerplate detection."""
+        documents = [_slide(1, "  Cloud\t\t migration \v\n\n roadmap  ")]
+
+        normalized, stats = ContentNormalizer(min_slides=3).normalize(documents)
+
+        assert normalized[0].content == "Cloud migration\nroadmap"
+        assert stats["files"]["deck.pptx"]["boilerplate_lines"] == 0
+        assert stats["chars_saved"] == len(documents[0].content) - len(normalized[0].content)
@@ -0,0 +1,80 @@
+"""
+Tests for the size-bounded on-disk cache.
+"""
+
+import os
+
+from src.tools.disk_cache import DiskCache
+
+
+class TestDiskCache:
+    """Test cases for DiskCache."""
+
+    def test_get_set_roundtrip(self, temp_dir):
+        """Test storing and reading back an entry."""
+        cache = DiskCache(temp_dir, max_size_bytes=1024)
+
+        assert cache.get("missing") is None
+
+        cache.set("key", b"value")
+
+        assert cache.get("key") == b"value"
+        stats = cache.get_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == 0.5
+        assert stats["size_bytes"] == 5
+
+    def test_lru_eviction(self, temp_dir):
+        """Test that least-recently-used entries are evicted first."""
+        cache = DiskCache(temp_dir, max_size_bytes=250)
+
+        cache.set("a", b"a" * 100)
+        cache.set("b", b"b" * 100)
+        # Make "a" older than "b", then touch it so "b" becomes the LRU entry
+        os.utime(cache._entry_path("a"), (1, 1))
+        os.utime(cache._entry_path("b"), (2, 2))
+        assert cache.get("a") is not None
+
+        cache.set("c", b"c" * 100)
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.get("c") is not None
+        assert cache.get_stats()["evictions"] == 1
+        assert cache.get_stats()["size_bytes"] <= 250
+
+    def test_size_survives_restart(self, temp_dir):
+        """Test that a new instance picks up existing entries."""
+        DiskCache(temp_dir, max_size_bytes=1024).set("key", b"12345")
+
+        cache = DiskCache(temp_dir, max_size_bytes=1024)
+
+        assert cache.get_stats()["size_bytes"] == 5
+        assert cache.get("key") == b"12345"
+
+    def test_delete_and_clear(self, temp_dir):
+        """Test removing entries."""
+        cache = DiskCache(temp_dir, max_size_bytes=1024)
+        cache.set("a", b"1")
+        cache.set("b", b"2")
+
+        cache.delete("a")
+        assert cache.get("a") is None
+
+        cache.clear()
+        assert cache.get("b") is None
+        assert cache.get_stats()["size_bytes"] == 0
+
+    def test_file_entries(self, temp_dir):
+        """Test moving files into the cache and looking them up by path."""
+        cache = DiskCache(temp_dir / "cache", max_size_bytes=1024, suffix=".png")
+        source = temp_dir / "render.png"
+        source.write_bytes(b"image")
+
+        stored = cache.set_file("key", source)
+
+        assert not source.exists()
+        assert cache.get_path("key") == stored
+        assert cache.get_path("missing") is None
+        assert cache.get_stats()["size_bytes"] == 5
@@ -2,19 +2,71 @@
 Tests for document processor functionality.
 """
 
+import asyncio
+
 import pytest
 from io import BytesIO
 from pathlib import Path
 from unittest.mock import Mock, patch
 
-from src.tools.document_processor import DocumentProcessor
+from src.config.settings import settings
+from src.tools.document_processor import DocumentProcessor, hash_file_source, shutdown_extraction_pool
 from src.models.data_models import ExtractedContent
 
 
 @pytest.fixture
 def document_processor():
     """Create a DocumentProcessor instance for testing."""
-    return DocumentProcessor()
+    return DocumentProcessor(use_process_pool=False, use_cache=False)
+
+
+@pytest.fixture
+def sample_pptx_bytes():
+    """Build a small real PowerPoint deck in memory."""
+    from pptx import Presentation
+
+    presentation = Presentation()
+    layout = presentation.slide_layouts[1]  # Title and Content
+
+    for i in range(1, 4):
+        slide = presentation.slides.add_slide(layout)
+        slide.shapes.title.text = f"Slide Title {i}"
+        slide.placeholders[1].text = f"Body text for slide {i}"
+
+    buffer = BytesIO()
+    presentation.save(buffer)
+    return buffer.getvalue()
+
+
+@pytest.fixture
+def sample_pdf_bytes():
+    """Build a 12-page text PDF in memory (page 7 is blank)."""
+    from pypdf import PdfWriter
+    from pypdf.generic import DecodedStreamObject, DictionaryObject, NameObject
+
+    writer = PdfWriter()
+    font_ref = writer._add_object(DictionaryObject({
+        NameObject("/Type"): NameObject("/Font"),
+        NameObject("/Subtype"): NameObject("/Type1"),
+        NameObject("/BaseFont"): NameObject("/Helvetica"),
+    }))
+
+    for i in range(1, 13):
+        page = writer.add_blank_page(612, 792)
+        if i == 7:
+            continue
+        stream = DecodedStreamObject()
+        stream.set_data(
+            f"BT /F1 12 Tf 72 720 Td (Page heading {i}) Tj 0 -20 Td (Body text {i}) Tj ET".encode()
+        )
+        page[NameObject("/Contents")] = writer._add_object(stream)
+        page[NameObject("/Resources")] = DictionaryObject({
+            NameObject("/Font"): DictionaryObject({NameObject("/F1"): font_ref})
+        })
+
+    buffer = BytesIO()
+    writer.write(buffer)
+    return buffer.getvalue()
 
 
 @pytest.fixture
@@ -146,6 +198,222 @@ class TestDocumentProcessor:
             assert len(result) == 3
             assert mock_process.call_count == 2
 
+    @pytest.mark.asyncio
+    async def test_process_multiple_documents_isolates_failures(self, document_processor):
+        """Test that one failing document does not affect the others or their order."""
+        first = Mock(spec=ExtractedContent)
+        third = Mock(spec=ExtractedContent)
+
+        with patch.object(document_processor, 'process_document') as mock_process:
+            mock_process.side_effect = [[first], ValueError("corrupted"), [third]]
+
+            documents = [
+                (BytesIO(b"test1"), "test1.pptx", "pptx"),
+                (BytesIO(b"test2"), "test2.pptx", "pptx"),
+                (BytesIO(b"test3"), "test3.pdf", "pdf")
+            ]
+
+            result = await document_processor.process_multiple_documents(documents)
+
+            assert result == [first, third]
+
+    @pytest.mark.asyncio
+    async def test_process_document_in_process_pool(self, sample_pptx_bytes):
+        """Test that pool extraction matches in-process extraction."""
+        inline_processor = DocumentProcessor(use_process_pool=False, use_cache=False)
+        pool_processor = DocumentProcessor(use_process_pool=True, use_cache=False)
+
+        try:
+            inline_result = await inline_processor.process_document(
+                BytesIO(sample_pptx_bytes), "deck.pptx", "pptx"
+            )
+            pool_result = await pool_processor.process_document(
+                BytesIO(sample_pptx_bytes), "deck.pptx", "pptx"
+            )
+        finally:
+            shutdown_extraction_pool()
+
+        assert len(inline_result) == 3
+        assert pool_result == inline_result
+        assert pool_result[0].title == "Slide Title 1"
+
+    @pytest.mark.asyncio
+    async def test_broken_pool_falls_back_off_event_loop(self, sample_pptx_bytes):
+        """Test that a broken pool is retried in a thread and discarded without touching its replacement."""
+        from concurrent.futures.process import BrokenProcessPool
+        from src.tools import document_processor as document_processor_module
+
+        pool_processor = DocumentProcessor(use_process_pool=True, use_cache=False)
+        broken_pool = Mock()
+        broken_pool.submit.side_effect = BrokenProcessPool("worker crashed")
+        # Pool another request created after this one picked up the broken pool
+        replacement_pool = Mock()
+
+        with patch('src.tools.document_processor._get_extraction_pool', return_value=broken_pool), \
+             patch('src.tools.document_processor._extraction_pool', replacement_pool), \
+             patch('src.tools.document_processor.asyncio.to_thread', wraps=asyncio.to_thread) as to_thread:
+            result = await pool_processor.process_document(
+                BytesIO(sample_pptx_bytes), "deck.pptx", "pptx"
+            )
+            assert document_processor_module._extraction_pool is replacement_pool
+
+        assert to_thread.call_count == 1
+        assert [item.title for item in result][0] == "Slide Title 1"
+        broken_pool.shutdown.assert_called_once_with(wait=False, cancel_futures=True)
+        replacement_pool.shutdown.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_process_document_uses_extraction_cache(self, sample_pptx_bytes, temp_dir):
+        """Test that re-uploading the same bytes is served from the cache."""
+        with patch('src.tools.document_processor.settings') as mock_settings:
+            mock_settings.extraction_cache_dir = temp_dir
+            mock_settings.extraction_cache_max_mb = 10
+            processor = DocumentProcessor(use_process_pool=False, use_cache=True)
+
+        first = await processor.process_document(
+            BytesIO(sample_pptx_bytes), "deck.pptx", "pptx"
+        )
+
+        with patch.object(processor, '_extract_from_powerpoint') as mock_extract:
+            second = await processor.process_document(
+                BytesIO(sample_pptx_bytes), "renamed.pptx", "pptx"
+            )
+            mock_extract.assert_not_called()
+
+        assert [item.title for item in second] == [item.title for item in first]
+        assert all(item.source_file == "renamed.pptx" for item in second)
+
+        stats = processor.get_cache_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+
+    @pytest.mark.asyncio
+    async def test_cache_key_reuses_digest_and_hashes_off_loop(self, sample_pptx_bytes, temp_dir):
+        """Test that a known digest skips hashing and other uploads are hashed in a thread."""
+        with patch('src.tools.document_processor.settings') as mock_settings:
+            mock_settings.extraction_cache_dir = temp_dir
+            mock_settings.extraction_cache_max_mb = 10
+            processor = DocumentProcessor(use_process_pool=False, use_cache=True)
+
+        file_hash = hash_file_source(BytesIO(sample_pptx_bytes))
+        await processor.process_document(BytesIO(sample_pptx_bytes), "deck.pptx", "pptx")
+
+        with patch('src.tools.document_processor.hash_file_source') as mock_hash, \
+             patch('src.tools.document_processor.asyncio.to_thread', wraps=asyncio.to_thread) as to_thread:
+            cached = [
+                item async for item in processor.aiter_document(
+                    BytesIO(sample_pptx_bytes), "deck.pptx", "pptx", file_hash=file_hash
+                )
+            ]
+            mock_hash.assert_not_called()
+
+            mock_hash.return_value = file_hash
+            await processor.process_document(BytesIO(sample_pptx_bytes), "deck.pptx", "pptx")
+
+        assert len(cached) == 3
+        assert to_thread.call_args_list[0].args[0] is mock_hash
+        assert processor.get_cache_stats()["hits"] == 2
+
+    @pytest.mark.asyncio
+    async def test_process_pdf_in_page_shards(self, document_processor, sample_pdf_bytes):
+        """Test that page-parallel PDF extraction matches serial extraction."""
+        serial_result = await document_processor.process_document(
+            BytesIO(sample_pdf_bytes), "rfp.pdf", "pdf"
+        )
+
+        pool_processor = DocumentProcessor(use_process_pool=True, use_cache=False)
+        try:
+            with patch.object(settings, 'pdf_parallel_page_threshold', 5), \
+                 patch.object(settings, 'pdf_shard_pages', 4):
+                shards = await pool_processor._plan_pdf_shards(sample_pdf_bytes, "rfp.pdf")
+                sharded_result = await pool_processor.process_document(
+                    BytesIO(sample_pdf_bytes), "rfp.pdf", "pdf"
+                )
+                streamed_result = [
+                    item async for item in pool_processor.aiter_document(
+                        BytesIO(sample_pdf_bytes), "rfp.pdf", "pdf"
+                    )
+                ]
+        finally:
+            shutdown_extraction_pool()
+
+        assert shards == [(0, 4), (4, 8), (8, 12)]
+        assert len(serial_result) == 11
+        assert sharded_result == serial_result
+        assert streamed_result == serial_result
+        assert serial_result[0].title == "Page heading 1"
+        assert [item.slide_number for item in sharded_result] == [1, 2, 3, 4, 5, 6, 8, 9, 10, 11, 12]
+
+    @pytest.mark.asyncio
+    async def test_process_pdf_from_path(self, document_processor, sample_pdf_bytes, temp_dir):
+        """Test that PDFs on disk (spooled uploads) match in-memory extraction."""
+        pdf_path = temp_dir / "upload_rfp.pdf"
+        pdf_path.write_bytes(sample_pdf_bytes)
+
+        from_path = await document_processor.process_document(pdf_path, "rfp.pdf", "pdf")
+        from_memory = await document_processor.process_document(
+            BytesIO(sample_pdf_bytes), "rfp.pdf", "pdf"
+        )
+
+        assert from_path == from_memory
+
+    @pytest.mark.asyncio
+    async def test_small_pdf_not_sharded(self, sample_pdf_bytes):
+        """Test that PDFs below the page threshold are extracted serially."""
+        pool_processor = DocumentProcessor(use_process_pool=True, use_cache=False)
+
+        with patch.object(settings, 'pdf_parallel_page_threshold', 100):
+            shards = await pool_processor._plan_pdf_shards(sample_pdf_bytes, "short.pdf")
+
+        assert shards is None
+
+    @pytest.mark.asyncio
+    async def test_aiter_document_matches_process_document(self, document_processor, sample_pptx_bytes):
+        """Test that streaming yields the same items as whole-document extraction."""
+        expected = await document_processor.process_document(
+            BytesIO(sample_pptx_bytes), "deck.pptx", "pptx"
+        )
+
+        streamed = [
+            item async for item in document_processor.aiter_document(
+                BytesIO(sample_pptx_bytes), "deck.pptx", "pptx"
+            )
+        ]
+
+        assert streamed == expected
+
+    @pytest.mark.asyncio
+    async def test_aiter_document_stops_at_budget(self, sample_pptx_bytes, temp_dir):
+        """Test that the item budget stops extraction early and is not cached."""
+        with patch('src.tools.document_processor.settings') as mock_settings:
+            mock_settings.extraction_cache_dir = temp_dir
+            mock_settings.extraction_cache_max_mb = 10
+            processor = DocumentProcessor(use_process_pool=False, use_cache=True)
+
+        streamed = [
+            item async for item in processor.aiter_document(
+                BytesIO(sample_pptx_bytes), "deck.pptx", "pptx", max_items=2
+            )
+        ]
+
+        assert [item.title for item in streamed] == ["Slide Title 1", "Slide Title 2"]
+        assert processor.get_cache_stats()["size_bytes"] == 0
+
+        full = [
+            item async for item in processor.aiter_document(
+                BytesIO(sample_pptx_bytes), "deck.pptx", "pptx"
+            )
+        ]
+        assert len(full) == 3
+        assert processor.get_cache_stats()["size_bytes"] > 0
+
+    @pytest.mark.asyncio
+    async def test_aiter_document_invalid_type(self, document_processor):
+        """Test streaming rejects unsupported file types."""
+        with pytest.raises(ValueError, match="Unsupported file type"):
+            async for _ in document_processor.aiter_document(BytesIO(b"test"), "test.txt", "txt"):
+                pass
+
     def test_estimate_processing_time(self, document_processor):
         """Test processing time estimation."""
         # Test with small files
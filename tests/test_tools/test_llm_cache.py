@@ -0,0 +1,124 @@
+"""
+Tests for the persistent LLM response cache.
+"""
+
+import json
+import time
+
+import pytest
+from langchain.prompts import PromptTemplate
+from langchain_core.messages import AIMessage
+from unittest.mock import AsyncMock, Mock, patch
+
+from src.tools.llm_cache import CachedLLMChain, LLMResponseCache, build_llm_chain
+
+
+@pytest.fixture
+def cache(temp_dir):
+    """LLM response cache in a temporary directory without expiry."""
+    return LLMResponseCache(cache_dir=temp_dir, max_size_bytes=1024 * 1024, ttl_seconds=0)
+
+
+@pytest.fixture
+def prompt():
+    """Simple prompt template."""
+    return PromptTemplate(input_variables=["topic"], template="Describe {topic} as JSON")
+
+
+def _cached_chain(prompt, cache, responses, temperature=0.2, validate=None):
+    """Build a CachedLLMChain whose underlying runnable returns the given responses."""
+    llm = Mock(model_name="gpt-4o-mini", temperature=temperature)
+    chain = CachedLLMChain(prompt, llm, "project_analysis", cache, validate=validate)
+    chain.runnable = Mock(ainvoke=AsyncMock(side_effect=[AIMessage(content=r) for r in responses]))
+    return chain
+
+
+class TestLLMResponseCache:
+    """Test cases for LLMResponseCache and CachedLLMChain."""
+
+    def test_key_depends_on_model_temperature_and_prompt(self):
+        """Test that every key component changes the cache key."""
+        base = LLMResponseCache.make_key("gpt-4o-mini", 0.2, "prompt")
+
+        assert base == LLMResponseCache.make_key("gpt-4o-mini", 0.2, "prompt")
+        assert base != LLMResponseCache.make_key("gpt-4o", 0.2, "prompt")
+        assert base != LLMResponseCache.make_key("gpt-4o-mini", 0.3, "prompt")
+        assert base != LLMResponseCache.make_key("gpt-4o-mini", 0.2, "prompt!")
+
+    @pytest.mark.asyncio
+    async def test_identical_request_is_served_from_cache(self, cache, prompt):
+        """Test that the second identical call does not reach the LLM."""
+        chain = _cached_chain(prompt, cache, ['{"a": 1}', '{"a": 2}'])
+
+        first = await chain.ainvoke({"topic": "Kafka"})
+        second = await chain.ainvoke({"topic": "Kafka"})
+
+        assert first.content == second.content == '{"a": 1}'
+        assert chain.runnable.ainvoke.await_count == 1
+        stats = cache.get_stats()
+        assert (stats["hits"], stats["misses"], stats["hit_rate"]) == (1, 1, 0.5)
+        assert stats["chains"]["project_analysis"]["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_invalid_response_is_not_cached(self, cache, prompt):
+        """Test that a response failing validation is retried instead of replayed."""
+        chain = _cached_chain(prompt, cache, ['{"a": ', '{"a": 2}', '{"a": 3}'], validate=json.loads)
+
+        first = await chain.ainvoke({"topic": "Kafka"})
+        second = await chain.ainvoke({"topic": "Kafka"})
+        third = await chain.ainvoke({"topic": "Kafka"})
+
+        assert first.content == '{"a": '
+        assert second.content == third.content == '{"a": 2}'
+        assert chain.runnable.ainvoke.await_count == 2
+        assert cache.get_stats()["rejected"] == 1
+
+    @pytest.mark.asyncio
+    async def test_different_prompt_or_temperature_misses(self, cache, prompt):
+        """Test that changed inputs or temperature are not served from the cache."""
+        chain = _cached_chain(prompt, cache, ["one", "two"])
+        await chain.ainvoke({"topic": "Kafka"})
+        await chain.ainvoke({"topic": "Spark"})
+
+        warmer = _cached_chain(prompt, cache, ["three"], temperature=0.7)
+        result = await warmer.ainvoke({"topic": "Kafka"})
+
+        assert result.content == "three"
+        assert cache.get_stats()["hits"] == 0
+
+    def test_expired_entries_are_dropped(self, temp_dir):
+        """Test that entries older than the TTL count as misses and are removed."""
+        cache = LLMResponseCache(cache_dir=temp_dir, max_size_bytes=1024 * 1024, ttl_seconds=60)
+        key = LLMResponseCache.make_key("gpt-4o-mini", 0.2, "prompt")
+        cache.store.set(key, json.dumps({"created_at": time.time() - 120, "content": "old"}).encode())
+
+        assert cache.get(key) is None
+        assert cache.get_stats()["expired"] == 1
+        assert not list(temp_dir.glob("*.json"))
+
+    def test_size_bound_evicts_old_entries(self, temp_dir):
+        """Test that the cache directory stays within its size bound."""
+        cache = LLMResponseCache(cache_dir=temp_dir, max_size_bytes=2000, ttl_seconds=0)
+
+        for i in range(10):
+            cache.set(LLMResponseCache.make_key("m", 0, f"prompt {i}"), "x" * 500)
+
+        assert cache.get_stats()["size_bytes"] <= 2000
+        assert cache.get_stats()["evictions"] > 0
+
+    def test_per_chain_flags(self, prompt):
+        """Test that disabled chains get the plain runnable."""
+        llm = Mock(model_name="gpt-4o-mini", temperature=0.2)
+
+        with patch('src.tools.llm_cache.settings') as mock_settings, \
+             patch('src.tools.llm_cache.get_llm_cache') as mock_get_cache:
+            mock_settings.llm_cache_enabled = True
+            mock_settings.llm_cache_project_analysis = True
+            mock_settings.llm_cache_content_generation = False
+
+            assert isinstance(build_llm_chain(prompt, llm, "project_analysis"), CachedLLMChain)
+            assert not isinstance(build_llm_chain(prompt, llm, "content_generation"), CachedLLMChain)
+
+            mock_settings.llm_cache_enabled = False
+            assert not isinstance(build_llm_chain(prompt, llm, "project_analysis"), CachedLLMChain)
+            assert mock_get_cache.call_count == 1
@@ -0,0 +1,90 @@
+"""
+Tests for the raw-XML PowerPoint extractor.
+"""
+
+import pytest
+from io import BytesIO
+from unittest.mock import patch
+
+from pptx import Presentation
+from pptx.util import Inches
+
+from src.tools.document_processor import (
+    _iter_powerpoint_content,
+    _iter_powerpoint_content_python_pptx,
+)
+from src.tools.pptx_xml_extractor import iter_pptx_xml_content
+
+
+@pytest.fixture
+def varied_pptx_bytes():
+    """Build a deck with titles, line breaks, tables, groups and untitled slides."""
+    presentation = Presentation()
+
+    for i, layout in enumerate(presentation.slide_layouts):
+        slide = presentation.slides.add_slide(layout)
+
+        if slide.shapes.title is not None and i % 2 == 0:
+            slide.shapes.title.text = f"  Title {i}  "
+
+        textbox = slide.shapes.add_textbox(Inches(1), Inches(1), Inches(4), Inches(1))
+        paragraph = textbox.text_frame.paragraphs[0]
+        paragraph.add_run().text = f"Line {i}"
+        paragraph.add_line_break()
+        paragraph.add_run().text = "after break"
+        textbox.text_frame.add_paragraph().text = "Second paragraph"
+
+        table = slide.shapes.add_table(2, 2, Inches(1), Inches(3), Inches(3), Inches(1)).table
+        table.cell(0, 0).text = "Table cell"
+
+        group = slide.shapes.add_group_shape()
+        group.shapes.add_textbox(Inches(5), Inches(1), Inches(1), Inches(1)).text = "Grouped"
+
+    # Empty slide - skipped by both engines
+    presentation.slides.add_slide(presentation.slide_layouts[6])
+
+    buffer = BytesIO()
+    presentation.save(buffer)
+    return buffer.getvalue()
+
+
+class TestPptxXmlExtractor:
+    """Test cases for iter_pptx_xml_content."""
+
+    def test_matches_python_pptx(self, varied_pptx_bytes):
+        """Test that raw-XML output is identical to the python-pptx path."""
+        expected = list(_iter_powerpoint_content_python_pptx(BytesIO(varied_pptx_bytes), "deck.pptx"))
+        result = list(iter_pptx_xml_content(BytesIO(varied_pptx_bytes), "deck.pptx"))
+
+        assert len(result) == 11
+        assert result == expected
+        assert "Line 0\vafter break\nSecond paragraph" in result[0].content
+        assert all("Grouped" not in item.content for item in result)
+
+    def test_invalid_package_raises(self):
+        """Test that non-zip input raises so callers can fall back."""
+        with pytest.raises(Exception):
+            list(iter_pptx_xml_content(BytesIO(b"invalid pptx content"), "bad.pptx"))
+
+    def test_fallback_resumes_after_yielded_slides(self, varied_pptx_bytes):
+        """Test that a mid-deck failure falls back without duplicating slides."""
+        expected = list(_iter_powerpoint_content_python_pptx(BytesIO(varied_pptx_bytes), "deck.pptx"))
+
+        def failing_extractor(file_source, filename):
+            yield from list(iter_pptx_xml_content(file_source, filename))[:3]
+            raise KeyError("broken relationship")
+
+        with patch('src.tools.document_processor.iter_pptx_xml_content', failing_extractor):
+            result = list(_iter_powerpoint_content(BytesIO(varied_pptx_bytes), "deck.pptx"))
+
+        assert result == expected
+
+    def test_python_pptx_engine_setting(self, varied_pptx_bytes):
+        """Test that the python-pptx engine bypasses the raw-XML extractor."""
+        with patch('src.tools.document_processor.settings') as mock_settings, \
+             patch('src.tools.document_processor.iter_pptx_xml_content') as mock_xml:
+            mock_settings.pptx_extraction_engine = "python-pptx"
+            result = list(_iter_powerpoint_content(BytesIO(varied_pptx_bytes), "deck.pptx"))
+
+        mock_xml.assert_not_called()
+        assert len(result) == 11
@@ -0,0 +1,175 @@
+"""
+Tests for presentation assembly.
+"""
+
+import pytest
+from unittest.mock import patch
+
+from PIL import Image
+from pptx import Presentation
+from pptx.enum.shapes import MSO_SHAPE_TYPE
+from pptx.presentation import Presentation as PresentationObject
+
+from src.models.data_models import (
+    ContentGenerationResult,
+    DiagramComponent,
+    DiagramSpec,
+    GeneratedDiagram,
+)
+from src.tools import template_manager
+from src.tools.presentation_builder import PresentationBuilder
+
+
+@pytest.fixture
+def template_path(temp_dir):
+    """Template file built from the default python-pptx template."""
+    path = temp_dir / "template.pptx"
+    Presentation().save(str(path))
+    return path
+
+
+@pytest.fixture
+def sample_diagram(temp_dir):
+    """Generated diagram backed by a small PNG image."""
+    image_path = temp_dir / "diagram.png"
+    Image.new("RGB", (64, 48), "white").save(image_path)
+
+    spec = DiagramSpec(
+        diagram_type="microservices",
+        title="Solution Architecture",
+        components=[
+            DiagramComponent(name="API", component_type="api", icon_provider="aws", icon_name="APIGateway"),
+            DiagramComponent(name="Orders", component_type="service", icon_provider="aws", icon_name="Lambda"),
+        ]
+    )
+    return GeneratedDiagram(
+        spec=spec,
+        image_path=image_path,
+        file_size_kb=1,
+        generation_time_ms=1,
+        slide_target=2,
+        position={"left": 0.5, "top": 1.5, "width": 9.0, "height": 5.5}
+    )
+
+
+class TestPresentationBuilder:
+    """Test cases for PresentationBuilder."""
+
+    @pytest.mark.asyncio
+    async def test_single_pass_build(
+        self, temp_dir, template_path, sample_diagram, sample_project_description, sample_generated_slides
+    ):
+        """Test that the template is parsed once and the deck is saved once."""
+        generation_result = ContentGenerationResult(slides=sample_generated_slides, confidence_score=0.9)
+        builder = PresentationBuilder(template_path)
+
+        with patch('src.tools.presentation_builder.settings.output_dir', temp_dir), \
+             patch('src.tools.template_manager.settings.template_cache_enabled', False), \
+             patch('src.tools.template_manager.Presentation', wraps=template_manager.Presentation) as opened, \
+             patch.object(PresentationObject, 'save', autospec=True, side_effect=PresentationObject.save) as saved:
+            output_path = await builder.build_presentation(
+                sample_project_description,
+                generation_result,
+                output_filename="deck",
+                template_path=template_path,
+                diagrams=[sample_diagram]
+            )
+
+        assert opened.call_count == 1
+        assert saved.call_count == 1
+        assert builder.diagram_insertion_results["successful_insertions"] == 1
+
+        deck = Presentation(str(output_path))
+        slides = list(deck.slides)
+        assert [slide.shapes.title.text for slide in slides[:-1]] == [
+            slide.title for slide in sample_generated_slides
+        ]
+        assert any(shape.shape_type == MSO_SHAPE_TYPE.PICTURE for shape in slides[-1].shapes)
+        assert deck.core_properties.author == "Keyrus"
+
+    @pytest.mark.asyncio
+    async def test_build_presentation_buffer(
+        self, temp_dir, template_path, sample_project_description, sample_generated_slides
+    ):
+        """Test that the deck is built in memory and persisted only on request."""
+        generation_result = ContentGenerationResult(slides=sample_generated_slides, confidence_score=0.9)
+        output_dir = temp_dir / "generated"
+        builder = PresentationBuilder(template_path)
+
+        with patch('src.tools.presentation_builder.settings.output_dir', output_dir):
+            buffer = await builder.build_presentation_buffer(
+                sample_project_description, generation_result,
+                output_filename="deck", template_path=template_path
+            )
+            assert not output_dir.exists()
+
+            deck = Presentation(buffer)
+            assert len(deck.slides) == len(sample_generated_slides)
+            assert buffer.name == "deck.pptx"
+
+            saved_path = builder.save_presentation_buffer(buffer)
+
+        assert saved_path == output_dir / "deck.pptx"
+        assert saved_path.read_bytes() == buffer.getvalue()
+
+    @pytest.mark.asyncio
+    async def test_edits_patch_built_presentation(
+        self, temp_dir, template_path, sample_diagram, sample_project_description, sample_generated_slides
+    ):
+        """Test that slide edits patch the built deck without reloading the template."""
+        generation_result = ContentGenerationResult(slides=sample_generated_slides, confidence_score=0.9)
+        builder = PresentationBuilder(template_path)
+
+        with patch('src.tools.presentation_builder.settings.output_dir', temp_dir):
+            await builder.build_presentation(
+                sample_project_description, generation_result,
+                output_filename="deck", template_path=template_path, diagrams=[sample_diagram]
+            )
+
+        titles = [slide.title for slide in sample_generated_slides]
+        with patch.object(builder.template_manager, 'load_template') as load_template:
+            assert builder.customize_slide_content(1, ["Patched point"], new_title="Patched")
+            assert builder.add_slide("Added", ["New point"], position=1)
+            assert builder.remove_slide(3)
+            assert builder.reorder_slides([2, 1, 0])
+            output_path = builder.rebuild_presentation()
+
+        load_template.assert_not_called()
+
+        deck = Presentation(str(output_path))
+        slides = list(deck.slides)
+        assert [slide.shapes.title.text for slide in slides[:-1]] == ["Patched", "Added", titles[0]]
+        assert [slide.title for slide in builder.current_spec.slides] == ["Patched", "Added", titles[0]]
+        assert slides[0].placeholders[1].text_frame.text == "Patched point"
+        assert any(shape.shape_type == MSO_SHAPE_TYPE.PICTURE for shape in slides[-1].shapes)
+        assert builder.rebuild_presentation_buffer().getvalue() == output_path.read_bytes()
+
+    @pytest.mark.asyncio
+    async def test_edits_never_target_a_stale_deck(
+        self, temp_dir, template_path, sample_diagram, sample_project_description, sample_generated_slides
+    ):
+        """Test that negative indices are rejected and a failed build drops the previous deck."""
+        generation_result = ContentGenerationResult(slides=sample_generated_slides, confidence_score=0.9)
+        builder = PresentationBuilder(template_path)
+
+        with patch('src.tools.presentation_builder.settings.output_dir', temp_dir):
+            await builder.build_presentation(
+                sample_project_description, generation_result,
+                output_filename="deck", template_path=template_path, diagrams=[sample_diagram]
+            )
+
+            slide_count = len(builder.presentation.slides)
+            assert not builder.customize_slide_content(-1, ["Patched point"])
+            assert not builder.remove_slide(-1)
+            assert len(builder.presentation.slides) == slide_count
+
+            with patch.object(
+                builder.template_manager, 'build_presentation_from_spec', side_effect=ValueError("bad template")
+            ), pytest.raises(ValueError):
+                await builder.build_presentation(
+                    sample_project_description, generation_result,
+                    output_filename="other", template_path=template_path
+                )
+
+        assert builder.current_spec.output_path.name == "other.pptx"
+        assert builder.presentation is None
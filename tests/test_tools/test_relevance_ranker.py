@@ -0,0 +1,93 @@
+"""
+Tests for BM25 relevance ranking.
+"""
+
+import time
+
+from src.models.data_models import ExtractedContent
+from src.tools.relevance_ranker import RelevanceRanker, tokenize
+
+
+def _slide(number, title, content, source_file="deck.pptx"):
+    """Build an ExtractedContent item for tests."""
+    return ExtractedContent(
+        slide_number=number,
+        title=title,
+        content=content,
+        layout_type="Title and Content",
+        source_file=source_file
+    )
+
+
+PROJECT = "Migrate the on-premise data warehouse to a cloud lakehouse with real-time ingestion"
+
+
+class TestRelevanceRanker:
+    """Test cases for RelevanceRanker."""
+
+    def test_tokenize_drops_stop_words(self):
+        """Test that terms are lower-cased and stop words removed."""
+        assert tokenize("The Azure Data Lake and the warehouse") == ["azure", "data", "lake", "warehouse"]
+
+    def test_scores_relevant_slides_higher(self):
+        """Test that slides matching the description and technologies score highest."""
+        documents = [
+            _slide(1, "Office party", "Team photos from the summer event"),
+            _slide(2, "Lakehouse migration", "Moved the data warehouse to a Databricks lakehouse"),
+            _slide(3, "Streaming", "Real-time ingestion with Kafka into the cloud"),
+        ]
+
+        scores = RelevanceRanker().score(documents, PROJECT, ["Databricks"])
+
+        assert scores[0] == 0.0
+        assert scores[1] > scores[2] > 0.0
+
+    def test_key_technologies_boost_matching_slides(self):
+        """Test that key technologies change the ranking."""
+        documents = [
+            _slide(1, "Analytics", "Cloud analytics platform on Snowflake"),
+            _slide(2, "Analytics", "Cloud analytics platform on Databricks"),
+        ]
+
+        ranker = RelevanceRanker()
+        assert ranker.score(documents, "cloud analytics", ["Databricks"]).argmax() == 1
+        assert ranker.score(documents, "cloud analytics", ["Snowflake"]).argmax() == 0
+
+    def test_select_respects_budget_and_keeps_order(self):
+        """Test that the top slides within budget are returned in original order."""
+        documents = [
+            _slide(1, "Agenda", "Introductions and agenda"),
+            _slide(2, "Warehouse", "Cloud data warehouse migration " + "details " * 10),
+            _slide(3, "Lakehouse", "Lakehouse with real-time ingestion"),
+            _slide(4, "Thanks", "Questions"),
+        ]
+
+        selected, stats = RelevanceRanker(token_budget=45, top_k=None).select(documents, PROJECT)
+
+        assert [doc.slide_number for doc in selected] == [2, 3]
+        assert stats["items_selected"] == 2
+        assert stats["tokens_selected"] <= 45
+
+    def test_select_top_k(self):
+        """Test that top_k caps the number of selected slides."""
+        documents = [_slide(i, f"Lakehouse {i}", "cloud lakehouse " * i) for i in range(1, 6)]
+
+        selected, _ = RelevanceRanker(token_budget=10000, top_k=2).select(documents, PROJECT)
+
+        assert len(selected) == 2
+
+    def test_ranks_thousands_of_slides_quickly(self):
+        """Test that ranking a few thousand slides stays fast."""
+        words = PROJECT.split() + ["budget", "team", "timeline", "governance", "security"]
+        documents = [
+            _slide(i, f"Slide {i}", " ".join(words[(i * 7 + j) % len(words)] for j in range(60)))
+            for i in range(1, 5001)
+        ]
+
+        start = time.perf_counter()
+        selected, stats = RelevanceRanker(token_budget=20000).select(documents, PROJECT, ["Kafka"])
+        elapsed = time.perf_counter() - start
+
+        assert stats["items_before"] == 5000
+        assert 0 < len(selected) < 5000
+        assert elapsed < 2.0
@@ -0,0 +1,86 @@
+"""
+Tests for killable render worker processes.
+"""
+
+import operator
+import os
+import subprocess
+import sys
+import time
+
+import pytest
+
+from src.tools.render_workers import RenderTimeoutError, RenderWorkerError, RenderWorkerPool
+
+
+def _process_running(pid):
+    """Whether a process exists and is not a zombie."""
+    try:
+        with open(f"/proc/{pid}/stat") as stat:
+            return stat.read().rsplit(")", 1)[1].split()[0] not in ("Z", "X")
+    except FileNotFoundError:
+        return False
+
+
+@pytest.fixture
+def pool():
+    """Render pool with two workers that are recycled after three renders."""
+    render_pool = RenderWorkerPool(max_workers=2, max_renders_per_worker=3)
+    yield render_pool
+    render_pool.shutdown()
+
+
+class TestRenderWorkerPool:
+    """Test cases for RenderWorkerPool."""
+
+    def test_run_returns_result(self, pool):
+        """Test that a function runs in a separate worker process."""
+        assert pool.run(operator.add, (2, 3)) == 5
+        assert pool.run(os.getpid) != os.getpid()
+        assert pool.get_stats()["renders"] == 2
+
+    def test_timeout_kills_worker(self, pool):
+        """Test that a hung render is killed and the pool keeps working."""
+        start = time.perf_counter()
+        with pytest.raises(RenderTimeoutError):
+            pool.run(time.sleep, (30,), timeout=0.5)
+
+        assert time.perf_counter() - start < 10
+        assert pool.run(operator.add, (1, 1), timeout=30) == 2
+
+        stats = pool.get_stats()
+        assert stats["timeouts"] == 1
+        assert stats["workers_killed"] == 1
+
+    @pytest.mark.skipif(sys.platform != "linux", reason="needs process groups and /proc")
+    def test_timeout_kills_worker_subprocesses(self, pool, temp_dir):
+        """Test that a subprocess hung in a timed-out render is killed with its worker."""
+        pid_file = temp_dir / "child.pid"
+        command = ["sh", "-c", f"echo $$ > {pid_file}; exec sleep 37"]
+
+        with pytest.raises(RenderTimeoutError):
+            pool.run(subprocess.run, (command,), timeout=1)
+
+        child_pid = int(pid_file.read_text())
+        deadline = time.monotonic() + 5
+        while _process_running(child_pid) and time.monotonic() < deadline:
+            time.sleep(0.05)
+        assert not _process_running(child_pid)
+
+    def test_render_error_keeps_worker(self, pool):
+        """Test that an exception in the function is reported without killing the worker."""
+        worker_pid = pool.run(os.getpid)
+
+        with pytest.raises(RenderWorkerError, match="ValueError"):
+            pool.run(int, ("not a number",))
+
+        assert pool.run(os.getpid) == worker_pid
+        assert pool.get_stats()["workers_killed"] == 0
+
+    def test_workers_recycled_after_render_limit(self, pool):
+        """Test that a worker is replaced after max_renders_per_worker renders."""
+        pids = [pool.run(os.getpid) for _ in range(4)]
+
+        assert len(set(pids[:3])) == 1
+        assert pids[3] != pids[0]
+        assert pool.get_stats()["workers_recycled"] == 1
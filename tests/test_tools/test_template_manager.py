@@ -0,0 +1,122 @@
+"""
+Tests for template loading and the parsed-template cache.
+"""
+
+import os
+import zipfile
+from io import BytesIO
+from pathlib import Path
+
+import pytest
+from unittest.mock import patch
+
+from PIL import Image
+from pptx import Presentation
+from pptx.util import Inches
+
+from src.models.data_models import PresentationSpec
+from src.tools.template_manager import TemplateCache, TemplateManager, remove_template_slides
+
+
+@pytest.fixture
+def template_path(temp_dir):
+    """Template file with one existing slide."""
+    path = temp_dir / "template.pptx"
+    presentation = Presentation()
+    presentation.slides.add_slide(presentation.slide_layouts[0]).shapes.title.text = "Template slide"
+    presentation.save(str(path))
+    return path
+
+
+class TestTemplateCache:
+    """Test cases for TemplateCache."""
+
+    def test_template_parsed_once_and_cloned(self, template_path):
+        """Test that builds share one parse but get independent presentations."""
+        cache = TemplateCache(max_entries=2)
+
+        with patch('src.tools.template_manager.get_template_cache', return_value=cache), \
+             patch.object(Path, 'read_bytes', autospec=True, side_effect=Path.read_bytes) as read:
+            first = TemplateManager(template_path)
+            second = TemplateManager(template_path)
+            first.load_template()
+            second.load_template()
+
+            assert first.validate_template(template_path) == (True, "Template is valid")
+
+        assert read.call_count == 1
+        assert cache.get_stats()["misses"] == 1
+        assert cache.get_stats()["hits"] == 2
+        assert first.get_layout_index("title") == second.get_layout_index("title") == 0
+
+        first.presentation.slides.add_slide(first.slide_layouts[1])
+        assert len(first.presentation.slides) == 1
+        assert len(second.presentation.slides) == 0
+
+    def test_changed_template_is_reparsed(self, template_path):
+        """Test that a touched file is reused by hash and a modified file is reparsed."""
+        cache = TemplateCache(max_entries=2)
+        entry = cache.get(template_path)
+
+        stat = template_path.stat()
+        os.utime(template_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        assert cache.get(template_path) is entry
+
+        presentation = Presentation(str(template_path))
+        presentation.slides.add_slide(presentation.slide_layouts[1])
+        presentation.save(str(template_path))
+
+        changed = cache.get(template_path)
+        assert changed is not entry
+        assert changed.content_hash != entry.content_hash
+        assert changed.pruned_bytes > entry.pruned_bytes
+
+    def test_least_recently_used_template_is_dropped(self, temp_dir, template_path):
+        """Test that the cache keeps at most max_entries parsed templates."""
+        cache = TemplateCache(max_entries=1)
+        other_path = temp_dir / "other.pptx"
+        Presentation().save(str(other_path))
+
+        entry = cache.get(template_path)
+        cache.get(other_path)
+
+        assert cache.get_stats()["templates"] == 1
+        assert cache.get(template_path) is not entry
+
+
+class TestTemplateSlideRemoval:
+    """Test cases for removing the slides a template ships with."""
+
+    @pytest.mark.parametrize("template_cache_enabled", [False, True])
+    def test_template_slide_parts_not_in_output(
+        self, temp_dir, sample_project_description, sample_generated_slides, template_cache_enabled
+    ):
+        """Test that template slides, their notes and media never reach the output package."""
+        template_path = temp_dir / "template_with_media.pptx"
+        image = BytesIO()
+        Image.new("RGB", (320, 240), "red").save(image, "PNG")
+        presentation = Presentation()
+        slide = presentation.slides.add_slide(presentation.slide_layouts[1])
+        slide.shapes.add_picture(image, Inches(1), Inches(1))
+        slide.notes_slide.notes_text_frame.text = "Template notes"
+        presentation.save(str(template_path))
+
+        pruned_bytes = remove_template_slides(Presentation(str(template_path)))
+        assert pruned_bytes > image.getbuffer().nbytes
+
+        spec = PresentationSpec(
+            project=sample_project_description,
+            slides=sample_generated_slides,
+            template_path=template_path,
+            output_path=temp_dir / "deck.pptx"
+        )
+        with patch('src.tools.template_manager.settings.template_cache_enabled', template_cache_enabled), \
+             patch('src.tools.template_manager.get_template_cache', return_value=TemplateCache(max_entries=1)):
+            output_path = TemplateManager(template_path).create_presentation_from_spec(spec)
+
+        names = zipfile.ZipFile(output_path).namelist()
+        slide_parts = [name for name in names if name.startswith("ppt/slides/slide")]
+        assert len(slide_parts) == len(sample_generated_slides)
+        assert not any(name.startswith("ppt/media/") for name in names)
+        notes_parts = [name for name in names if name.startswith("ppt/notesSlides/notesSlide")]
+        assert len(notes_parts) == sum(1 for slide in sample_generated_slides if slide.notes)
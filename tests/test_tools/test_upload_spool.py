@@ -0,0 +1,72 @@
+"""
+Tests for upload spooling.
+"""
+
+import os
+import time
+from io import BytesIO
+from pathlib import Path
+
+from src.tools.upload_spool import (
+    cleanup_spooled_uploads,
+    release_spooled_upload,
+    spool_upload,
+)
+
+
+class TestUploadSpool:
+    """Test cases for upload spooling helpers."""
+
+    def test_small_upload_stays_in_memory(self, temp_dir):
+        """Test that uploads under the threshold are returned as-is."""
+        upload = BytesIO(b"small")
+        upload.read()
+
+        source = spool_upload(upload, "small.pdf", spool_dir=temp_dir, threshold_bytes=10)
+
+        assert source is upload
+        assert upload.tell() == 0
+        assert list(temp_dir.iterdir()) == []
+
+    def test_large_upload_spooled_to_disk(self, temp_dir):
+        """Test that large uploads are copied to a spool file and released."""
+        data = os.urandom(3 * 1024 * 1024)
+        upload = BytesIO(data)
+
+        source = spool_upload(upload, "tender.pdf", spool_dir=temp_dir, threshold_bytes=1024)
+
+        assert isinstance(source, Path)
+        assert source.parent == temp_dir
+        assert source.suffix == ".pdf"
+        assert source.read_bytes() == data
+        assert upload.tell() == 0
+
+        release_spooled_upload(source, spool_dir=temp_dir)
+        assert not source.exists()
+
+    def test_release_ignores_files_outside_spool(self, temp_dir):
+        """Test that user files are never deleted by release."""
+        spool_dir = temp_dir / "spool"
+        spool_dir.mkdir()
+        user_file = temp_dir / "upload_deck.pptx"
+        user_file.write_bytes(b"deck")
+
+        release_spooled_upload(user_file, spool_dir=spool_dir)
+        release_spooled_upload(BytesIO(b"deck"), spool_dir=spool_dir)
+
+        assert user_file.exists()
+
+    def test_cleanup_removes_stale_files(self, temp_dir):
+        """Test that only spooled files older than the cutoff are removed."""
+        stale = temp_dir / "upload_stale.pdf"
+        fresh = temp_dir / "upload_fresh.pdf"
+        stale.write_bytes(b"old")
+        fresh.write_bytes(b"new")
+        old_time = time.time() - 48 * 3600
+        os.utime(stale, (old_time, old_time))
+
+        deleted = cleanup_spooled_uploads(max_age_hours=24, spool_dir=temp_dir)
+
+        assert deleted == 1
+        assert not stale.exists()
+        assert fresh.exists()